@@ -9,9 +9,10 @@ from flask_limiter.util import get_remote_address
 from flask_marshmallow import Marshmallow
 
 from app.config import config
+from app.db_routing import RoutingSession
 
 # Initialize extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
 jwt = JWTManager()
 ma = Marshmallow()
@@ -29,6 +30,10 @@ def create_app(config_name=None):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
 
+    # orjson-backed JSON (stdlib fallback) that encodes datetime, Decimal and UUID
+    from app.utils.json_provider import AppJSONProvider
+    app.json = AppJSONProvider(app)
+
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
@@ -45,12 +50,28 @@ def create_app(config_name=None):
          methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS', 'PATCH']
     )
 
+    # gzip/brotli for JSON and text responses, including streamed exports
+    from app.utils.compression import init_compression
+    init_compression(app)
+
+    # 503 for API requests while maintenance mode is on (admin and auth stay open)
+    from app.utils.maintenance import init_maintenance_mode
+    init_maintenance_mode(app)
+
     # Register error handlers
     register_error_handlers(app)
 
     # Register blueprints
     register_blueprints(app)
 
+    # Keep application and queue stats rollups in step with every flush
+    from app.utils.rollups import register_rollup_listeners
+    register_rollup_listeners()
+
+    # Send replica-scoped reads to DATABASE_REPLICA_URL, pinning users to the primary after writes
+    from app.db_routing import register_replica_routing
+    register_replica_routing(app)
+
     # Health check endpoint
     @app.route('/health', methods=['GET'])
     def health_check():
@@ -72,12 +93,18 @@ def create_app(config_name=None):
         - Redis connection
         - Celery worker
         - Celery beat scheduler
+
+        Workers and beat are judged by the heartbeats they publish to Redis;
+        pass ?deep=1 to ping Redis and inspect the workers live instead (slow).
         """
         import os
         from datetime import datetime
+        from flask import request
 
+        deep = request.args.get('deep', '').lower() in ('1', 'true', 'yes')
         status = {
             'timestamp': datetime.utcnow().isoformat(),
+            'mode': 'deep' if deep else 'heartbeat',
             'services': {},
             'overall_status': 'healthy'
         }
@@ -103,50 +130,56 @@ def create_app(config_name=None):
             }
             status['overall_status'] = 'degraded'
 
-        # Check Redis
-        try:
-            import redis
-            redis_url = os.getenv('REDIS_URL') or os.getenv('CELERY_BROKER_URL')
-            if redis_url and (redis_url.startswith('redis://') or redis_url.startswith('rediss://')):
-                r = redis.from_url(redis_url, socket_connect_timeout=2)
-                r.ping()
+        # Check Redis, workers and beat: from heartbeats by default (one Redis
+        # round trip), or with live probes when ?deep=1
+        redis_url = os.getenv('REDIS_URL') or os.getenv('CELERY_BROKER_URL')
+        workers, beat = None, None
+        if not (redis_url and (redis_url.startswith('redis://') or redis_url.startswith('rediss://'))):
+            status['services']['redis'] = {
+                'status': 'not_configured',
+                'message': f'Redis URL not configured or invalid. Value: {redis_url[:20] if redis_url else "None"}...'
+            }
+            status['overall_status'] = 'degraded'
+        else:
+            try:
+                if deep:
+                    import redis
+                    redis.from_url(redis_url, socket_connect_timeout=2).ping()
+                else:
+                    from app.utils.cache import get_redis
+                    from app.utils.heartbeat import read_heartbeats
+                    client = get_redis()
+                    if client is None:
+                        raise ConnectionError('Redis recently failed, retrying shortly')
+                    heartbeats = read_heartbeats(client)
+                    workers, beat = heartbeats['workers'], heartbeats['beat']
                 status['services']['redis'] = {
                     'status': 'connected',
                     'message': 'Redis connection successful'
                 }
-            else:
+            except Exception as e:
                 status['services']['redis'] = {
-                    'status': 'not_configured',
-                    'message': f'Redis URL not configured or invalid. Value: {redis_url[:20] if redis_url else "None"}...'
+                    'status': 'error',
+                    'message': f'Cannot connect to Redis: {str(e)}'
                 }
                 status['overall_status'] = 'degraded'
-        except redis.ConnectionError as e:
-            status['services']['redis'] = {
-                'status': 'error',
-                'message': f'Cannot connect to Redis: {str(e)}'
-            }
-            status['overall_status'] = 'degraded'
-        except Exception as e:
-            status['services']['redis'] = {
-                'status': 'error',
-                'message': f'Redis check failed: {str(e)}'
-            }
-            status['overall_status'] = 'degraded'
 
         # Check Celery Worker (only if Redis is available)
         if status['services'].get('redis', {}).get('status') == 'connected':
             try:
-                from app.celery_config import celery
-                inspect = celery.control.inspect(timeout=2.0)
-                active_workers = inspect.active()
+                if deep:
+                    from app.celery_config import celery
+                    active_workers = celery.control.inspect(timeout=2.0).active() or {}
+                    workers = [{'hostname': hostname} for hostname in active_workers]
 
-                if active_workers and len(active_workers) > 0:
-                    worker_count = len(active_workers)
+                if workers:
                     status['services']['celery_worker'] = {
                         'status': 'running',
-                        'message': f'{worker_count} worker(s) active',
-                        'workers': list(active_workers.keys())
+                        'message': f'{len(workers)} worker(s) active',
+                        'workers': [worker['hostname'] for worker in workers]
                     }
+                    if not deep:
+                        status['services']['celery_worker']['heartbeats'] = workers
                 else:
                     status['services']['celery_worker'] = {
                         'status': 'not_running',
@@ -169,15 +202,17 @@ def create_app(config_name=None):
         # Check Celery Beat (only if Redis is available)
         if status['services'].get('redis', {}).get('status') == 'connected':
             try:
-                from app.celery_config import celery
-                inspect = celery.control.inspect(timeout=2.0)
-                scheduled = inspect.scheduled()
+                if deep:
+                    from app.celery_config import celery
+                    beat = celery.control.inspect(timeout=2.0).scheduled() or None
 
-                if scheduled and len(scheduled) > 0:
+                if beat:
                     status['services']['celery_beat'] = {
                         'status': 'running',
                         'message': 'Celery beat scheduler is active'
                     }
+                    if not deep:
+                        status['services']['celery_beat']['heartbeat'] = beat
                 else:
                     status['services']['celery_beat'] = {
                         'status': 'not_running',
@@ -225,6 +260,19 @@ def create_app(config_name=None):
     return app
 
 
+def dispose_engines(app):
+    """
+    Drop database connections inherited from a parent process
+
+    Call in a freshly forked child (Celery prefork worker, gunicorn worker with
+    preload) so it opens its own connections instead of sharing the parent's
+    sockets. The parent's connections are left open for the parent.
+    """
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
 def register_blueprints(app):
     """Register application blueprints"""
     from app.routes.auth import auth_bp
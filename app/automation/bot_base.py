@@ -115,12 +115,10 @@ class JobApplicationBot(ABC):
             except:
                 pass
 
-    def apply_to_job(self, job_url):
+    def start_session(self):
         """
-        Main method to apply to a job
-
-        Args:
-            job_url (str): URL of job posting
+        Initialize the browser and login once, so that several jobs
+        can be applied to with the same authenticated session
 
         Returns:
             tuple: (success: bool, message: str)
@@ -133,6 +131,22 @@ class JobApplicationBot(ABC):
             if not self.login():
                 return False, "Failed to login"
 
+            return True, "Session started"
+
+        except Exception as e:
+            return False, f"Error starting session: {str(e)}"
+
+    def apply_in_session(self, job_url):
+        """
+        Apply to a job using an already started session (see start_session)
+
+        Args:
+            job_url (str): URL of job posting
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
             # Navigate to job
             if not self.navigate_to_job(job_url):
                 return False, "Failed to navigate to job"
@@ -154,5 +168,23 @@ class JobApplicationBot(ABC):
         except Exception as e:
             return False, f"Error applying to job: {str(e)}"
 
+    def apply_to_job(self, job_url):
+        """
+        Main method to apply to a single job
+        Opens a new session and closes it when done
+
+        Args:
+            job_url (str): URL of job posting
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            started, message = self.start_session()
+            if not started:
+                return False, message
+
+            return self.apply_in_session(job_url)
+
         finally:
             self.cleanup()
@@ -2,9 +2,47 @@ import os
 from celery import Celery
 from celery.schedules import crontab
 from dotenv import load_dotenv
+from kombu import Exchange, Queue
 
 load_dotenv()
 
+# Task routing: Chrome-heavy bot work, scraper I/O, email and housekeeping each
+# get their own queue so a long Selenium session never delays emails or cleanup
+TASK_QUEUES = {
+    'app.tasks.job_applicator.apply_to_job': 'browser',
+    'app.tasks.job_applicator.apply_batch': 'browser',
+    'app.tasks.immediate_applicator.start_immediate_applications': 'browser',
+    'app.tasks.job_scraper.scrape_jobs_all_users': 'scrape',
+    'app.tasks.job_scraper.scrape_jobs_for_user': 'scrape',
+    'app.tasks.notifications.send_all_daily_summaries': 'notify',
+    'app.tasks.notifications.send_daily_summary': 'notify',
+    'app.tasks.notifications.send_daily_summaries_batch': 'notify',
+    'app.tasks.notifications.send_status_update_email': 'notify',
+    'app.tasks.job_applicator.process_job_queue': 'maintenance',
+    'app.tasks.cleanup.clean_old_jobs': 'maintenance',
+    'app.tasks.cleanup.deactivate_old_listings': 'maintenance',
+    'app.tasks.cleanup.maintain_log_partitions': 'maintenance',
+    'app.tasks.status_checker.check_all_application_statuses': 'maintenance',
+    'app.tasks.status_checker.check_application_status': 'maintenance',
+}
+
+# (soft, hard) time limits in seconds per queue
+#
+# Recommended workers (see CELERY_WORKER_PROFILE in scripts/start-worker.sh):
+#   browser:      prefork, concurrency 1 per ~1GB of RAM (one Chrome each)
+#   scrape:       prefork, concurrency 4 (network bound)
+#   notify:       prefork, concurrency 4 (SMTP bound)
+#   maintenance:  prefork, concurrency 1
+#
+# These limits are only enforced by the prefork (and gevent/eventlet) pools;
+# the threads and solo pools ignore them, so a hung task would hold its slot forever.
+QUEUE_TIME_LIMITS = {
+    'browser': (25 * 60, 30 * 60),
+    'scrape': (10 * 60, 12 * 60),
+    'notify': (20 * 60, 25 * 60),
+    'maintenance': (20 * 60, 25 * 60),
+}
+
 
 def make_celery(app=None):
     """Create Celery instance"""
@@ -32,8 +70,21 @@ def make_celery(app=None):
         task_track_started=True,
         task_time_limit=30 * 60,  # 30 minutes max per task
         task_soft_time_limit=25 * 60,  # 25 minutes soft limit
+        task_queues=[Queue(name, Exchange(name), routing_key=name) for name in QUEUE_TIME_LIMITS],
+        task_default_queue='maintenance',
+        task_routes={name: {'queue': queue} for name, queue in TASK_QUEUES.items()},
+        task_annotations={
+            name: {
+                'soft_time_limit': QUEUE_TIME_LIMITS[queue][0],
+                'time_limit': QUEUE_TIME_LIMITS[queue][1]
+            }
+            for name, queue in TASK_QUEUES.items()
+        },
         worker_prefetch_multiplier=1,
         worker_max_tasks_per_child=1000,
+        # ETA follow-ups (see job_applicator.MAX_ETA_SECONDS) stay unacknowledged
+        # until they run; keep them from being redelivered while they wait
+        broker_transport_options={'visibility_timeout': 2 * 60 * 60},
     )
 
     # Celery Beat Schedule
@@ -56,6 +107,12 @@ def make_celery(app=None):
             'schedule': crontab(hour=10, minute=0),
         },
 
+        # Roll log table partitions daily at 1:30 AM
+        'log-partitions-daily': {
+            'task': 'app.tasks.cleanup.maintain_log_partitions',
+            'schedule': crontab(hour=1, minute=30),
+        },
+
         # Clean old data daily at 2 AM
         'cleanup-daily': {
             'task': 'app.tasks.cleanup.clean_old_jobs',
@@ -69,6 +126,10 @@ def make_celery(app=None):
         },
     }
 
+    # Workers and beat report liveness for /api/system/status
+    from app.utils.heartbeat import register_heartbeat_signals
+    register_heartbeat_signals()
+
     # If Flask app is provided, integrate with Flask
     if app:
         celery.conf.update(app.config)
@@ -80,6 +141,14 @@ def make_celery(app=None):
 
         celery.Task = ContextTask
 
+        # Prefork children are forked after create_app(); give each its own pool
+        from celery.signals import worker_process_init
+        from app import dispose_engines
+
+        @worker_process_init.connect(weak=False)
+        def dispose_inherited_connections(**kwargs):
+            dispose_engines(app)
+
     return celery
 
 
@@ -5,11 +5,75 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def engine_options(database_url):
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS for PostgreSQL from DB_* environment variables
+
+    DB_POOL_MODE=queue (default) keeps a pool per process; DB_POOL_MODE=null
+    opens a connection per checkout for use behind a transaction-pooling
+    PgBouncer, which does the pooling itself.
+
+    Args:
+        database_url (str): SQLALCHEMY_DATABASE_URI
+
+    Returns:
+        dict: Engine options (empty for other databases)
+    """
+    if not database_url or not database_url.startswith(('postgres://', 'postgresql')):
+        return {}
+
+    if os.getenv('DB_POOL_MODE', 'queue').lower() == 'null':
+        from sqlalchemy.pool import NullPool
+        # PgBouncer rejects the startup 'options' parameter, so set
+        # statement_timeout on the database role instead in this mode
+        return {'poolclass': NullPool}
+
+    options = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),  # seconds to wait for a free connection
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),  # replace connections before the server/LB drops them
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true',
+    }
+
+    statement_timeout = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 0))
+    if statement_timeout:
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+
+    return options
+
+
+def replica_engine_options(database_url):
+    """
+    engine_options() for the read replica, plus a short connect timeout
+
+    The replica is optional: when it is down, the lag probe in
+    app.db_routing.replica_available() should give up after
+    DATABASE_REPLICA_CONNECT_TIMEOUT seconds and fall back to the primary
+    instead of hanging the request on the TCP connect.
+    """
+    options = engine_options(database_url)
+    if options:
+        options['connect_args'] = {
+            **options.get('connect_args', {}),
+            'connect_timeout': int(os.getenv('DATABASE_REPLICA_CONNECT_TIMEOUT', 3))
+        }
+    return options
+
+
 class Config:
     """Base configuration"""
     SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'dev-secret-key-change-in-production')
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+
+    # Optional read replica for analytics, log browsing and exports (see app/db_routing.py)
+    DATABASE_REPLICA_URL = os.getenv('DATABASE_REPLICA_URL')
+    SQLALCHEMY_BINDS = {
+        'replica': {'url': DATABASE_REPLICA_URL, **replica_engine_options(DATABASE_REPLICA_URL)}
+    } if DATABASE_REPLICA_URL else {}
+    DATABASE_REPLICA_MAX_LAG_SECONDS = int(os.getenv('DATABASE_REPLICA_MAX_LAG_SECONDS', 10))
 
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -34,6 +98,12 @@ class Config:
     DEFAULT_PAGE_SIZE = 20
     MAX_PAGE_SIZE = 100
 
+    # Response compression (brotli is used when the package is installed)
+    COMPRESS_ENABLED = os.getenv('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))  # bytes
+    COMPRESS_LEVEL = 6  # gzip 1-9
+    COMPRESS_BROTLI_QUALITY = 4  # brotli 0-11, higher costs much more CPU
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -51,6 +121,8 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    SQLALCHEMY_BINDS = {}
 
 
 config = {
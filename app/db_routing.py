@@ -0,0 +1,168 @@
+"""
+Read-replica routing
+
+Reads made inside a replica scope (a route or task decorated with
+@replica_reads, or a `with use_replica():` block) are sent to the
+DATABASE_REPLICA_URL engine; writes, flushes and SELECT ... FOR UPDATE always
+go to the primary. A scope falls back to the primary when no replica is
+configured, the replica is unreachable or lags more than
+DATABASE_REPLICA_MAX_LAG_SECONDS, or the current user has written something
+within that window (so users always read their own writes).
+
+Only use a replica scope around code that does not read rows in order to
+update them.
+"""
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from flask import current_app, g, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import text
+
+
+REPLICA_BIND = 'replica'
+
+# How often a process re-measures replica lag
+REPLICA_CHECK_SECONDS = 5
+
+# 0 when the replica has replayed everything it received (or is not a standby)
+LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+_use_replica = ContextVar('use_replica', default=False)
+
+_health = {'ok': False, 'checked_at': None}
+_health_lock = threading.Lock()
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that sends reads in a replica scope to the replica bind"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and _use_replica.get() and not self._flushing
+                and clause is not None and getattr(clause, 'is_select', False)
+                and getattr(clause, '_for_update_arg', None) is None):
+            engine = self._db.engines.get(REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _replica_engine():
+    from app import db
+    return db.engines.get(REPLICA_BIND)
+
+
+def replica_available():
+    """Whether the replica is configured, reachable and within the lag tolerance"""
+    engine = _replica_engine()
+    if engine is None:
+        return False
+
+    now = time.monotonic()
+    with _health_lock:
+        if _health['checked_at'] is not None and now - _health['checked_at'] < REPLICA_CHECK_SECONDS:
+            return _health['ok']
+        # Other threads keep using the previous answer while this one measures
+        _health['checked_at'] = now
+
+    max_lag = current_app.config.get('DATABASE_REPLICA_MAX_LAG_SECONDS', 10)
+    try:
+        with engine.connect() as connection:
+            lag = float(connection.execute(LAG_QUERY).scalar() or 0)
+        ok = lag <= max_lag
+        if not ok:
+            print(f"[DB] Replica is {lag:.1f}s behind (limit {max_lag}s), reading from primary")
+    except Exception as e:
+        ok = False
+        print(f"[DB] Replica unavailable, reading from primary: {str(e)}")
+
+    with _health_lock:
+        _health['ok'] = ok
+    return ok
+
+
+def _request_user_id():
+    """Authenticated user of the current request, if any"""
+    if not has_request_context():
+        return None
+    try:
+        from flask_jwt_extended import get_jwt_identity
+        return get_jwt_identity()
+    except Exception:
+        return None
+
+
+def _pin_key(user_id):
+    return f'db:primary_pin:{user_id}'
+
+
+def pin_to_primary(user_id):
+    """Serve this user's replica-scoped reads from the primary until the replica has caught up"""
+    from app.utils.cache import cache_set
+    cache_set(_pin_key(user_id), 1, current_app.config.get('DATABASE_REPLICA_MAX_LAG_SECONDS', 10))
+
+
+def is_pinned_to_primary(user_id):
+    """Whether the user wrote something recently enough that the replica may not have it"""
+    from app.utils.cache import cache_get
+    return cache_get(_pin_key(user_id)) is not None
+
+
+def should_use_replica():
+    """Decide whether reads in a new scope can go to the replica"""
+    if not replica_available():
+        return False
+    user_id = _request_user_id()
+    return not (user_id and is_pinned_to_primary(user_id))
+
+
+@contextmanager
+def use_replica():
+    """Send reads in this block to the replica when it is safe to"""
+    token = _use_replica.set(should_use_replica())
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def replica_reads(fn):
+    """
+    Run a read-only route or task with its reads on the replica
+
+    Place below @jwt_required()/@admin_required() so authentication reads the
+    primary and the user's primary pin can be checked.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with use_replica():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def _pin_after_write(session, flush_context):
+    """after_flush: pin the requesting user to the primary (once per request)"""
+    if not has_request_context() or g.get('primary_pinned'):
+        return
+    user_id = _request_user_id()
+    if user_id:
+        pin_to_primary(user_id)
+        g.primary_pinned = True
+
+
+def register_replica_routing(app):
+    """Pin users to the primary after their writes when the app has a replica"""
+    from sqlalchemy import event
+    from app import db
+
+    if REPLICA_BIND not in app.config.get('SQLALCHEMY_BINDS', {}):
+        return
+
+    session = db.session
+    if not event.contains(session, 'after_flush', _pin_after_write):
+        event.listen(session, 'after_flush', _pin_after_write)
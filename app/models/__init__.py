@@ -12,6 +12,7 @@ from app.models.platform_credential import PlatformCredential
 from app.models.video import Video
 from app.models.settings import Settings
 from app.models.activity_log import ActivityLog
+from app.models.stats import ApplicationDailyStat, QueueStatusCount
 
 __all__ = [
     'User',
@@ -28,5 +29,7 @@ __all__ = [
     'PlatformCredential',
     'Video',
     'Settings',
-    'ActivityLog'
+    'ActivityLog',
+    'ApplicationDailyStat',
+    'QueueStatusCount'
 ]
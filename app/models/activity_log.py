@@ -18,6 +18,8 @@ class ActivityLog(db.Model):
     user_agent = db.Column(db.String(500))
     changes = db.Column(JSONB, default=dict, server_default='{}')  # Track what changed (before/after)
     status = db.Column(db.String(20), default='success')  # 'success', 'failed', 'warning'
+    # On PostgreSQL the table is range partitioned by month on created_at and its
+    # primary key is (id, created_at); see app.tasks.cleanup.maintain_log_partitions
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
     # Relationship
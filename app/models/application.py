@@ -23,6 +23,13 @@ class Application(db.Model):
     cover_letter = db.Column(db.Text)
     notes = db.Column(db.Text)
 
+    # Composite indexes for the rate limiter, list views and duplicate checks
+    __table_args__ = (
+        db.Index('ix_applications_user_platform_applied', 'user_id', 'platform', 'applied_at'),
+        db.Index('ix_applications_user_applied', 'user_id', 'applied_at'),
+        db.Index('ix_applications_user_job_url', 'user_id', 'job_url'),
+    )
+
     def to_dict(self):
         """Convert application to dictionary"""
         return {
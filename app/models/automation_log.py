@@ -10,13 +10,19 @@ class AutomationLog(db.Model):
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
-    job_queue_id = db.Column(db.String(36), db.ForeignKey('job_queue.id'))
+    job_queue_id = db.Column(db.String(36), db.ForeignKey('job_queue.id'), index=True)
     action_type = db.Column(db.String(50), nullable=False, index=True)  # job_search, job_apply, status_update
     status = db.Column(db.String(20), nullable=False)  # success, failed, warning
     message = db.Column(db.Text, nullable=False)
     details = db.Column(JSONB, default=dict, server_default='{}')  # Additional details (renamed from metadata)
+    # On PostgreSQL the table is range partitioned by month on created_at and its
+    # primary key is (id, created_at); see app.tasks.cleanup.maintain_log_partitions
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
+    __table_args__ = (
+        db.Index('ix_automation_logs_user_created', 'user_id', 'created_at'),
+    )
+
     def to_dict(self):
         """Convert automation log to dictionary"""
         return {
@@ -19,7 +19,7 @@ class JobListing(db.Model):
     requirements = db.Column(db.Text)
     job_url = db.Column(db.Text, nullable=False)
     posted_date = db.Column(db.DateTime)
-    scraped_at = db.Column(db.DateTime, default=datetime.utcnow)
+    scraped_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     is_active = db.Column(db.Boolean, default=True, index=True)
 
     # Create composite unique constraint
@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from sqlalchemy.orm import selectinload
 from app import db
 
 
@@ -11,7 +12,7 @@ class JobQueue(db.Model):
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
     job_search_config_id = db.Column(db.String(36), db.ForeignKey('job_search_configs.id'))
     platform = db.Column(db.String(50), nullable=False)
-    job_listing_id = db.Column(db.String(36), db.ForeignKey('job_listings.id'))
+    job_listing_id = db.Column(db.String(36), db.ForeignKey('job_listings.id', ondelete='SET NULL'), index=True)
     company_name = db.Column(db.String(255), nullable=False)
     job_title = db.Column(db.String(255), nullable=False)
     job_url = db.Column(db.Text, nullable=False)
@@ -26,8 +27,25 @@ class JobQueue(db.Model):
     max_retries = db.Column(db.Integer, default=3)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
+    # Pending items are picked by priority, only those rows are indexed
+    __table_args__ = (
+        db.Index(
+            'ix_job_queue_pending_priority', db.text('priority DESC'), 'created_at', 'scheduled_for',
+            postgresql_where=db.text("status = 'pending'")
+        ),
+        db.Index('ix_job_queue_user_status', 'user_id', 'status'),
+    )
+
     # Relationships
-    job_listing = db.relationship('JobListing', backref='queue_items', lazy='joined')
+    # Company, title and url are copied onto the queue item, so the listing (with its
+    # description/requirements text) is only loaded when asked for with with_listing();
+    # reading it from a query that did not load it raises instead of running a query
+    job_listing = db.relationship('JobListing', backref='queue_items', lazy='raise')
+
+    @classmethod
+    def with_listing(cls):
+        """Query that loads each item's job listing in one extra SELECT ... IN"""
+        return cls.query.options(selectinload(cls.job_listing))
 
     def to_dict(self):
         """Convert job queue item to dictionary"""
@@ -1,11 +1,90 @@
 import uuid
 import os
 import json
+import time
+import threading
 from datetime import datetime
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, MultiFernet, InvalidToken
 from app import db
 
 
+# Decrypted credentials of active bot sessions are kept in memory this long
+SESSION_CACHE_TTL_SECONDS = 300
+
+_cipher = None
+_cipher_config = None
+_generated_key = None
+_cipher_lock = threading.Lock()
+
+_session_cache = {}
+_session_lock = threading.Lock()
+
+
+def get_cipher():
+    """
+    Return the process-wide cipher, building it once per key configuration
+
+    CREDENTIALS_ENCRYPTION_KEY encrypts new values. Previous keys listed
+    (comma-separated) in CREDENTIALS_ENCRYPTION_OLD_KEYS can still decrypt, so
+    keys can be rotated without making stored credentials unreadable.
+    """
+    global _cipher, _cipher_config, _generated_key
+
+    config = (os.getenv('CREDENTIALS_ENCRYPTION_KEY'), os.getenv('CREDENTIALS_ENCRYPTION_OLD_KEYS'))
+    if _cipher is not None and config == _cipher_config:
+        return _cipher
+
+    with _cipher_lock:
+        if _cipher is not None and config == _cipher_config:
+            return _cipher
+
+        primary, old_keys = config
+        if not primary:
+            # Generate a key if not set (for development only), reused for the life of the process
+            if _generated_key is None:
+                _generated_key = Fernet.generate_key().decode()
+                print(f"WARNING: Using generated encryption key. Set CREDENTIALS_ENCRYPTION_KEY in production!")
+            primary = _generated_key
+
+        keys = [primary] + [key.strip() for key in (old_keys or '').split(',') if key.strip()]
+        _cipher = MultiFernet([Fernet(key.encode()) for key in keys])
+        _cipher_config = config
+        return _cipher
+
+
+def decrypt_values(tokens):
+    """
+    Decrypt many stored values with one cipher lookup
+
+    Args:
+        tokens (list): Encrypted strings, None entries are passed through
+
+    Returns:
+        list: Decrypted strings, None where a value is missing or cannot be decrypted
+    """
+    cipher = get_cipher()
+    values = []
+    for token in tokens:
+        if not token:
+            values.append(None)
+            continue
+        try:
+            values.append(cipher.decrypt(token.encode()).decode())
+        except InvalidToken:
+            print(f"WARNING: Could not decrypt a stored credential, was the encryption key changed?")
+            values.append(None)
+    return values
+
+
+def forget_session_material(credential_id=None):
+    """Drop cached decrypted credentials for one credential, or all of them"""
+    with _session_lock:
+        if credential_id is None:
+            _session_cache.clear()
+        else:
+            _session_cache.pop(credential_id, None)
+
+
 class PlatformCredential(db.Model):
     """Platform credentials model for storing encrypted login credentials"""
     __tablename__ = 'platform_credentials'
@@ -28,23 +107,26 @@ class PlatformCredential(db.Model):
 
     @staticmethod
     def get_cipher():
-        """Get Fernet cipher for encryption/decryption"""
-        key = os.getenv('CREDENTIALS_ENCRYPTION_KEY')
-        if not key:
-            # Generate a key if not set (for development only)
-            key = Fernet.generate_key().decode()
-            print(f"WARNING: Using generated encryption key. Set CREDENTIALS_ENCRYPTION_KEY in production!")
+        """Get the shared cipher for encryption/decryption"""
+        return get_cipher()
 
-        # Ensure key is bytes
-        if isinstance(key, str):
-            key = key.encode()
+    @classmethod
+    def decrypt_usernames(cls, credentials):
+        """
+        Decrypt the usernames of many credentials at once (export paths)
 
-        return Fernet(key)
+        Returns:
+            dict: Credential id -> username (None if missing or unreadable)
+        """
+        credentials = list(credentials)
+        usernames = decrypt_values([cred.username_encrypted for cred in credentials])
+        return {cred.id: username for cred, username in zip(credentials, usernames)}
 
     def set_username(self, username):
         """Encrypt and store username"""
         cipher = self.get_cipher()
         self.username_encrypted = cipher.encrypt(username.encode()).decode()
+        forget_session_material(self.id)
 
     def get_username(self):
         """Decrypt and return username"""
@@ -57,6 +139,7 @@ class PlatformCredential(db.Model):
         """Encrypt and store password"""
         cipher = self.get_cipher()
         self.encrypted_password = cipher.encrypt(password.encode()).decode()
+        forget_session_material(self.id)
 
     def get_password(self):
         """Decrypt and return password"""
@@ -72,6 +155,7 @@ class PlatformCredential(db.Model):
         cipher = self.get_cipher()
         cookies_json = json.dumps(cookies_dict)
         self.cookies_encrypted = cipher.encrypt(cookies_json.encode()).decode()
+        forget_session_material(self.id)
 
     def get_cookies(self):
         """
@@ -85,6 +169,53 @@ class PlatformCredential(db.Model):
         cookies_json = cipher.decrypt(self.cookies_encrypted.encode()).decode()
         return json.loads(cookies_json)
 
+    def get_session_material(self):
+        """
+        Return the decrypted username, password and cookies for a bot session
+
+        Results are cached in memory for SESSION_CACHE_TTL_SECONDS so repeated
+        batches for the same user do not decrypt again. The cache entry is
+        ignored once the row's updated_at changes, and dropped when a value is
+        set through this model.
+
+        Returns:
+            dict: username, password and cookies (None if not stored)
+        """
+        now = time.monotonic()
+        with _session_lock:
+            entry = _session_cache.get(self.id)
+        if entry and entry[0] > now and entry[1] == self.updated_at:
+            return dict(entry[2])
+
+        material = {
+            'username': self.get_username(),
+            'password': self.get_password(),
+            'cookies': self.get_cookies()
+        }
+        with _session_lock:
+            # Expired entries of other credentials go whenever one is added
+            for credential_id in [key for key, value in _session_cache.items() if value[0] <= now]:
+                del _session_cache[credential_id]
+            _session_cache[self.id] = (now + SESSION_CACHE_TTL_SECONDS, self.updated_at, material)
+        return dict(material)
+
+    def rotate_encryption(self):
+        """
+        Re-encrypt stored values with the current primary key (caller commits)
+
+        Raises InvalidToken, leaving the row unchanged, when a value was
+        encrypted with a key that is no longer configured.
+        See scripts/rotate_credentials_key.py.
+        """
+        cipher = self.get_cipher()
+        rotated = {
+            column: cipher.rotate(getattr(self, column).encode()).decode()
+            for column in ('username_encrypted', 'encrypted_password', 'cookies_encrypted')
+            if getattr(self, column)
+        }
+        for column, value in rotated.items():
+            setattr(self, column, value)
+
     def has_cookies(self):
         """Check if cookies are stored"""
         return bool(self.cookies_encrypted)
@@ -119,5 +250,5 @@ class PlatformCredential(db.Model):
         return data
 
     def __repr__(self):
-        username = self.get_username() if self.username_encrypted else 'N/A'
-        return f'<PlatformCredential {self.platform} - {username}>'
+        # Don't decrypt (or leak) the username just to print the object
+        return f'<PlatformCredential {self.platform} - user {self.user_id}>'
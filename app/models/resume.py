@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from sqlalchemy.orm import deferred, undefer_group
 from app import db
 
 
@@ -10,7 +11,7 @@ class Resume(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
     filename = db.Column(db.String(255), nullable=False)
-    file_base64 = db.Column(db.Text, nullable=False)
+    file_base64 = deferred(db.Column(db.Text, nullable=False), group='file')  # Loaded only on access or with_file()
     file_type = db.Column(db.String(10), nullable=False)  # 'pdf', 'doc', 'docx'
     file_size = db.Column(db.Integer, nullable=False)  # in bytes
     is_default = db.Column(db.Boolean, default=False, index=True)
@@ -21,6 +22,11 @@ class Resume(db.Model):
     # Relationships
     applications = db.relationship('Application', backref='resume', lazy='dynamic')
 
+    @classmethod
+    def with_file(cls):
+        """Query that loads file_base64 together with the row"""
+        return cls.query.options(undefer_group('file'))
+
     def to_dict(self, include_file=False):
         """Convert resume to dictionary"""
         data = {
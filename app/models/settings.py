@@ -1,6 +1,25 @@
+import time
+import threading
 from datetime import datetime
+from types import SimpleNamespace
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, undefer_group
 from app import db
+from app.utils.cache import cache_get, cache_set
+
+
+# Shared token bumped by every settings write; processes compare it to decide when to reload
+SETTINGS_VERSION_KEY = 'settings:version'
+SETTINGS_VERSION_TTL = 7 * 24 * 3600
+
+# How often a process looks at the shared version (one Redis GET, no DB query)
+SETTINGS_CHECK_SECONDS = 5
+
+# Reload interval when Redis is unavailable or the version key is missing
+SETTINGS_MAX_AGE_SECONDS = 60
+
+_current = {'snapshot': None, 'version': None, 'loaded_at': 0, 'checked_at': 0}
+_current_lock = threading.Lock()
 
 
 class Settings(db.Model):
@@ -14,7 +33,7 @@ class Settings(db.Model):
     site_description = db.Column(db.Text)
     contact_email = db.Column(db.String(255))
     support_phone = db.Column(db.String(20))
-    logo_base64 = db.Column(db.Text)
+    logo_base64 = deferred(db.Column(db.Text), group='logo')  # Loaded only on access or get_settings(include_logo=True)
 
     # Notification Settings
     email_notifications_enabled = db.Column(db.Boolean, default=True)
@@ -50,7 +69,7 @@ class Settings(db.Model):
     updated_by = db.Column(db.String(36), db.ForeignKey('users.id'))
 
     def to_dict(self):
-        """Convert settings to dictionary"""
+        """Convert settings to dictionary (includes the logo)"""
         return {
             'id': self.id,
             'general': {
@@ -95,14 +114,107 @@ class Settings(db.Model):
         }
 
     @staticmethod
-    def get_settings():
+    def get_settings(include_logo=False):
         """Get or create singleton settings instance"""
-        settings = Settings.query.filter_by(id=1).first()
+        query = Settings.query.options(undefer_group('logo')) if include_logo else Settings.query
+        settings = query.filter_by(id=1).first()
         if not settings:
             settings = Settings(id=1)
             db.session.add(settings)
             db.session.commit()
         return settings
 
+    @staticmethod
+    def current():
+        """Cached read-only snapshot of the settings for hot paths (see get_current_settings)"""
+        return get_current_settings()
+
     def __repr__(self):
         return f'<Settings {self.site_name}>'
+
+
+def _load_snapshot():
+    """Read the settings row (without the logo) into a plain, session-independent object"""
+    columns = [column for column in Settings.__table__.columns if column.key != 'logo_base64']
+    row = db.session.query(*columns).filter(Settings.__table__.c.id == 1).first()
+
+    if row is None:
+        # Column defaults, without inserting the row from a read path
+        values = {
+            column.key: column.default.arg if column.default is not None and column.default.is_scalar else None
+            for column in columns
+        }
+    else:
+        values = row._asdict()
+
+    values['allowed_file_types'] = values.get('allowed_file_types') or []
+    return SimpleNamespace(**values)
+
+
+def get_current_settings():
+    """
+    Return the system settings from a per-process cache
+
+    The snapshot is reloaded from the database only when the shared version in
+    Redis changes (checked every SETTINGS_CHECK_SECONDS), so web and worker
+    processes see an update within seconds without a query per request.
+    Without Redis the snapshot is reloaded every SETTINGS_MAX_AGE_SECONDS.
+
+    Returns:
+        SimpleNamespace: Settings columns as attributes (logo excluded)
+    """
+    now = time.monotonic()
+    with _current_lock:
+        snapshot = _current['snapshot']
+        if snapshot is not None and now - _current['checked_at'] < SETTINGS_CHECK_SECONDS:
+            return snapshot
+        version, loaded_at = _current['version'], _current['loaded_at']
+
+    # Read the version before the row so a write landing in between triggers another reload
+    shared_version = cache_get(SETTINGS_VERSION_KEY)
+    if snapshot is not None:
+        if shared_version is not None:
+            stale = shared_version != version
+        else:
+            stale = now - loaded_at >= SETTINGS_MAX_AGE_SECONDS
+
+        if not stale:
+            with _current_lock:
+                _current['checked_at'] = now
+            return snapshot
+
+    snapshot = _load_snapshot()
+    with _current_lock:
+        _current.update(snapshot=snapshot, version=shared_version, loaded_at=now, checked_at=now)
+    return snapshot
+
+
+def is_platform_enabled(platform):
+    """Whether the {platform}_integration_enabled feature flag allows automation on a platform"""
+    flag = getattr(get_current_settings(), f'{platform.lower()}_integration_enabled', None)
+    return flag is not False
+
+
+def disabled_platforms():
+    """Platforms (lower case) whose integration feature flag is switched off"""
+    settings = get_current_settings()
+    suffix = '_integration_enabled'
+    return [
+        column.key[:-len(suffix)] for column in Settings.__table__.columns
+        if column.key.endswith(suffix) and getattr(settings, column.key) is False
+    ]
+
+
+def publish_settings_change(settings):
+    """
+    Tell every process that the settings changed (call after committing a write)
+
+    Args:
+        settings (Settings): The updated row
+    """
+    version = settings.updated_at.isoformat() if settings.updated_at else str(time.time())
+    cache_set(SETTINGS_VERSION_KEY, version, SETTINGS_VERSION_TTL)
+
+    # This process reloads on its next read even without Redis
+    with _current_lock:
+        _current['snapshot'] = None
@@ -0,0 +1,31 @@
+from datetime import datetime
+from app import db
+
+
+class ApplicationDailyStat(db.Model):
+    """Daily application counts per user, platform and status, kept current by app.utils.rollups"""
+    __tablename__ = 'application_daily_stats'
+
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    platform = db.Column(db.String(50), primary_key=True)
+    status = db.Column(db.String(20), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ApplicationDailyStat {self.user_id} {self.day} {self.platform}/{self.status}: {self.count}>'
+
+
+class QueueStatusCount(db.Model):
+    """Current job queue counts per user, platform and status, kept current by app.utils.rollups"""
+    __tablename__ = 'queue_status_counts'
+
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    platform = db.Column(db.String(50), primary_key=True)
+    status = db.Column(db.String(20), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<QueueStatusCount {self.user_id} {self.platform}/{self.status}: {self.count}>'
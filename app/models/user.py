@@ -3,6 +3,7 @@ import secrets
 from datetime import datetime, timedelta
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, undefer_group
 from app import db
 
 
@@ -25,7 +26,7 @@ class User(db.Model):
     salary_expectations = db.Column(db.Integer)
     professional_bio = db.Column(db.Text)
     skills = db.Column(JSONB, default=list, nullable=False, server_default='[]')
-    avatar_base64 = db.Column(db.Text)
+    avatar_base64 = deferred(db.Column(db.Text), group='avatar')  # Loaded only on access or with_avatar()
     oauth_provider = db.Column(db.String(20))  # 'google' or 'github'
     oauth_id = db.Column(db.String(255))
 
@@ -51,6 +52,23 @@ class User(db.Model):
     subscriptions = db.relationship('Subscription', backref='user', lazy='dynamic', cascade='all, delete-orphan')
     payments = db.relationship('Payment', backref='user', lazy='dynamic', cascade='all, delete-orphan')
 
+    @classmethod
+    def with_avatar(cls):
+        """Query that loads avatar_base64 together with the row"""
+        return cls.query.options(undefer_group('avatar'))
+
+    @classmethod
+    def mark_changed(cls, user_id):
+        """
+        Bump updated_at for changes the user's own columns do not record
+
+        The n8n incremental export (?since=) finds changed users by
+        User.updated_at, Resume.uploaded_at and PlatformCredential.updated_at,
+        so deleting a resume or credential or switching the default resume
+        must touch the user as well.
+        """
+        cls.query.filter_by(id=user_id).update({'updated_at': datetime.utcnow()}, synchronize_session=False)
+
     def set_password(self, password):
         """Hash and set password"""
         self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
@@ -108,8 +126,8 @@ class User(db.Model):
         self.password_reset_token = None
         self.password_reset_sent_at = None
 
-    def to_dict(self, include_sensitive=False):
-        """Convert user to dictionary"""
+    def to_dict(self, include_sensitive=False, include_avatar=True):
+        """Convert user to dictionary (include_avatar=False skips loading the avatar)"""
         data = {
             'id': self.id,
             'email': self.email,
@@ -127,11 +145,12 @@ class User(db.Model):
             'salary_expectations': self.salary_expectations,
             'professional_bio': self.professional_bio,
             'skills': self.skills or [],
-            'avatar_base64': self.avatar_base64,
             'oauth_provider': self.oauth_provider,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+        if include_avatar:
+            data['avatar_base64'] = self.avatar_base64
         return data
 
     def __repr__(self):
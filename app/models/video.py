@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from sqlalchemy.orm import deferred, undefer_group
 from app import db
 
 
@@ -10,7 +11,7 @@ class Video(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
-    video_base64 = db.Column(db.Text, nullable=False)  # Base64 encoded video file
+    video_base64 = deferred(db.Column(db.Text, nullable=False), group='video')  # Base64 encoded video file, loaded only on access or with_video()
     thumbnail_base64 = db.Column(db.Text)  # Base64 encoded thumbnail image
     file_size = db.Column(db.Integer)  # File size in bytes
     duration = db.Column(db.Integer)  # Duration in seconds
@@ -24,6 +25,11 @@ class Video(db.Model):
     # Relationship
     uploader = db.relationship('User', foreign_keys=[uploaded_by], backref='uploaded_videos')
 
+    @classmethod
+    def with_video(cls):
+        """Query that loads video_base64 together with the row"""
+        return cls.query.options(undefer_group('video'))
+
     def to_dict(self, include_video=False):
         """Convert video to dictionary"""
         data = {
@@ -1,17 +1,23 @@
-from flask import Blueprint, request
+from flask import Blueprint, request, g
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import desc, asc, or_, func
+from sqlalchemy import desc, asc, or_, func, case
 from datetime import datetime, timedelta
 from app import db, limiter
 from app.models import (
     User, Application, Payment, Subscription, Video, Settings,
     ActivityLog, AutomationLog
 )
-from app.utils.auth_utils import generate_tokens, create_response, error_response, admin_required
+from app.utils.auth_utils import (
+    generate_tokens, create_response, error_response, admin_required, invalidate_identity
+)
 from app.utils.admin_utils import (
     paginate_query, validate_base64_file, log_admin_activity, get_sort_params
 )
 from app.utils.email_service import EmailService
+from app.utils.cache import cached
+from app.utils.http_cache import http_cached, invalidate_http_cache
+from app.models.settings import publish_settings_change
+from app.db_routing import replica_reads
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
 
@@ -67,7 +73,7 @@ def admin_login():
 def verify_admin_token():
     """Verify admin token and return user info"""
     user_id = get_jwt_identity()
-    user = User.query.get(user_id)
+    user = User.with_avatar().get(user_id)
 
     if not user:
         return error_response('USER_NOT_FOUND', 'User not found', status_code=404)
@@ -80,54 +86,97 @@ def verify_admin_token():
 def admin_logout():
     """Admin logout endpoint (client should discard tokens)"""
     user_id = get_jwt_identity()
-    user = User.query.get(user_id)
+    identity = g.identity
 
     # Log admin logout
-    if user:
-        log_admin_activity(
-            admin_id=user_id,
-            action='admin_logout',
-            entity_type='user',
-            entity_id=user_id,
-            description=f'Admin {user.email} logged out'
-        )
+    log_admin_activity(
+        admin_id=user_id,
+        action='admin_logout',
+        entity_type='user',
+        entity_id=user_id,
+        description=f'Admin {identity["email"]} logged out'
+    )
 
     return create_response(message='Logout successful')
 
 
 # ==================== DASHBOARD ENDPOINT ====================
 
+# Dashboard aggregates are cached this long, ?refresh=1 bypasses the cache
+DASHBOARD_CACHE_SECONDS = 60
+
+
 @admin_bp.route('/dashboard', methods=['GET'])
 @admin_required()
+@replica_reads
 def get_dashboard():
     """Get admin dashboard statistics and analytics"""
     # Get date range from query params
     days = request.args.get('days', 30, type=int)
-    start_date = datetime.utcnow() - timedelta(days=days)
+    chart_days = min(max(request.args.get('chart_days', 7, type=int), 1), 366)
+    refresh = request.args.get('refresh', '').lower() in ('1', 'true')
+
+    data = cached(
+        f'admin:dashboard:{days}:{chart_days}',
+        DASHBOARD_CACHE_SECONDS,
+        lambda: build_dashboard(days, chart_days),
+        refresh=refresh
+    )
+
+    return create_response(data=data)
+
 
-    # Total Users
-    total_users = User.query.count()
-    new_users = User.query.filter(User.created_at >= start_date).count()
+def day_bucket(column):
+    """Truncate a timestamp column to its day, portable across databases"""
+    if db.engine.dialect.name == 'postgresql':
+        return func.date_trunc('day', column)
+    return func.date(column)
 
-    # Total Applications
-    total_applications = Application.query.count()
-    new_applications = Application.query.filter(Application.applied_at >= start_date).count()
 
-    # Applications by status
-    applications_by_status = db.session.query(
-        Application.status, func.count(Application.id)
+def daily_counts(column, start, chart_days):
+    """Count rows per day since start with one GROUP BY, filling empty days with 0"""
+    bucket = day_bucket(column)
+    rows = db.session.query(bucket, func.count()).filter(column >= start).group_by(bucket).all()
+
+    counts = {}
+    for day, count in rows:
+        # date_trunc returns a datetime, SQLite's date() a string
+        key = day.strftime('%Y-%m-%d') if hasattr(day, 'strftime') else str(day)[:10]
+        counts[key] = count
+
+    return [
+        {'date': date, 'count': counts.get(date, 0)}
+        for date in ((start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(chart_days))
+    ]
+
+
+def build_dashboard(days, chart_days):
+    """Compute dashboard statistics with one grouped query per table"""
+    start_date = datetime.utcnow() - timedelta(days=days)
+
+    # Users: total and new in one pass
+    total_users, new_users = db.session.query(
+        func.count(User.id),
+        func.count(case((User.created_at >= start_date, User.id)))
+    ).one()
+
+    # Applications by status, with new applications per status
+    application_rows = db.session.query(
+        Application.status,
+        func.count(Application.id),
+        func.count(case((Application.applied_at >= start_date, Application.id)))
     ).group_by(Application.status).all()
 
-    # Total Payments and Revenue
-    total_payments = Payment.query.filter_by(status='completed').count()
-    total_revenue = db.session.query(func.sum(Payment.amount)).filter_by(status='completed').scalar() or 0
+    applications_by_status = {status: count for status, count, _ in application_rows}
+    total_applications = sum(count for _, count, _ in application_rows)
+    new_applications = sum(new for _, _, new in application_rows)
 
-    # Recent Payments
-    recent_payments = Payment.query.filter(Payment.paid_at >= start_date).filter_by(status='completed')
-    new_revenue = db.session.query(func.sum(Payment.amount)).filter(
-        Payment.paid_at >= start_date,
-        Payment.status == 'completed'
-    ).scalar() or 0
+    # Completed payments: count, revenue and revenue in range
+    total_payments, total_revenue, new_revenue = db.session.query(
+        func.count(Payment.id),
+        func.coalesce(func.sum(Payment.amount), 0),
+        func.coalesce(func.sum(case((Payment.paid_at >= start_date, Payment.amount))), 0)
+    ).filter(Payment.status == 'completed').one()
 
     # Active Subscriptions
     active_subscriptions = Subscription.query.filter_by(status='active').count()
@@ -135,48 +184,27 @@ def get_dashboard():
     # Recent Activity (last 10 activities)
     recent_activities = ActivityLog.query.order_by(desc(ActivityLog.created_at)).limit(10).all()
 
-    # User Growth (last 7 days)
-    user_growth = []
-    for i in range(6, -1, -1):
-        day = datetime.utcnow() - timedelta(days=i)
-        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
-        count = User.query.filter(User.created_at >= day_start, User.created_at < day_end).count()
-        user_growth.append({
-            'date': day_start.strftime('%Y-%m-%d'),
-            'count': count
-        })
-
-    # Application Growth (last 7 days)
-    application_growth = []
-    for i in range(6, -1, -1):
-        day = datetime.utcnow() - timedelta(days=i)
-        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
-        count = Application.query.filter(Application.applied_at >= day_start, Application.applied_at < day_end).count()
-        application_growth.append({
-            'date': day_start.strftime('%Y-%m-%d'),
-            'count': count
-        })
+    # Growth charts, one GROUP BY per table for the whole range
+    chart_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=chart_days - 1)
 
-    return create_response(data={
+    return {
         'statistics': {
             'total_users': total_users,
             'new_users': new_users,
             'total_applications': total_applications,
             'new_applications': new_applications,
-            'applications_by_status': {status: count for status, count in applications_by_status},
+            'applications_by_status': applications_by_status,
             'total_payments': total_payments,
             'total_revenue': float(total_revenue),
             'new_revenue': float(new_revenue),
             'active_subscriptions': active_subscriptions
         },
         'charts': {
-            'user_growth': user_growth,
-            'application_growth': application_growth
+            'user_growth': daily_counts(User.created_at, chart_start, chart_days),
+            'application_growth': daily_counts(Application.applied_at, chart_start, chart_days)
         },
         'recent_activities': [activity.to_dict() for activity in recent_activities]
-    })
+    }
 
 
 # ==================== USER MANAGEMENT ENDPOINTS ====================
@@ -220,8 +248,8 @@ def list_users():
     else:
         query = query.order_by(desc(sort_column))
 
-    # Paginate
-    pagination_data = paginate_query(query)
+    # Paginate (avatars are only sent with the user details)
+    pagination_data = paginate_query(query, serialize=lambda user: user.to_dict(include_avatar=False))
 
     return create_response(data={'users': pagination_data})
 
@@ -230,7 +258,7 @@ def list_users():
 @admin_required()
 def get_user_details(user_id):
     """Get detailed information about a specific user"""
-    user = User.query.get(user_id)
+    user = User.with_avatar().get(user_id)
 
     if not user:
         return error_response('USER_NOT_FOUND', 'User not found', status_code=404)
@@ -294,6 +322,9 @@ def update_user(user_id):
 
     db.session.commit()
 
+    # The old role must not keep authorizing requests from the cache
+    invalidate_identity(user_id)
+
     # Log activity
     log_admin_activity(
         admin_id=admin_id,
@@ -371,16 +402,18 @@ def list_videos():
 @admin_required()
 def get_video(video_id):
     """Get a specific video with full data"""
-    video = Video.query.get(video_id)
+    video = Video.with_video().get(video_id)
 
     if not video:
         return error_response('VIDEO_NOT_FOUND', 'Video not found', status_code=404)
 
-    # Increment view count
+    # Increment view count (serialize before commit expires the row and its video data)
     video.view_count += 1
+    db.session.flush()
+    data = video.to_dict(include_video=True)
     db.session.commit()
 
-    return create_response(data={'video': video.to_dict(include_video=True)})
+    return create_response(data={'video': data})
 
 
 @admin_bp.route('/videos', methods=['POST'])
@@ -536,11 +569,17 @@ def get_payment_details(payment_id):
 
 # ==================== SETTINGS MANAGEMENT ENDPOINTS ====================
 
+def settings_version():
+    """Cache version of the settings row"""
+    return db.session.query(Settings.updated_at).filter_by(id=1).scalar()
+
+
 @admin_bp.route('/settings', methods=['GET'])
 @admin_required()
+@http_cached('admin_settings', version=settings_version)
 def get_settings():
     """Get system settings"""
-    settings = Settings.get_settings()
+    settings = Settings.get_settings(include_logo=True)
     return create_response(data={'settings': settings.to_dict()})
 
 
@@ -549,7 +588,7 @@ def get_settings():
 def update_settings():
     """Update system settings"""
     admin_id = get_jwt_identity()
-    settings = Settings.get_settings()
+    settings = Settings.get_settings(include_logo=True)
     data = request.get_json()
     changes = {}
 
@@ -621,6 +660,8 @@ def update_settings():
 
     settings.updated_by = admin_id
     db.session.commit()
+    invalidate_http_cache('admin_settings')
+    publish_settings_change(settings)
 
     # Log activity
     log_admin_activity(
@@ -637,6 +678,7 @@ def update_settings():
 
 @admin_bp.route('/settings/logs', methods=['GET'])
 @admin_required()
+@replica_reads
 def get_system_logs():
     """Get system logs (automation logs and activity logs)"""
     log_type = request.args.get('type', 'automation')  # 'automation' or 'activity'
@@ -1,11 +1,15 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime
-from sqlalchemy import or_, desc, asc, func
+from sqlalchemy import or_, desc, func
 from app import db
 from app.models.application import Application
+from app.models.stats import ApplicationDailyStat
 from app.utils.auth_utils import create_response, error_response
+from app.utils.pagination import paginate, InvalidCursorError
+from app.utils.serializers import application_serializer, InvalidFieldsError
 from app.config import Config
+from app.db_routing import replica_reads
 
 applications_bp = Blueprint('applications', __name__)
 
@@ -64,8 +68,8 @@ def get_applications():
         platform_filter = request.args.get('platform')
         search = request.args.get('search')
         sort = request.args.get('sort', 'most_recent')
-        page = int(request.args.get('page', 1))
         limit = min(int(request.args.get('limit', Config.DEFAULT_PAGE_SIZE)), Config.MAX_PAGE_SIZE)
+        fields = application_serializer.fields_from_request()
 
         # Build query
         query = Application.query.filter_by(user_id=user_id)
@@ -84,28 +88,24 @@ def get_applications():
                 )
             )
 
-        # Apply sorting
-        if sort == 'most_recent':
-            query = query.order_by(desc(Application.applied_at))
-        elif sort == 'oldest':
-            query = query.order_by(asc(Application.applied_at))
+        # Apply sorting, id breaks ties so cursors are stable
+        descending = sort != 'oldest'
+        keys = [(Application.applied_at, descending), (Application.id, descending)]
 
         # Paginate
-        total = query.count()
-        applications = query.offset((page - 1) * limit).limit(limit).all()
+        applications, pagination = paginate(query, keys, limit)
 
         return create_response(
             data={
-                'applications': [app.to_dict() for app in applications],
-                'pagination': {
-                    'page': page,
-                    'limit': limit,
-                    'total': total,
-                    'pages': (total + limit - 1) // limit
-                }
+                'applications': application_serializer.dump_many(applications, fields),
+                'pagination': pagination
             }
         )
 
+    except InvalidCursorError as e:
+        return error_response('INVALID_CURSOR', str(e), status_code=400)
+    except InvalidFieldsError as e:
+        return error_response('INVALID_FIELDS', str(e), status_code=400)
     except Exception as e:
         return error_response('FETCH_FAILED', str(e), status_code=500)
 
@@ -190,29 +190,30 @@ def delete_application(application_id):
 
 @applications_bp.route('/stats', methods=['GET'])
 @jwt_required()
+@replica_reads
 def get_stats():
     """Get application statistics for dashboard"""
     try:
         user_id = get_jwt_identity()
 
-        # Get total applications
-        total = Application.query.filter_by(user_id=user_id).count()
-
-        # Get status counts
-        status_counts = db.session.query(
-            Application.status,
-            func.count(Application.id)
-        ).filter_by(user_id=user_id).group_by(Application.status).all()
-
-        status_stats = {status: count for status, count in status_counts}
-
-        # Get platform counts
-        platform_counts = db.session.query(
-            Application.platform,
-            func.count(Application.id)
-        ).filter_by(user_id=user_id).group_by(Application.platform).all()
-
-        platform_stats = {platform: count for platform, count in platform_counts}
+        # Counts come from the daily rollup rather than the applications table
+        rows = db.session.query(
+            ApplicationDailyStat.platform,
+            ApplicationDailyStat.status,
+            func.sum(ApplicationDailyStat.count)
+        ).filter_by(user_id=user_id).group_by(
+            ApplicationDailyStat.platform, ApplicationDailyStat.status
+        ).all()
+
+        status_stats = {}
+        platform_stats = {}
+        for platform, status, count in rows:
+            if not count:
+                continue
+            status_stats[status] = status_stats.get(status, 0) + count
+            platform_stats[platform] = platform_stats.get(platform, 0) + count
+
+        total = sum(status_stats.values())
 
         # Get recent applications
         recent = Application.query.filter_by(user_id=user_id).order_by(
@@ -4,7 +4,7 @@ from app import db, limiter
 from app.models.user import User
 from app.models.subscription import Subscription
 from app.utils.validators import validate_email, validate_password, validate_phone, validate_skills, validate_file_size
-from app.utils.auth_utils import generate_tokens, create_response, error_response
+from app.utils.auth_utils import generate_tokens, create_response, error_response, invalidate_identity
 from app.utils.file_utils import get_file_size_from_base64, clean_base64
 
 auth_bp = Blueprint('auth', __name__)
@@ -88,7 +88,7 @@ def login():
             return error_response('VALIDATION_ERROR', 'Email and password are required', status_code=400)
 
         # Find user
-        user = User.query.filter_by(email=data['email'].lower()).first()
+        user = User.with_avatar().filter_by(email=data['email'].lower()).first()
         if not user or not user.check_password(data['password']):
             return error_response('INVALID_CREDENTIALS', 'Invalid email or password', status_code=401)
 
@@ -234,7 +234,7 @@ def get_profile():
     """Get current user profile with subscription info"""
     try:
         user_id = get_jwt_identity()
-        user = User.query.get(user_id)
+        user = User.with_avatar().get(user_id)
 
         if not user:
             return error_response('USER_NOT_FOUND', 'User not found', status_code=404)
@@ -300,6 +300,7 @@ def update_profile():
             user.skills = data['skills']
 
         db.session.commit()
+        invalidate_identity(user_id)
 
         return create_response(
             data={'user': user.to_dict()},
@@ -541,6 +542,7 @@ def verify_email():
             return error_response('INVALID_TOKEN', 'Invalid or expired verification token', status_code=400)
 
         db.session.commit()
+        invalidate_identity(user.id)
 
         return create_response(
             data={'user': user.to_dict()},
@@ -577,6 +579,7 @@ def delete_account():
         user_email = user.email
         db.session.delete(user)
         db.session.commit()
+        invalidate_identity(user_id)
 
         # Send account deletion confirmation email
         from app.utils.email_service import email_service
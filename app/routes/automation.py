@@ -1,13 +1,18 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import desc, func
 from app import db
 from app.models.job_queue import JobQueue
 from app.models.automation_log import AutomationLog
 from app.models.job_listing import JobListing
+from app.models.stats import QueueStatusCount
 from app.utils.auth_utils import create_response, error_response
+from app.utils.pagination import paginate, InvalidCursorError
+from app.utils.serializers import (
+    job_queue_serializer, automation_log_serializer, job_listing_serializer, InvalidFieldsError
+)
 from app.utils.rate_limiter import ApplicationRateLimiter
 from app.config import Config
+from app.db_routing import replica_reads
 
 automation_bp = Blueprint('automation', __name__)
 
@@ -21,37 +26,36 @@ def get_job_queue():
 
         # Get query parameters
         status = request.args.get('status', 'pending')
-        page = int(request.args.get('page', 1))
         limit = min(int(request.args.get('limit', Config.DEFAULT_PAGE_SIZE)), Config.MAX_PAGE_SIZE)
+        fields = job_queue_serializer.fields_from_request()
+        include_listing = request.args.get('include_listing', '').lower() == 'true' or 'job_listing' in (fields or ())
+        if include_listing and fields is None:
+            fields = job_queue_serializer.default_fields + ('job_listing',)
 
-        # Build query
-        query = JobQueue.query.filter_by(user_id=user_id)
+        # Build query (listing details are only fetched when requested)
+        query = JobQueue.with_listing() if include_listing else JobQueue.query
+        query = query.filter_by(user_id=user_id)
 
         if status:
             query = query.filter_by(status=status)
 
         # Order by priority and created date
-        query = query.order_by(
-            desc(JobQueue.priority),
-            JobQueue.created_at.asc()
-        )
+        keys = [(JobQueue.priority, True), (JobQueue.created_at, False), (JobQueue.id, False)]
 
         # Paginate
-        total = query.count()
-        jobs = query.offset((page - 1) * limit).limit(limit).all()
+        jobs, pagination = paginate(query, keys, limit)
 
         return create_response(
             data={
-                'jobs': [job.to_dict() for job in jobs],
-                'pagination': {
-                    'page': page,
-                    'limit': limit,
-                    'total': total,
-                    'pages': (total + limit - 1) // limit
-                }
+                'jobs': job_queue_serializer.dump_many(jobs, fields),
+                'pagination': pagination
             }
         )
 
+    except InvalidCursorError as e:
+        return error_response('INVALID_CURSOR', str(e), status_code=400)
+    except InvalidFieldsError as e:
+        return error_response('INVALID_FIELDS', str(e), status_code=400)
     except Exception as e:
         return error_response('FETCH_FAILED', str(e), status_code=500)
 
@@ -141,11 +145,15 @@ def get_automation_status():
     try:
         user_id = get_jwt_identity()
 
-        # Get queue statistics
-        pending_count = JobQueue.query.filter_by(user_id=user_id, status='pending').count()
-        processing_count = JobQueue.query.filter_by(user_id=user_id, status='processing').count()
-        applied_count = JobQueue.query.filter_by(user_id=user_id, status='applied').count()
-        failed_count = JobQueue.query.filter_by(user_id=user_id, status='failed').count()
+        # Get queue statistics from the per-status counters
+        queue_counts = {}
+        for row in QueueStatusCount.query.filter_by(user_id=user_id).all():
+            queue_counts[row.status] = queue_counts.get(row.status, 0) + row.count
+
+        pending_count = queue_counts.get('pending', 0)
+        processing_count = queue_counts.get('processing', 0)
+        applied_count = queue_counts.get('applied', 0)
+        failed_count = queue_counts.get('failed', 0)
 
         # Get rate limit status
         rate_stats = ApplicationRateLimiter.get_user_stats(user_id)
@@ -176,15 +184,16 @@ def get_automation_status():
 
 @automation_bp.route('/logs', methods=['GET'])
 @jwt_required()
+@replica_reads
 def get_automation_logs():
     """Get automation activity logs"""
     try:
         user_id = get_jwt_identity()
 
-        page = int(request.args.get('page', 1))
         limit = min(int(request.args.get('limit', Config.DEFAULT_PAGE_SIZE)), Config.MAX_PAGE_SIZE)
         action_type = request.args.get('action_type')
         status = request.args.get('status')
+        fields = automation_log_serializer.fields_from_request()
 
         query = AutomationLog.query.filter_by(user_id=user_id)
 
@@ -193,23 +202,21 @@ def get_automation_logs():
         if status:
             query = query.filter_by(status=status)
 
-        query = query.order_by(desc(AutomationLog.created_at))
+        keys = [(AutomationLog.created_at, True), (AutomationLog.id, True)]
 
-        total = query.count()
-        logs = query.offset((page - 1) * limit).limit(limit).all()
+        logs, pagination = paginate(query, keys, limit)
 
         return create_response(
             data={
-                'logs': [log.to_dict() for log in logs],
-                'pagination': {
-                    'page': page,
-                    'limit': limit,
-                    'total': total,
-                    'pages': (total + limit - 1) // limit
-                }
+                'logs': automation_log_serializer.dump_many(logs, fields),
+                'pagination': pagination
             }
         )
 
+    except InvalidCursorError as e:
+        return error_response('INVALID_CURSOR', str(e), status_code=400)
+    except InvalidFieldsError as e:
+        return error_response('INVALID_FIELDS', str(e), status_code=400)
     except Exception as e:
         return error_response('FETCH_FAILED', str(e), status_code=500)
 
@@ -221,9 +228,9 @@ def get_discovered_jobs():
     try:
         user_id = get_jwt_identity()
 
-        page = int(request.args.get('page', 1))
         limit = min(int(request.args.get('limit', Config.DEFAULT_PAGE_SIZE)), Config.MAX_PAGE_SIZE)
         platform = request.args.get('platform')
+        fields = job_listing_serializer.fields_from_request()
 
         # Get jobs that were found but not yet queued
         query = JobListing.query.filter_by(is_active=True)
@@ -235,23 +242,21 @@ def get_discovered_jobs():
         queued_job_ids = db.session.query(JobQueue.job_listing_id).filter_by(user_id=user_id).subquery()
         query = query.filter(~JobListing.id.in_(queued_job_ids))
 
-        query = query.order_by(desc(JobListing.scraped_at))
+        keys = [(JobListing.scraped_at, True), (JobListing.id, True)]
 
-        total = query.count()
-        jobs = query.offset((page - 1) * limit).limit(limit).all()
+        jobs, pagination = paginate(query, keys, limit)
 
         return create_response(
             data={
-                'jobs': [job.to_dict() for job in jobs],
-                'pagination': {
-                    'page': page,
-                    'limit': limit,
-                    'total': total,
-                    'pages': (total + limit - 1) // limit
-                }
+                'jobs': job_listing_serializer.dump_many(jobs, fields),
+                'pagination': pagination
             }
         )
 
+    except InvalidCursorError as e:
+        return error_response('INVALID_CURSOR', str(e), status_code=400)
+    except InvalidFieldsError as e:
+        return error_response('INVALID_FIELDS', str(e), status_code=400)
     except Exception as e:
         return error_response('FETCH_FAILED', str(e), status_code=500)
 
@@ -1,6 +1,7 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app import db
+from app.models.user import User
 from app.models.platform_credential import PlatformCredential
 from app.utils.auth_utils import create_response, error_response
 
@@ -97,6 +98,7 @@ def delete_credential(platform):
             return error_response('NOT_FOUND', 'Credential not found', status_code=404)
 
         db.session.delete(credential)
+        User.mark_changed(user_id)
         db.session.commit()
 
         return create_response(message='Credential deleted successfully')
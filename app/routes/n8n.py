@@ -2,7 +2,10 @@
 N8N Integration Routes
 Endpoints for n8n workflow automation (no JWT required)
 """
-from flask import Blueprint, request, jsonify
+import json
+from flask import Blueprint, Response, request, jsonify, stream_with_context, url_for
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import load_only
 from app import db
 from app.models.user import User
 from app.models.resume import Resume
@@ -10,6 +13,7 @@ from app.models.application import Application
 from app.models.platform_credential import PlatformCredential
 from app.utils.responses import create_response, error_response
 from app.utils.email_service import email_service
+from app.db_routing import replica_reads, use_replica
 from datetime import datetime
 
 n8n_bp = Blueprint('n8n', __name__)
@@ -55,9 +59,9 @@ def get_user_data():
             )
 
         # Get default resume (or first resume if no default)
-        resume = Resume.query.filter_by(user_id=user.id, is_default=True).first()
+        resume = Resume.with_file().filter_by(user_id=user.id, is_default=True).first()
         if not resume:
-            resume = Resume.query.filter_by(user_id=user.id).order_by(Resume.uploaded_at.desc()).first()
+            resume = Resume.with_file().filter_by(user_id=user.id).order_by(Resume.uploaded_at.desc()).first()
 
         # Get LinkedIn credentials if available
         linkedin_cred = PlatformCredential.query.filter_by(
@@ -111,47 +115,96 @@ def get_user_data():
         )
 
 
-@n8n_bp.route('/all-users', methods=['GET'])
-def get_all_users():
+# Users fetched per query by the bulk export
+EXPORT_CHUNK_SIZE = 500
+
+# Profile columns sent to n8n, avatar_base64 and auth fields are never loaded
+EXPORT_USER_COLUMNS = (
+    User.id, User.email, User.full_name, User.phone, User.location, User.linkedin_url,
+    User.github_url, User.portfolio_url, User.current_role, User.years_experience,
+    User.preferred_job_type, User.salary_expectations, User.professional_bio, User.skills,
+)
+
+
+def latest_resumes(user_ids, include_file=False):
     """
-    Get all registered users' data for n8n workflows
+    Return each user's default resume (or most recent upload) in one query
 
     Returns:
-        - Array of all users with their complete profiles
-        - Resume data (base64) for each user
-        - Platform credentials status
-        - Skills and preferences
-
-    Example:
-        GET /api/n8n/all-users
-        GET /api/n8n/all-users?has_resume=true  (filter users with resumes only)
+        dict: user_id -> Resume
     """
-    try:
-        # Optional filter: only users with resumes
-        has_resume_filter = request.args.get('has_resume', '').lower() == 'true'
+    columns = [Resume.id, Resume.user_id, Resume.filename, Resume.file_type, Resume.file_size, Resume.job_type_tag]
+    if include_file:
+        columns.append(Resume.file_base64)
 
-        # Get all users
-        users = User.query.all()
+    ranked = db.session.query(
+        Resume.id,
+        func.row_number().over(
+            partition_by=Resume.user_id,
+            order_by=(func.coalesce(Resume.is_default, False).desc(), Resume.uploaded_at.desc())
+        ).label('rank')
+    ).filter(Resume.user_id.in_(user_ids)).subquery()
 
-        users_data = []
+    resumes = Resume.query.options(load_only(*columns)).join(
+        ranked, and_(ranked.c.id == Resume.id, ranked.c.rank == 1)
+    ).all()
 
-        for user in users:
-            # Get default resume (or first resume if no default)
-            resume = Resume.query.filter_by(user_id=user.id, is_default=True).first()
-            if not resume:
-                resume = Resume.query.filter_by(user_id=user.id).order_by(Resume.uploaded_at.desc()).first()
+    return {resume.user_id: resume for resume in resumes}
 
-            # Skip users without resumes if filter is enabled
-            if has_resume_filter and not resume:
-                continue
 
-            # Get LinkedIn credentials if available
-            linkedin_cred = PlatformCredential.query.filter_by(
-                user_id=user.id,
-                platform='linkedin'
-            ).first()
+def iter_user_exports(include_file=False, has_resume_only=False, since=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield n8n user records, fetching users, resumes and credentials per chunk
 
-            # Build user data
+    Args:
+        include_file (bool): Embed resume base64 instead of a download URL
+        has_resume_only (bool): Skip users without a resume
+        since (datetime): Only users whose profile, resumes or credentials changed since then
+        chunk_size (int): Users per round of queries
+    """
+    query = User.query.options(load_only(*EXPORT_USER_COLUMNS))
+
+    if since is not None:
+        # Deleted resumes and credentials and default resume switches bump
+        # User.updated_at (User.mark_changed), so they are caught by the first test
+        query = query.filter(or_(
+            User.updated_at >= since,
+            db.session.query(Resume.id).filter(
+                Resume.user_id == User.id, Resume.uploaded_at >= since
+            ).exists(),
+            db.session.query(PlatformCredential.id).filter(
+                PlatformCredential.user_id == User.id, PlatformCredential.updated_at >= since
+            ).exists()
+        ))
+
+    last_id = None
+    while True:
+        chunk_query = query
+        if last_id is not None:
+            chunk_query = chunk_query.filter(User.id > last_id)
+        users = chunk_query.order_by(User.id).limit(chunk_size).all()
+        if not users:
+            return
+
+        last_id = users[-1].id
+        user_ids = [user.id for user in users]
+
+        resumes = latest_resumes(user_ids, include_file)
+        credentials = {
+            cred.user_id: cred
+            for cred in PlatformCredential.query.filter(
+                PlatformCredential.user_id.in_(user_ids),
+                PlatformCredential.platform == 'linkedin'
+            )
+        }
+        usernames = PlatformCredential.decrypt_usernames(credentials.values())
+
+        for user in users:
+            resume = resumes.get(user.id)
+            if has_resume_only and not resume:
+                continue
+
+            linkedin_cred = credentials.get(user.id)
             user_data = {
                 'user_id': user.id,
                 'email': user.email,
@@ -167,24 +220,58 @@ def get_all_users():
                 'salary_expectations': user.salary_expectations,
                 'professional_bio': user.professional_bio,
                 'skills': user.skills or [],
-                'linkedin_email': linkedin_cred.get_username() if linkedin_cred else None,
+                'linkedin_email': usernames.get(linkedin_cred.id) if linkedin_cred else None,
                 'has_linkedin_credentials': bool(linkedin_cred),
                 'has_linkedin_cookies': linkedin_cred.has_cookies() if linkedin_cred else False
             }
 
-            # Add resume data if available
             if resume:
                 user_data['resume'] = {
+                    'resume_id': resume.id,
                     'filename': resume.filename,
-                    'file_base64': resume.file_base64,
                     'file_type': resume.file_type,
                     'file_size': resume.file_size,
                     'job_type_tag': resume.job_type_tag
                 }
+                if include_file:
+                    user_data['resume']['file_base64'] = resume.file_base64
+                else:
+                    user_data['resume']['file_url'] = url_for(
+                        'n8n.get_resume_file', resume_id=resume.id, _external=True
+                    )
             else:
                 user_data['resume'] = None
 
-            users_data.append(user_data)
+            yield user_data
+
+        # Release the chunk's objects before fetching the next one
+        db.session.expunge_all()
+
+
+@n8n_bp.route('/all-users', methods=['GET'])
+@replica_reads
+def get_all_users():
+    """
+    Get all registered users' data for n8n workflows
+
+    Returns:
+        - Array of all users with their complete profiles
+        - Resume data (base64) for each user
+        - Platform credentials status
+        - Skills and preferences
+
+    Builds the whole response in memory; large installations should use
+    /all-users/export instead.
+
+    Example:
+        GET /api/n8n/all-users
+        GET /api/n8n/all-users?has_resume=true  (filter users with resumes only)
+    """
+    try:
+        # Optional filter: only users with resumes
+        has_resume_filter = request.args.get('has_resume', '').lower() == 'true'
+
+        users_data = list(iter_user_exports(include_file=True, has_resume_only=has_resume_filter))
 
         return create_response(
             data={
@@ -202,6 +289,98 @@ def get_all_users():
         )
 
 
+@n8n_bp.route('/all-users/export', methods=['GET'])
+def export_all_users():
+    """
+    Stream all users' data for n8n workflows as NDJSON (one user per line)
+
+    Query Parameters:
+        has_resume: true to only include users with a resume
+        include_resume_data: true to embed resume base64 (default: a file_url to fetch it)
+        since: ISO timestamp, only users changed since then (incremental sync)
+
+    The X-Sync-Timestamp response header holds the value to pass as since=
+    on the next incremental sync.
+
+    Example:
+        GET /api/n8n/all-users/export
+        GET /api/n8n/all-users/export?since=2025-11-20T08:00:00
+    """
+    has_resume_filter = request.args.get('has_resume', '').lower() == 'true'
+    include_file = request.args.get('include_resume_data', '').lower() == 'true'
+
+    since = request.args.get('since')
+    if since:
+        try:
+            since = datetime.fromisoformat(since.replace('Z', '+00:00')).replace(tzinfo=None)
+        except ValueError:
+            return error_response(
+                'INVALID_SINCE',
+                'since must be an ISO 8601 timestamp',
+                status_code=400
+            )
+    else:
+        since = None
+
+    sync_timestamp = datetime.utcnow().isoformat()
+
+    def generate():
+        # Runs after the view returns, so the replica scope is entered here
+        with use_replica():
+            lines = []
+            for user_data in iter_user_exports(include_file, has_resume_filter, since):
+                lines.append(json.dumps(user_data))
+                if len(lines) >= 100:
+                    yield '\n'.join(lines) + '\n'
+                    lines = []
+            if lines:
+                yield '\n'.join(lines) + '\n'
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson',
+        headers={'X-Sync-Timestamp': sync_timestamp}
+    )
+
+
+@n8n_bp.route('/resumes/<resume_id>', methods=['GET'])
+def get_resume_file(resume_id):
+    """
+    Get a resume's file as base64, as referenced by file_url in the export
+
+    Example:
+        GET /api/n8n/resumes/<resume_id>
+    """
+    try:
+        resume = Resume.with_file().get(resume_id)
+
+        if not resume:
+            return error_response(
+                'RESUME_NOT_FOUND',
+                f'No resume found with id: {resume_id}',
+                status_code=404
+            )
+
+        return create_response(
+            data={
+                'resume_id': resume.id,
+                'user_id': resume.user_id,
+                'filename': resume.filename,
+                'file_base64': resume.file_base64,
+                'file_type': resume.file_type,
+                'file_size': resume.file_size,
+                'job_type_tag': resume.job_type_tag
+            }
+        )
+
+    except Exception as e:
+        return error_response(
+            'FETCH_ERROR',
+            str(e),
+            status_code=500
+        )
+
+
 @n8n_bp.route('/save-application', methods=['POST'])
 def save_application():
     """
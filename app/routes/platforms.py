@@ -1,11 +1,16 @@
 from flask import Blueprint
 from app.models.platform import Platform
 from app.utils.auth_utils import create_response, error_response
+from app.utils.http_cache import http_cached
 
 platforms_bp = Blueprint('platforms', __name__)
 
+# Platforms are seeded, not edited through the API
+PLATFORMS_CACHE_SECONDS = 300
+
 
 @platforms_bp.route('', methods=['GET'])
+@http_cached('platforms', public=True, max_age=PLATFORMS_CACHE_SECONDS)
 def get_platforms():
     """Get all available platforms"""
     try:
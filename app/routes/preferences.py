@@ -7,12 +7,19 @@ from app import db
 from app.models.user import User
 from app.models.user_preferences import UserPreferences
 from app.utils.auth_utils import create_response, error_response
+from app.utils.http_cache import http_cached, invalidate_http_cache
 
 preferences_bp = Blueprint('preferences', __name__)
 
 
+def preferences_version(user_id):
+    """Cache version of a user's preferences"""
+    return db.session.query(UserPreferences.updated_at).filter_by(user_id=user_id).scalar()
+
+
 @preferences_bp.route('', methods=['GET'])
 @jwt_required()
+@http_cached('preferences', version=preferences_version, per_user=True)
 def get_preferences():
     """Get user preferences"""
     try:
@@ -96,6 +103,7 @@ def update_preferences():
             preferences.currency = data['currency']
 
         db.session.commit()
+        invalidate_http_cache('preferences', user_id)
 
         return create_response(
             data={'preferences': preferences.to_dict()},
@@ -126,6 +134,7 @@ def reset_preferences():
         preferences = UserPreferences(user_id=user_id)
         db.session.add(preferences)
         db.session.commit()
+        invalidate_http_cache('preferences', user_id)
 
         return create_response(
             data={'preferences': preferences.to_dict()},
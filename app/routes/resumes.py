@@ -2,6 +2,7 @@ from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime
 from app import db
+from app.models.user import User
 from app.models.resume import Resume
 from app.utils.auth_utils import create_response, error_response
 from app.utils.file_utils import get_file_size_from_base64, get_file_extension, clean_base64
@@ -97,7 +98,7 @@ def get_resume(resume_id):
     """Get a specific resume with file content"""
     try:
         user_id = get_jwt_identity()
-        resume = Resume.query.filter_by(id=resume_id, user_id=user_id).first()
+        resume = Resume.with_file().filter_by(id=resume_id, user_id=user_id).first()
 
         if not resume:
             return error_response('RESUME_NOT_FOUND', 'Resume not found', status_code=404)
@@ -142,6 +143,7 @@ def set_default_resume(resume_id):
 
         # Set this as default
         resume.is_default = True
+        User.mark_changed(user_id)
         db.session.commit()
 
         return create_response(
@@ -166,6 +168,7 @@ def delete_resume(resume_id):
             return error_response('RESUME_NOT_FOUND', 'Resume not found', status_code=404)
 
         db.session.delete(resume)
+        User.mark_changed(user_id)
         db.session.commit()
 
         return create_response(message='Resume deleted successfully')
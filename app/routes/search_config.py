@@ -1,14 +1,29 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import func
 from app import db
 from app.models.job_search_config import JobSearchConfig
 from app.models.resume import Resume
 from app.utils.auth_utils import create_response, error_response
-from app.tasks.immediate_applicator import start_immediate_applications
+from app.utils.http_cache import http_cached, invalidate_http_cache
 
 search_config_bp = Blueprint('search_config', __name__)
 
 
+def queue_immediate_applications(user_id, config_id):
+    """Start applying for a saved config (the task module and Celery load on first use)"""
+    from app.tasks.immediate_applicator import start_immediate_applications
+    start_immediate_applications.delay(user_id, config_id)
+
+
+def config_version(user_id):
+    """Cache version of a user's search configuration (count catches deletes)"""
+    count, last_update = db.session.query(
+        func.count(JobSearchConfig.id), func.max(JobSearchConfig.updated_at)
+    ).filter(JobSearchConfig.user_id == user_id).one()
+    return f'{count}:{last_update}'
+
+
 @search_config_bp.route('', methods=['POST'])
 @jwt_required()
 def create_or_update_config():
@@ -102,9 +117,10 @@ def create_or_update_config():
                 config.is_active = data['is_active']
 
             db.session.commit()
+            invalidate_http_cache('search_config', user_id)
 
             # Trigger immediate job applications
-            start_immediate_applications.delay(user_id, config.id)
+            queue_immediate_applications(user_id, config.id)
 
             message = 'Configuration updated successfully. Job applications started!'
             status_code = 200
@@ -139,9 +155,10 @@ def create_or_update_config():
             )
             db.session.add(config)
             db.session.commit()
+            invalidate_http_cache('search_config', user_id)
 
             # Trigger immediate job applications
-            start_immediate_applications.delay(user_id, config.id)
+            queue_immediate_applications(user_id, config.id)
 
             message = 'Configuration created successfully. Job applications started!'
             status_code = 201
@@ -159,6 +176,7 @@ def create_or_update_config():
 
 @search_config_bp.route('', methods=['GET'])
 @jwt_required()
+@http_cached('search_config', version=config_version, per_user=True)
 def get_config():
     """Get user's job search configuration"""
     try:
@@ -201,6 +219,7 @@ def update_config(config_id):
                 setattr(config, key, data[key])
 
         db.session.commit()
+        invalidate_http_cache('search_config', user_id)
 
         return create_response(
             data={'config': config.to_dict()},
@@ -225,6 +244,7 @@ def delete_config(config_id):
 
         db.session.delete(config)
         db.session.commit()
+        invalidate_http_cache('search_config', user_id)
 
         return create_response(message='Configuration deleted successfully')
 
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from app import db
 from app.models.subscription import Subscription, Payment
 from app.utils.auth_utils import create_response, error_response
+from app.utils.http_cache import http_cached
 
 subscription_bp = Blueprint('subscription', __name__)
 
@@ -50,6 +51,7 @@ def get_subscription():
 
 
 @subscription_bp.route('/plans', methods=['GET'])
+@http_cached('plans', public=True, max_age=3600)
 def get_plans():
     """Get available subscription plans"""
     return create_response(data={'plans': PLANS})
@@ -1,12 +1,38 @@
 """
 Cleanup tasks for maintaining database hygiene
 """
+import os
+import re
+import time
 from datetime import datetime, timedelta
+from sqlalchemy import and_, delete, func, select, text, update
 from app.celery_config import celery
 from app import db
 from app.models.job_listing import JobListing
 from app.models.job_queue import JobQueue
 from app.models.automation_log import AutomationLog
+from app.utils.rollups import record_queue_transition
+
+
+# activity_logs is the admin audit trail, kept forever unless this is set
+ACTIVITY_LOG_RETENTION_DAYS = os.getenv('ACTIVITY_LOG_RETENTION_DAYS')
+
+# Monthly partitioned log tables and how many days of rows each keeps (None keeps everything)
+PARTITIONED_LOG_RETENTION_DAYS = {
+    'automation_logs': 90,
+    'activity_logs': int(ACTIVITY_LOG_RETENTION_DAYS) if ACTIVITY_LOG_RETENTION_DAYS else None,
+}
+
+# Partitions kept ready past the current month
+PARTITION_MONTHS_AHEAD = 3
+
+PARTITION_NAME = re.compile(r'_p(\d{4})(\d{2})$')
+
+# Rows removed per DELETE statement, each chunk is committed on its own
+CLEANUP_CHUNK_SIZE = 5000
+
+# Stop starting new chunks after this long, the next run picks up the rest
+CLEANUP_TIME_BUDGET_SECONDS = 15 * 60
 
 
 @celery.task(name='app.tasks.cleanup.clean_old_jobs')
@@ -15,52 +41,102 @@ def clean_old_jobs():
     Clean up old job listings and failed queue items
     Runs daily at 2 AM via Celery Beat
     """
-    deleted_listings = 0
-    deleted_queue = 0
-    deleted_logs = 0
+    deadline = time.monotonic() + CLEANUP_TIME_BUDGET_SECONDS
+    now = datetime.utcnow()
 
-    try:
-        # Delete job listings older than 30 days
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+    # Queue items go first so fewer rows reference the listings deleted next
+    steps = (
+        ('queue items', JobQueue, and_(
+            JobQueue.status.in_(['failed', 'skipped']),
+            JobQueue.created_at < now - timedelta(days=7)
+        ), release_queue_counts),
+        ('listings', JobListing, JobListing.scraped_at < now - timedelta(days=30), detach_queue_items),
+        ('logs', AutomationLog, AutomationLog.created_at < now - timedelta(days=90), None),
+    )
 
-        old_listings = JobListing.query.filter(
-            JobListing.scraped_at < thirty_days_ago
-        ).all()
+    results = []
+    for label, model, condition, before_delete in steps:
+        try:
+            deleted, finished = delete_in_chunks(model, condition, deadline, before_delete)
+        except Exception as e:
+            db.session.rollback()
+            return f"Error during cleanup of {label}: {str(e)}"
 
-        for listing in old_listings:
-            db.session.delete(listing)
-            deleted_listings += 1
+        results.append(f"{deleted} {label}")
+        if not finished:
+            print(f"[CLEANUP] Time budget reached while deleting {label}")
+            return f"Cleaned up {', '.join(results)} (time budget reached)"
 
-        # Delete failed/skipped queue items older than 7 days
-        seven_days_ago = datetime.utcnow() - timedelta(days=7)
+    return f"Cleaned up {', '.join(results)}"
 
-        old_queue_items = JobQueue.query.filter(
-            JobQueue.status.in_(['failed', 'skipped']),
-            JobQueue.created_at < seven_days_ago
-        ).all()
 
-        for item in old_queue_items:
-            db.session.delete(item)
-            deleted_queue += 1
+def delete_in_chunks(model, condition, deadline, before_delete=None):
+    """
+    Delete matching rows with DELETE ... WHERE id IN (SELECT id ... LIMIT n)
 
-        # Delete automation logs older than 90 days
-        ninety_days_ago = datetime.utcnow() - timedelta(days=90)
+    Every chunk is committed separately so locks are short lived and memory
+    stays flat regardless of how many rows match.
+
+    Args:
+        model: Model class to delete from
+        condition: Filter selecting the rows to delete
+        deadline (float): time.monotonic() value after which no new chunk starts
+        before_delete: Optional callable given the chunk's ids before they are deleted
+
+    Returns:
+        tuple: (rows deleted, whether every matching row was deleted)
+    """
+    table = model.__tablename__
+    total = 0
+    started = time.monotonic()
 
-        old_logs = AutomationLog.query.filter(
-            AutomationLog.created_at < ninety_days_ago
-        ).all()
+    while time.monotonic() < deadline:
+        chunk = select(model.id).where(condition).limit(CLEANUP_CHUNK_SIZE)
 
-        for log in old_logs:
-            db.session.delete(log)
-            deleted_logs += 1
+        if before_delete is not None:
+            # Materialise the ids so both statements act on the same rows
+            ids = db.session.execute(chunk).scalars().all()
+            if not ids:
+                return total, True
+            before_delete(ids)
+            chunk = ids
 
+        result = db.session.execute(
+            delete(model).where(model.id.in_(chunk)).execution_options(synchronize_session=False)
+        )
         db.session.commit()
 
-        return f"Cleaned up {deleted_listings} listings, {deleted_queue} queue items, {deleted_logs} logs"
+        total += result.rowcount
+        if result.rowcount:
+            rate = total / max(time.monotonic() - started, 0.001)
+            print(f"[CLEANUP] {table}: deleted {total} rows ({rate:.0f}/s)")
+
+        if result.rowcount < CLEANUP_CHUNK_SIZE:
+            return total, True
+
+    return total, False
+
+
+def release_queue_counts(queue_ids):
+    """Take queue items about to be deleted out of the queue status counters"""
+    rows = db.session.query(
+        JobQueue.user_id, JobQueue.platform, JobQueue.status, func.count(JobQueue.id)
+    ).filter(JobQueue.id.in_(queue_ids)).group_by(
+        JobQueue.user_id, JobQueue.platform, JobQueue.status
+    ).all()
+
+    for user_id, platform, status, count in rows:
+        record_queue_transition(user_id, platform, status, None, count)
 
-    except Exception as e:
-        db.session.rollback()
-        return f"Error during cleanup: {str(e)}"
+
+def detach_queue_items(listing_ids):
+    """Clear job_listing_id on queue items that point at listings about to be deleted"""
+    db.session.execute(
+        update(JobQueue)
+        .where(JobQueue.job_listing_id.in_(listing_ids))
+        .values(job_listing_id=None)
+        .execution_options(synchronize_session=False)
+    )
 
 
 @celery.task(name='app.tasks.cleanup.deactivate_old_listings')
@@ -81,3 +157,135 @@ def deactivate_old_listings():
     except Exception as e:
         db.session.rollback()
         return f"Error deactivating listings: {str(e)}"
+
+
+@celery.task(name='app.tasks.cleanup.maintain_log_partitions')
+def maintain_log_partitions():
+    """
+    Create upcoming monthly log partitions and drop expired ones
+    Runs daily at 1:30 AM via Celery Beat, ahead of clean_old_jobs
+
+    A partition is dropped once its whole month is past the table's retention;
+    clean_old_jobs deletes the remaining expired rows of the boundary month.
+    Months whose rows already went to the default partition (maintenance was
+    down longer than PARTITION_MONTHS_AHEAD) get a partition and their rows moved.
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return "Log partitioning requires PostgreSQL, skipped"
+
+    this_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    created = []
+    dropped = []
+
+    for table, retention_days in PARTITIONED_LOG_RETENTION_DAYS.items():
+        try:
+            partitions = get_partitions(table)
+            if partitions is None:
+                print(f"[CLEANUP] {table} is not partitioned, skipping")
+                continue
+
+            months = {add_months(this_month, offset) for offset in range(PARTITION_MONTHS_AHEAD + 1)}
+            # Months whose rows went to the default partition while maintenance was not running
+            if f'{table}_default' in partitions:
+                months.update(get_default_partition_months(table))
+
+            for month in sorted(months):
+                name = f'{table}_p{month:%Y%m}'
+                if name in partitions:
+                    continue
+
+                try:
+                    create_month_partition(table, name, month)
+                    created.append(name)
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"[CLEANUP] Error creating partition {name}: {str(e)}")
+
+            if retention_days is None:
+                continue
+
+            cutoff = datetime.utcnow() - timedelta(days=retention_days)
+            for name in partitions:
+                match = PARTITION_NAME.search(name)
+                if not match:
+                    continue
+
+                month = datetime(int(match.group(1)), int(match.group(2)), 1)
+                if add_months(month, 1) <= cutoff:
+                    db.session.execute(text(f'DROP TABLE {name}'))
+                    db.session.commit()
+                    dropped.append(name)
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"[CLEANUP] Error maintaining partitions for {table}: {str(e)}")
+
+    return f"Created {len(created)} partitions, dropped {len(dropped)} ({', '.join(dropped) or 'none'})"
+
+
+def get_default_partition_months(table):
+    """Return the months that have rows in a table's default partition"""
+    return [
+        month for month in db.session.execute(text(
+            f"SELECT DISTINCT date_trunc('month', created_at) FROM {table}_default"
+        )).scalars()
+    ]
+
+
+def create_month_partition(table, name, month):
+    """
+    Create a table's partition for one month
+
+    When rows for that month are already in the default partition, PostgreSQL
+    refuses to create the partition, so the default partition is detached, the
+    month is created, its rows are moved over and the default is re-attached,
+    all in one transaction.
+    """
+    lower, upper = month, add_months(month, 1)
+    bounds = {'lower': lower, 'upper': upper}
+    default = f'{table}_default'
+
+    stranded = db.session.execute(text(
+        f"SELECT EXISTS (SELECT 1 FROM {default} WHERE created_at >= :lower AND created_at < :upper)"
+    ), bounds).scalar() if default in get_partitions(table) else False
+
+    if stranded:
+        db.session.execute(text(f'ALTER TABLE {table} DETACH PARTITION {default}'))
+
+    db.session.execute(text(
+        f"CREATE TABLE {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{lower:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+    ))
+
+    if stranded:
+        moved = db.session.execute(text(
+            f"WITH moved AS (DELETE FROM {default} WHERE created_at >= :lower AND created_at < :upper "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+        ), bounds).rowcount
+        db.session.execute(text(f'ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT'))
+        print(f"[CLEANUP] Moved {moved} row(s) from {default} into {name}")
+
+    db.session.commit()
+
+
+def get_partitions(table):
+    """Return the names of a table's partitions, or None if it is not partitioned"""
+    is_partitioned = db.session.execute(text(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+    ), {'table': table}).scalar()
+    if not is_partitioned:
+        return None
+
+    return db.session.execute(text(
+        "SELECT child.relname FROM pg_inherits i "
+        "JOIN pg_class parent ON parent.oid = i.inhparent "
+        "JOIN pg_class child ON child.oid = i.inhrelid "
+        "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)"
+    ), {'table': table}).scalars().all()
+
+
+def add_months(month_start, months):
+    """Return the first day of the month `months` after month_start"""
+    month = month_start.month - 1 + months
+    return month_start.replace(year=month_start.year + month // 12, month=month % 12 + 1)
@@ -11,6 +11,7 @@ from app.models.application import Application
 from app.models.subscription import Subscription
 from app.models.automation_log import AutomationLog
 from app.models.platform_credential import PlatformCredential
+from app.models.settings import is_platform_enabled
 
 
 @celery.task(name='app.tasks.immediate_applicator.start_immediate_applications')
@@ -127,6 +128,12 @@ def start_immediate_applications(user_id, config_id):
 
             # Process each platform
             for platform in platforms:
+                if not is_platform_enabled(platform):
+                    error_msg = f"{platform} integration is disabled"
+                    log_event(user_id, 'platform_disabled', 'failed', error_msg)
+                    errors.append(error_msg)
+                    continue
+
                 try:
                     # Get platform credentials
                     credential = PlatformCredential.query.filter_by(
@@ -241,15 +248,16 @@ def search_and_apply_immediate(user, config, search_config, platform, credential
                  f'🚀 Starting {platform} automation for {config_type} search')
 
         # Prepare user profile with credentials
-        user_profile = user.to_dict()
+        user_profile = user.to_dict(include_avatar=False)
 
         if platform.lower() == 'linkedin':
-            user_profile['linkedin_email'] = credential.get_username()
-            user_profile['linkedin_password'] = credential.get_password()
+            session = credential.get_session_material()
+            user_profile['linkedin_email'] = session['username']
+            user_profile['linkedin_password'] = session['password']
 
             # Add cookies if available
-            if credential.has_cookies():
-                user_profile['linkedin_cookies'] = credential.get_cookies()
+            if session['cookies']:
+                user_profile['linkedin_cookies'] = session['cookies']
                 log_event(user.id, 'cookies_loaded', 'info',
                          f'LinkedIn session cookies loaded for user')
             else:
@@ -258,12 +266,13 @@ def search_and_apply_immediate(user, config, search_config, platform, credential
 
             bot = LinkedInBot(user_profile=user_profile, resume_base64=resume.file_base64)
         elif platform.lower() == 'indeed':
-            user_profile['indeed_email'] = credential.get_username()
-            user_profile['indeed_password'] = credential.get_password()
+            session = credential.get_session_material()
+            user_profile['indeed_email'] = session['username']
+            user_profile['indeed_password'] = session['password']
 
             # Add cookies if available
-            if credential.has_cookies():
-                user_profile['indeed_cookies'] = credential.get_cookies()
+            if session['cookies']:
+                user_profile['indeed_cookies'] = session['cookies']
                 log_event(user.id, 'cookies_loaded', 'info',
                          f'Indeed session cookies loaded for user')
 
@@ -353,7 +362,7 @@ def search_and_apply_immediate(user, config, search_config, platform, credential
                 log_event(user.id, 'job_application_attempt', 'info',
                          f'📤 Applying to job {idx}/{jobs_count}: {job["company_name"]} - {job["job_title"]}')
 
-                success, message = bot.apply_to_job(job['job_url'])
+                success, message = bot.apply_in_session(job['job_url'])
 
                 if success:
                     # Create application record
@@ -1,8 +1,10 @@
 """
 Job applicator tasks for automated job applications
 """
+from collections import Counter
 from datetime import datetime, timedelta
 import time
+from sqlalchemy import update, or_, func
 from app.celery_config import celery
 from app import db
 from app.models.user import User
@@ -11,7 +13,22 @@ from app.models.job_queue import JobQueue
 from app.models.application import Application
 from app.models.subscription import Subscription
 from app.models.automation_log import AutomationLog
+from app.models.settings import Settings, is_platform_enabled, disabled_platforms
 from app.utils.rate_limiter import ApplicationRateLimiter
+from app.utils.rollups import record_queue_transition
+
+# Leave headroom below the 25 minute soft time limit for the last application
+BATCH_TIME_BUDGET_SECONDS = 20 * 60
+
+# Failed applications are retried after this delay
+RETRY_DELAY_SECONDS = 60 * 60
+
+# Follow-ups further out than this are left to process_job_queue, since the
+# Redis broker redelivers ETA tasks that wait longer than its visibility timeout
+MAX_ETA_SECONDS = 60 * 60
+
+# Allow a follow-up firing slightly early (clock drift) to claim its items
+SCHEDULE_TOLERANCE = timedelta(seconds=5)
 
 
 @celery.task(name='app.tasks.job_applicator.process_job_queue')
@@ -20,182 +37,197 @@ def process_job_queue():
     Process pending jobs in the queue
     Runs every 30 minutes via Celery Beat
     """
-    # Get all pending jobs ordered by priority and scheduled time
-    pending_jobs = JobQueue.query.filter_by(
+    if Settings.current().maintenance_mode:
+        return "Maintenance mode is on, not processing the job queue"
+
+    # Get all pending jobs ordered by priority and scheduled time (only what batching needs)
+    query = JobQueue.query.with_entities(
+        JobQueue.id, JobQueue.user_id, JobQueue.platform
+    ).filter_by(
         status='pending'
     ).filter(
         JobQueue.scheduled_for <= datetime.utcnow()
-    ).order_by(
+    )
+
+    # Items of platforms switched off in the settings stay pending until re-enabled
+    disabled = disabled_platforms()
+    if disabled:
+        query = query.filter(func.lower(JobQueue.platform).notin_(disabled))
+
+    pending_jobs = query.order_by(
         JobQueue.priority.desc(),
         JobQueue.created_at.asc()
     ).limit(50).all()  # Process max 50 jobs per run
 
-    processed = 0
+    # Group jobs per user and platform so each group shares one browser session
+    batches = {}
     for job in pending_jobs:
+        batches.setdefault((job.user_id, job.platform), []).append(job.id)
+
+    processed = 0
+    for (user_id, platform), queue_ids in batches.items():
         try:
-            # Apply to job
-            apply_to_job.delay(job.id)
-            processed += 1
+            # Apply to jobs
+            apply_batch.delay(user_id, platform, queue_ids)
+            processed += len(queue_ids)
         except Exception as e:
-            print(f"Error queuing application for job {job.id}: {str(e)}")
+            print(f"Error queuing application batch for user {user_id} on {platform}: {str(e)}")
 
-    return f"Queued {processed} jobs for application"
+    return f"Queued {processed} jobs for application in {len(batches)} batch(es)"
 
 
-@celery.task(name='app.tasks.job_applicator.apply_to_job', bind=True, max_retries=3)
-def apply_to_job(self, job_queue_id):
+@celery.task(name='app.tasks.job_applicator.apply_to_job')
+def apply_to_job(job_queue_id):
     """
     Apply to a single job using automation
+    Runs as a batch of one so retries and deferrals take the same path
     """
-    try:
-        queue_item = JobQueue.query.get(job_queue_id)
-        if not queue_item:
-            return f"Job queue item {job_queue_id} not found"
+    queue_item = JobQueue.query.get(job_queue_id)
+    if not queue_item:
+        return f"Job queue item {job_queue_id} not found"
+
+    # Check if already processing or completed
+    if queue_item.status in ['processing', 'applied', 'skipped']:
+        return f"Job {job_queue_id} already {queue_item.status}"
+
+    return apply_batch.run(queue_item.user_id, queue_item.platform, [queue_item.id])
+
+
+@celery.task(name='app.tasks.job_applicator.apply_batch')
+def apply_batch(user_id, platform, queue_ids):
+    """
+    Apply to several queued jobs of one user on one platform
+    Loads user, subscription, credentials and resumes once and walks the
+    items in order through a single authenticated browser session
+    """
+    from app.models.platform_credential import PlatformCredential
+
+    bot = None
+    queue_items = []
+    deferred = []
+    applied = 0
+    failed = 0
+    started_at = time.monotonic()
 
-        # Check if already processing or completed
-        if queue_item.status in ['processing', 'applied', 'skipped']:
-            return f"Job {job_queue_id} already {queue_item.status}"
+    try:
+        if not is_platform_enabled(platform):
+            return f"{platform} integration is disabled, leaving jobs pending for user {user_id}"
 
-        # Update status to processing
-        queue_item.status = 'processing'
-        queue_item.attempted_at = datetime.utcnow()
-        db.session.commit()
+        queue_items = claim_queue_items(user_id, queue_ids)
+        if not queue_items:
+            return f"No pending jobs to apply to for user {user_id} on {platform}"
 
-        user = User.query.get(queue_item.user_id)
+        user = User.query.get(user_id)
         if not user:
-            queue_item.status = 'failed'
-            queue_item.error_message = "User not found"
+            for queue_item in queue_items:
+                queue_item.status = 'failed'
+                queue_item.error_message = "User not found"
             db.session.commit()
             return "User not found"
 
-        # Check subscription limits
         subscription = Subscription.query.filter_by(
             user_id=user.id,
             status='active'
         ).first()
 
-        if subscription:
-            if subscription.applications_used >= subscription.applications_limit:
-                queue_item.status = 'skipped'
-                queue_item.error_message = "Application limit reached for subscription"
-                db.session.commit()
-                return "Application limit reached"
-
-        # Check rate limits
-        can_apply, reason, wait_time = ApplicationRateLimiter.can_apply(
-            user.id,
-            queue_item.platform
-        )
-
-        if not can_apply:
-            # Reschedule for later
-            queue_item.status = 'pending'
-            queue_item.scheduled_for = datetime.utcnow() + timedelta(seconds=wait_time)
-            db.session.commit()
-            return f"Rate limited: {reason}. Rescheduled for later."
-
-        # Get user's resume
-        resume = get_user_resume(user.id, queue_item.job_search_config_id)
-        if not resume:
-            queue_item.status = 'failed'
-            queue_item.error_message = "No resume available"
-            db.session.commit()
-            return "No resume available"
-
-        # Apply to the job
-        success, message = apply_to_platform(
-            platform=queue_item.platform,
-            job_url=queue_item.job_url,
-            user=user,
-            resume=resume
-        )
-
-        if success:
-            # Create application record
-            application = Application(
-                user_id=user.id,
-                company_name=queue_item.company_name,
-                job_title=queue_item.job_title,
-                platform=queue_item.platform,
-                job_url=queue_item.job_url,
-                status='sent',
-                resume_used_id=resume.id,
-                applied_at=datetime.utcnow()
-            )
-            db.session.add(application)
-
-            # Update queue item
-            queue_item.status = 'applied'
-            queue_item.completed_at = datetime.utcnow()
-
-            # Update subscription usage
-            if subscription:
-                subscription.applications_used += 1
-
-            # Update resume last_used_at
-            resume.last_used_at = datetime.utcnow()
-
-            # Log success
-            log = AutomationLog(
-                user_id=user.id,
-                job_queue_id=queue_item.id,
-                action_type='job_apply',
-                status='success',
-                message=f"Successfully applied to {queue_item.company_name} - {queue_item.job_title}",
-                details={'platform': queue_item.platform}
-            )
-            db.session.add(log)
-
-            db.session.commit()
-
-            return f"Successfully applied to {queue_item.company_name}"
+        credential = PlatformCredential.query.filter_by(
+            user_id=user.id,
+            platform=platform.lower()
+        ).first()
 
-        else:
-            # Application failed
-            queue_item.retry_count += 1
+        if not credential:
+            fail_batch(queue_items, user, f"No credentials found for {platform}. Please add credentials first.")
+            schedule_follow_ups(user_id, platform, queue_items)
+            return f"No credentials found for {platform}"
+
+        # Resolve resumes once per search config
+        resumes = {}
+        for queue_item in queue_items:
+            config_id = queue_item.job_search_config_id
+            if config_id not in resumes:
+                resumes[config_id] = get_user_resume(user.id, config_id)
+
+        limits = ApplicationRateLimiter.get_platform_limits(platform)
+
+        for index, queue_item in enumerate(queue_items):
+            # Check subscription limits
+            if subscription and subscription.applications_used >= subscription.applications_limit:
+                for remaining in queue_items[index:]:
+                    remaining.status = 'skipped'
+                    remaining.error_message = "Application limit reached for subscription"
+                db.session.commit()
+                break
 
-            if queue_item.retry_count >= queue_item.max_retries:
+            resume = resumes.get(queue_item.job_search_config_id)
+            if not resume:
                 queue_item.status = 'failed'
-                queue_item.error_message = message
+                queue_item.error_message = "No resume available"
+                db.session.commit()
+                failed += 1
+                continue
+
+            # Wait out the delay between applications, hand the rest back when a
+            # limit is reached or the wait would not fit in this task's time budget
+            can_apply, reason, wait_time = ApplicationRateLimiter.can_apply(user.id, platform)
+            if not can_apply:
+                elapsed = time.monotonic() - started_at
+                if wait_time > limits['delay_between'] or elapsed + wait_time > BATCH_TIME_BUDGET_SECONDS:
+                    defer_queue_items(queue_items[index:], wait_time)
+                    db.session.commit()
+                    deferred.extend(queue_items[index:])
+                    break
+                time.sleep(wait_time)
+
+            # Open the browser session on first use
+            if bot is None:
+                bot = create_bot(platform, user, credential, resume)
+                if not bot:
+                    fail_batch(queue_items[index:], user, f"No automation bot implemented for platform: {platform}")
+                    deferred.extend(queue_items[index:])
+                    break
+
+                started, message = bot.start_session()
+                if not started:
+                    fail_batch(queue_items[index:], user, message)
+                    deferred.extend(queue_items[index:])
+                    break
+
+            bot.resume_base64 = resume.file_base64
+            success, message = bot.apply_in_session(queue_item.job_url)
+
+            if success:
+                record_application_success(queue_item, user, resume, subscription)
+                applied += 1
             else:
-                # Retry later
-                queue_item.status = 'pending'
-                queue_item.scheduled_for = datetime.utcnow() + timedelta(hours=1)
-
-            # Log failure
-            log = AutomationLog(
-                user_id=user.id,
-                job_queue_id=queue_item.id,
-                action_type='job_apply',
-                status='failed',
-                message=f"Failed to apply: {message}",
-                details={'platform': queue_item.platform, 'retry_count': queue_item.retry_count}
-            )
-            db.session.add(log)
+                record_application_failure(queue_item, user, message)
+                deferred.append(queue_item)
+                failed += 1
 
             db.session.commit()
 
-            # Retry task if haven't exceeded max retries
-            if queue_item.retry_count < queue_item.max_retries:
-                raise self.retry(exc=Exception(message), countdown=3600)  # Retry in 1 hour
+        schedule_follow_ups(user_id, platform, deferred)
 
-            return f"Application failed: {message}"
+        return f"Applied to {applied} job(s), {failed} failed for user {user_id} on {platform}"
 
     except Exception as e:
         db.session.rollback()
 
-        # Try to update queue item status
+        # Try to release items this batch still holds
         try:
-            queue_item = JobQueue.query.get(job_queue_id)
-            if queue_item:
-                queue_item.status = 'failed'
-                queue_item.error_message = str(e)
-                db.session.commit()
+            for queue_item in queue_items:
+                if queue_item.status == 'processing':
+                    queue_item.status = 'failed'
+                    queue_item.error_message = str(e)
+            db.session.commit()
         except:
             pass
 
         return f"Error: {str(e)}"
 
+    finally:
+        if bot:
+            bot.cleanup()
+
 
 def get_user_resume(user_id, job_search_config_id=None):
     """Get appropriate resume for job application"""
@@ -204,12 +236,12 @@ def get_user_resume(user_id, job_search_config_id=None):
         from app.models.job_search_config import JobSearchConfig
         config = JobSearchConfig.query.get(job_search_config_id)
         if config and config.primary_resume_id:
-            resume = Resume.query.get(config.primary_resume_id)
+            resume = Resume.with_file().get(config.primary_resume_id)
             if resume:
                 return resume
 
     # Fall back to default resume
-    resume = Resume.query.filter_by(
+    resume = Resume.with_file().filter_by(
         user_id=user_id,
         is_default=True
     ).first()
@@ -218,57 +250,176 @@ def get_user_resume(user_id, job_search_config_id=None):
         return resume
 
     # If no default, get most recently uploaded
-    resume = Resume.query.filter_by(
+    resume = Resume.with_file().filter_by(
         user_id=user_id
     ).order_by(Resume.uploaded_at.desc()).first()
 
     return resume
 
 
-def apply_to_platform(platform, job_url, user, resume):
+def create_bot(platform, user, credential, resume):
     """
-    Apply to job on specific platform using real automation bots
+    Build the automation bot for a platform with the user's credentials
 
-    Returns: (success: bool, message: str)
+    Returns: JobApplicationBot instance or None if the platform is unsupported
     """
     from app.automation.linkedin_bot import LinkedInBot
     from app.automation.indeed_bot import IndeedBot
-    from app.models.platform_credential import PlatformCredential
 
-    try:
-        # Get platform credentials
-        credential = PlatformCredential.query.filter_by(
-            user_id=user.id,
-            platform=platform.lower()
-        ).first()
+    platform_lower = platform.lower()
 
-        # Prepare user profile with credentials
-        user_profile = user.to_dict()
+    if platform_lower not in ('linkedin', 'indeed'):
+        return None
 
-        if credential:
-            # Add platform credentials to user profile
-            if platform.lower() == 'linkedin':
-                user_profile['linkedin_email'] = credential.get_username()
-                user_profile['linkedin_password'] = credential.get_password()
-            elif platform.lower() == 'indeed':
-                user_profile['indeed_email'] = credential.get_username()
-                user_profile['indeed_password'] = credential.get_password()
-        else:
-            return False, f"No credentials found for {platform}. Please add credentials first."
+    # Prepare user profile with credentials (decrypted values are cached between batches)
+    user_profile = user.to_dict(include_avatar=False)
+    session = credential.get_session_material()
 
-        platform_lower = platform.lower()
+    if platform_lower == 'linkedin':
+        user_profile['linkedin_email'] = session['username']
+        user_profile['linkedin_password'] = session['password']
+        if session['cookies']:
+            user_profile['linkedin_cookies'] = session['cookies']
+        return LinkedInBot(user_profile=user_profile, resume_base64=resume.file_base64)
 
-        if platform_lower == 'linkedin':
-            bot = LinkedInBot(user_profile=user_profile, resume_base64=resume.file_base64)
-            return bot.apply_to_job(job_url)
+    elif platform_lower == 'indeed':
+        user_profile['indeed_email'] = session['username']
+        user_profile['indeed_password'] = session['password']
+        if session['cookies']:
+            user_profile['indeed_cookies'] = session['cookies']
+        return IndeedBot(user_profile=user_profile, resume_base64=resume.file_base64)
 
-        elif platform_lower == 'indeed':
-            bot = IndeedBot(user_profile=user_profile, resume_base64=resume.file_base64)
-            return bot.apply_to_job(job_url)
+    return None
 
-        else:
-            return False, f"No automation bot implemented for platform: {platform}"
 
-    except Exception as e:
-        print(f"[Automation] Error applying to {platform}: {str(e)}")
-        return False, f"Automation error: {str(e)}"
+def fail_batch(queue_items, user, message):
+    """Record the same failure for every item of a batch and commit"""
+    for queue_item in queue_items:
+        record_application_failure(queue_item, user, message)
+    db.session.commit()
+
+
+def claim_queue_items(user_id, queue_ids):
+    """
+    Atomically move eligible pending items to processing
+    Items already claimed by another run, or not due yet, are left alone, so
+    a follow-up and a process_job_queue run can never apply to the same item
+
+    Returns: claimed JobQueue items in the order of queue_ids
+    """
+    now = datetime.utcnow()
+    claimed = db.session.execute(
+        update(JobQueue)
+        .where(
+            JobQueue.id.in_(queue_ids),
+            JobQueue.user_id == user_id,
+            JobQueue.status == 'pending',
+            or_(JobQueue.scheduled_for.is_(None), JobQueue.scheduled_for <= now + SCHEDULE_TOLERANCE)
+        )
+        .values(status='processing', attempted_at=now)
+        .returning(JobQueue.id, JobQueue.platform)
+    ).all()
+    for platform, count in Counter(row.platform for row in claimed).items():
+        record_queue_transition(user_id, platform, 'pending', 'processing', count)
+    db.session.commit()
+
+    claimed_ids = {row.id for row in claimed}
+
+    if not claimed_ids:
+        return []
+
+    items_by_id = {item.id: item for item in JobQueue.query.filter(JobQueue.id.in_(claimed_ids)).all()}
+    return [items_by_id[queue_id] for queue_id in queue_ids if queue_id in items_by_id]
+
+
+def defer_queue_items(queue_items, wait_seconds):
+    """Put queue items back to pending until they are eligible again (caller commits)"""
+    scheduled_for = datetime.utcnow() + timedelta(seconds=wait_seconds)
+    for queue_item in queue_items:
+        queue_item.status = 'pending'
+        queue_item.scheduled_for = scheduled_for
+
+
+def schedule_follow_ups(user_id, platform, queue_items):
+    """
+    Schedule exactly one follow-up batch per eligible time for items that were
+    deferred or will be retried; the queue row's status and scheduled_for are
+    the only retry state. Must be called after the changes are committed.
+    """
+    now = datetime.utcnow()
+    due = {}
+    for queue_item in queue_items:
+        if queue_item.status != 'pending' or not queue_item.scheduled_for:
+            continue
+        if (queue_item.scheduled_for - now).total_seconds() > MAX_ETA_SECONDS:
+            continue  # picked up by process_job_queue once it is due
+        due.setdefault(queue_item.scheduled_for, []).append(queue_item.id)
+
+    for eta, queue_ids in due.items():
+        try:
+            apply_batch.apply_async(args=(user_id, platform, queue_ids), eta=eta)
+        except Exception as e:
+            # Items stay pending, process_job_queue will still pick them up
+            print(f"Error scheduling follow-up for user {user_id} on {platform}: {str(e)}")
+
+
+def record_application_success(queue_item, user, resume, subscription):
+    """Create the application record and mark the queue item as applied (caller commits)"""
+    application = Application(
+        user_id=user.id,
+        company_name=queue_item.company_name,
+        job_title=queue_item.job_title,
+        platform=queue_item.platform,
+        job_url=queue_item.job_url,
+        status='sent',
+        resume_used_id=resume.id,
+        applied_at=datetime.utcnow()
+    )
+    db.session.add(application)
+
+    # Update queue item
+    queue_item.status = 'applied'
+    queue_item.completed_at = datetime.utcnow()
+
+    # Update subscription usage
+    if subscription:
+        subscription.applications_used += 1
+
+    # Update resume last_used_at
+    resume.last_used_at = datetime.utcnow()
+
+    # Log success
+    log = AutomationLog(
+        user_id=user.id,
+        job_queue_id=queue_item.id,
+        action_type='job_apply',
+        status='success',
+        message=f"Successfully applied to {queue_item.company_name} - {queue_item.job_title}",
+        details={'platform': queue_item.platform}
+    )
+    db.session.add(log)
+
+    return application
+
+
+def record_application_failure(queue_item, user, message):
+    """Count a failed attempt and reschedule or fail the queue item (caller commits)"""
+    queue_item.retry_count += 1
+
+    if queue_item.retry_count >= queue_item.max_retries:
+        queue_item.status = 'failed'
+        queue_item.error_message = message
+    else:
+        # Retry later
+        defer_queue_items([queue_item], RETRY_DELAY_SECONDS)
+
+    # Log failure
+    log = AutomationLog(
+        user_id=user.id,
+        job_queue_id=queue_item.id,
+        action_type='job_apply',
+        status='failed',
+        message=f"Failed to apply: {message}",
+        details={'platform': queue_item.platform, 'retry_count': queue_item.retry_count}
+    )
+    db.session.add(log)
@@ -8,7 +8,9 @@ from app.models.user import User
 from app.models.job_search_config import JobSearchConfig
 from app.models.job_listing import JobListing
 from app.models.job_queue import JobQueue
+from app.models.application import Application
 from app.models.automation_log import AutomationLog
+from app.models.settings import Settings, is_platform_enabled
 from app.utils.job_matcher import calculate_match_score, should_apply_to_job
 
 
@@ -18,6 +20,9 @@ def scrape_jobs_all_users():
     Scrape jobs for all active users
     Runs every 6 hours via Celery Beat
     """
+    if Settings.current().maintenance_mode:
+        return "Maintenance mode is on, not scraping"
+
     # Get all users with active job search configs
     users = User.query.join(JobSearchConfig).filter(
         JobSearchConfig.is_active == True
@@ -53,9 +58,13 @@ def scrape_jobs_for_user(user_id):
 
         total_jobs_found = 0
         total_queued = 0
+        ai_matching = Settings.current().ai_matching_enabled is not False
 
         # Scrape each platform
         for platform in platforms:
+            if not is_platform_enabled(platform):
+                continue
+
             try:
                 # Call platform-specific scraper
                 jobs = scrape_platform(platform, config)
@@ -71,7 +80,8 @@ def scrape_jobs_for_user(user_id):
                         match_score = calculate_match_score(
                             job_listing,
                             config,
-                            user.skills or []
+                            user.skills or [],
+                            ai_matching=ai_matching
                         )
 
                         # If match score is good, add to queue
@@ -79,7 +89,8 @@ def scrape_jobs_for_user(user_id):
                             job_listing,
                             config,
                             user.skills or [],
-                            threshold=70.0
+                            threshold=70.0,
+                            ai_matching=ai_matching
                         )
 
                         if should_apply:
@@ -91,8 +102,8 @@ def scrape_jobs_for_user(user_id):
 
                             existing_app = db.session.query(db.exists().where(
                                 db.and_(
-                                    db.column('user_id') == user_id,
-                                    db.column('job_url') == job_listing.job_url
+                                    Application.user_id == user_id,
+                                    Application.job_url == job_listing.job_url
                                 )
                             )).scalar()
 
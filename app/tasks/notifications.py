@@ -2,78 +2,91 @@
 Notification tasks for sending emails and alerts
 """
 from datetime import datetime, timedelta
+from sqlalchemy import and_, func
 from app.celery_config import celery
 from app import db
 from app.models.user import User
 from app.models.application import Application
 from app.models.job_queue import JobQueue
+from app.db_routing import replica_reads
+
+
+# Users per send_daily_summaries_batch task, each batch shares one SMTP connection
+SUMMARY_BATCH_SIZE = 200
+
+# Applications listed per section of the summary email
+SUMMARY_DETAIL_LIMIT = 5
 
 
 @celery.task(name='app.tasks.notifications.send_all_daily_summaries')
+@replica_reads
 def send_all_daily_summaries():
     """
     Send daily summaries to all users
     Runs daily at 8 AM via Celery Beat
     """
-    users = User.query.all()
+    start_of_yesterday, end_of_yesterday = get_summary_window()
 
-    sent = 0
-    for user in users:
+    # Only users with something to report get a summary
+    counts = get_summary_counts(start_of_yesterday, end_of_yesterday)
+    user_ids = sorted(counts)
+
+    batches = 0
+    for start in range(0, len(user_ids), SUMMARY_BATCH_SIZE):
         try:
-            send_daily_summary.delay(user.id)
-            sent += 1
+            send_daily_summaries_batch.delay(user_ids[start:start + SUMMARY_BATCH_SIZE])
+            batches += 1
         except Exception as e:
-            print(f"Error queuing daily summary for user {user.id}: {str(e)}")
+            print(f"Error queuing daily summary batch at offset {start}: {str(e)}")
+
+    return f"Queued daily summaries for {len(user_ids)} users in {batches} batch(es)"
 
-    return f"Queued daily summaries for {sent} users"
+
+@celery.task(name='app.tasks.notifications.send_daily_summaries_batch')
+@replica_reads
+def send_daily_summaries_batch(user_ids):
+    """
+    Send daily summary emails to a batch of users over one SMTP connection
+    """
+    try:
+        from app.utils.email_service import email_service
+
+        summaries = build_daily_summaries(user_ids)
+        if not summaries:
+            return "No daily summaries to send"
+
+        emails = dict(
+            db.session.query(User.id, User.email).filter(User.id.in_(list(summaries))).all()
+        )
+
+        messages = [
+            email_service.build_daily_summary(emails[user_id], summary)
+            for user_id, summary in summaries.items()
+            if user_id in emails
+        ]
+
+        result = email_service.send_bulk(messages)
+
+        print(f"[EMAIL] Daily summaries sent: {result['sent']}, failed: {len(result['failed'])}")
+        return f"Sent {result['sent']} daily summaries, {len(result['failed'])} failed"
+
+    except Exception as e:
+        return f"Error sending daily summaries: {str(e)}"
 
 
 @celery.task(name='app.tasks.notifications.send_daily_summary')
 def send_daily_summary(user_id):
     """
     Send daily summary email to user
-    TODO: Implement email sending
     """
     try:
         user = User.query.get(user_id)
         if not user:
             return f"User {user_id} not found"
 
-        # Get yesterday's data
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        start_of_yesterday = yesterday.replace(hour=0, minute=0, second=0)
-        end_of_yesterday = yesterday.replace(hour=23, minute=59, second=59)
-
-        # Applications submitted yesterday
-        apps_yesterday = Application.query.filter(
-            Application.user_id == user_id,
-            Application.applied_at >= start_of_yesterday,
-            Application.applied_at <= end_of_yesterday
-        ).all()
-
-        # Pending jobs in queue
-        pending_jobs = JobQueue.query.filter_by(
-            user_id=user_id,
-            status='pending'
-        ).count()
-
-        # Status updates
-        status_updates = Application.query.filter(
-            Application.user_id == user_id,
-            Application.last_status_update >= start_of_yesterday,
-            Application.last_status_update <= end_of_yesterday
-        ).filter(
-            Application.last_status_update != Application.applied_at
-        ).all()
-
-        # Prepare email content
-        summary = {
-            'applications_submitted': len(apps_yesterday),
-            'pending_applications': pending_jobs,
-            'status_updates': len(status_updates),
-            'applications': [app.to_dict() for app in apps_yesterday[:5]],  # Top 5
-            'updates': [app.to_dict() for app in status_updates[:5]]
-        }
+        summary = build_daily_summaries([user_id]).get(user_id)
+        if not summary:
+            return f"Nothing to report for {user.email}"
 
         # Send actual email
         from app.utils.email_service import email_service
@@ -91,6 +104,96 @@ def send_daily_summary(user_id):
         return f"Error sending daily summary: {str(e)}"
 
 
+def get_summary_window():
+    """Return the start and end of yesterday (UTC)"""
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    start_of_yesterday = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_of_yesterday = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return start_of_yesterday, end_of_yesterday
+
+
+def _submitted_filter(start, end):
+    return and_(Application.applied_at >= start, Application.applied_at <= end)
+
+
+def _status_update_filter(start, end):
+    return and_(
+        Application.last_status_update >= start,
+        Application.last_status_update <= end,
+        Application.last_status_update != Application.applied_at
+    )
+
+
+def get_summary_counts(start, end, user_ids=None):
+    """
+    Count submitted applications, pending queue items and status updates per user
+
+    Runs one grouped query per metric regardless of the number of users.
+    Users with nothing to report are left out.
+
+    Returns:
+        dict: user_id -> {'applications_submitted', 'pending_applications', 'status_updates'}
+    """
+    metrics = (
+        ('applications_submitted', Application.user_id, Application.id, _submitted_filter(start, end)),
+        ('pending_applications', JobQueue.user_id, JobQueue.id, JobQueue.status == 'pending'),
+        ('status_updates', Application.user_id, Application.id, _status_update_filter(start, end)),
+    )
+
+    counts = {}
+    for key, user_column, id_column, condition in metrics:
+        query = db.session.query(user_column, func.count(id_column)).filter(condition)
+        if user_ids is not None:
+            query = query.filter(user_column.in_(user_ids))
+
+        for user_id, count in query.group_by(user_column):
+            summary = counts.setdefault(user_id, {
+                'applications_submitted': 0,
+                'pending_applications': 0,
+                'status_updates': 0
+            })
+            summary[key] = count
+
+    return counts
+
+
+def build_daily_summaries(user_ids):
+    """
+    Build yesterday's summary for each of the given users
+
+    Counts come from grouped aggregates and the listed applications from one
+    query per section, so the number of queries does not grow with the batch.
+
+    Returns:
+        dict: user_id -> summary, only for users with something to report
+    """
+    start, end = get_summary_window()
+    summaries = get_summary_counts(start, end, user_ids)
+    if not summaries:
+        return {}
+
+    for summary in summaries.values():
+        summary['applications'] = []
+        summary['updates'] = []
+
+    details = (
+        ('applications', _submitted_filter(start, end), Application.applied_at),
+        ('updates', _status_update_filter(start, end), Application.last_status_update),
+    )
+    for key, condition, order in details:
+        rows = Application.query.filter(
+            Application.user_id.in_(list(summaries)),
+            condition
+        ).order_by(order.desc()).yield_per(500)
+
+        for app in rows:
+            listed = summaries[app.user_id][key]
+            if len(listed) < SUMMARY_DETAIL_LIMIT:
+                listed.append(app.to_dict())
+
+    return summaries
+
+
 @celery.task(name='app.tasks.notifications.send_status_update_email')
 def send_status_update_email(user_id, application_id):
     """
@@ -3,7 +3,7 @@ import re
 from flask import request
 
 
-def paginate_query(query, page=None, per_page=None):
+def paginate_query(query, page=None, per_page=None, serialize=None):
     """
     Paginate a SQLAlchemy query and return formatted results.
 
@@ -11,6 +11,7 @@ def paginate_query(query, page=None, per_page=None):
         query: SQLAlchemy query object
         page: Page number (default: from request args or 1)
         per_page: Items per page (default: from request args or 20)
+        serialize: Function turning an item into a dict (default: item.to_dict())
 
     Returns:
         dict: Pagination data including items, total, pages, etc.
@@ -28,8 +29,11 @@ def paginate_query(query, page=None, per_page=None):
     # Execute pagination
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
 
+    if serialize is None:
+        serialize = lambda item: item.to_dict() if hasattr(item, 'to_dict') else item
+
     return {
-        'items': [item.to_dict() if hasattr(item, 'to_dict') else item for item in pagination.items],
+        'items': [serialize(item) for item in pagination.items],
         'total': pagination.total,
         'page': pagination.page,
         'per_page': pagination.per_page,
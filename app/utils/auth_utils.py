@@ -1,8 +1,17 @@
 from datetime import datetime
 from functools import wraps
-from flask import jsonify
+from flask import jsonify, g
 from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity, verify_jwt_in_request
+from app import db
 from app.models import User
+from app.utils.cache import cached, cache_delete
+
+
+# Role and minimal profile of a user are cached this long between requests
+IDENTITY_CACHE_SECONDS = 60
+
+# Only these columns are loaded for authorization, never avatar_base64 or skills
+IDENTITY_COLUMNS = (User.id, User.email, User.role, User.full_name, User.email_verified)
 
 
 def generate_tokens(user_id):
@@ -37,6 +46,40 @@ def error_response(code, message, details=None, status_code=400):
     return jsonify(response), status_code
 
 
+def _identity_key(user_id):
+    return f'identity:{user_id}'
+
+
+def load_identity(user_id):
+    """
+    Return the role and minimal profile of a user, or None if the user does not exist
+
+    The result is kept on flask.g for the rest of the request and in Redis for
+    IDENTITY_CACHE_SECONDS, so authorization does not fetch the full user row.
+    Call invalidate_identity() whenever the role or these fields change.
+    """
+    identity = g.get('identity')
+    if identity is not None and identity['id'] == user_id:
+        return identity
+
+    def fetch():
+        row = db.session.query(*IDENTITY_COLUMNS).filter(User.id == user_id).first()
+        return dict(row._mapping) if row else None
+
+    identity = cached(_identity_key(user_id), IDENTITY_CACHE_SECONDS, fetch)
+    if identity is not None:
+        g.identity = identity
+    return identity
+
+
+def invalidate_identity(user_id):
+    """Forget the cached identity of a user after a role or profile change"""
+    cache_delete(_identity_key(user_id))
+    identity = g.get('identity')
+    if identity is not None and identity['id'] == user_id:
+        g.pop('identity')
+
+
 def admin_required(allowed_roles=None):
     """
     Decorator to require admin authentication for routes.
@@ -65,18 +108,18 @@ def admin_required(allowed_roles=None):
             # Get user ID from token
             user_id = get_jwt_identity()
 
-            # Get user from database
-            user = User.query.get(user_id)
+            # Get role and minimal profile (cached, handlers can reuse it via g.identity)
+            identity = load_identity(user_id)
 
-            if not user:
+            if not identity:
                 return error_response('USER_NOT_FOUND', 'User not found', status_code=404)
 
             # Check if user has required role
-            if user.role not in allowed_roles:
+            if identity['role'] not in allowed_roles:
                 return error_response(
                     'INSUFFICIENT_PERMISSIONS',
                     'You do not have permission to access this resource',
-                    details={'required_roles': allowed_roles, 'your_role': user.role},
+                    details={'required_roles': allowed_roles, 'your_role': identity['role']},
                     status_code=403
                 )
 
@@ -0,0 +1,103 @@
+"""
+Redis-backed caching helpers
+
+Everything here degrades to calling through when Redis is not configured or
+unreachable, so callers never have to handle cache errors themselves.
+"""
+import os
+import json
+import time
+
+
+# Skip Redis for this long after a connection failure instead of timing out on every call
+REDIS_RETRY_SECONDS = 30
+
+_client = None
+_disabled_until = 0
+
+
+def get_redis():
+    """Return a shared Redis client, or None if Redis is not configured or currently down"""
+    global _client
+
+    if time.monotonic() < _disabled_until:
+        return None
+
+    if _client is None:
+        redis_url = os.getenv('REDIS_URL') or os.getenv('CELERY_BROKER_URL')
+        if not redis_url or not redis_url.startswith(('redis://', 'rediss://')):
+            return None
+
+        import redis
+        _client = redis.from_url(redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+
+    return _client
+
+
+def _mark_unavailable(error):
+    """Stop using Redis for a while after an error"""
+    global _disabled_until
+    _disabled_until = time.monotonic() + REDIS_RETRY_SECONDS
+    print(f"[CACHE] Redis unavailable, bypassing cache for {REDIS_RETRY_SECONDS}s: {str(error)}")
+
+
+def cache_get(key):
+    """Return the JSON value stored under key, or None"""
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        raw = client.get(key)
+    except Exception as e:
+        _mark_unavailable(e)
+        return None
+
+    return json.loads(raw) if raw is not None else None
+
+
+def cache_set(key, value, ttl):
+    """Store a JSON-serialisable value under key for ttl seconds"""
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        client.set(key, json.dumps(value), ex=ttl)
+    except Exception as e:
+        _mark_unavailable(e)
+
+
+def cache_delete(*keys):
+    """Remove keys from the cache"""
+    client = get_redis()
+    if client is None or not keys:
+        return
+
+    try:
+        client.delete(*keys)
+    except Exception as e:
+        _mark_unavailable(e)
+
+
+def cached(key, ttl, compute, refresh=False):
+    """
+    Return the cached value for key, computing and storing it on a miss
+
+    Args:
+        key (str): Cache key
+        ttl (int): Seconds to keep a computed value
+        compute: Callable returning a JSON-serialisable value
+        refresh (bool): Ignore any cached value and recompute
+
+    Returns:
+        The cached or freshly computed value
+    """
+    if not refresh:
+        value = cache_get(key)
+        if value is not None:
+            return value
+
+    value = compute()
+    cache_set(key, value, ttl)
+    return value
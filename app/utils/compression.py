@@ -0,0 +1,122 @@
+"""
+Response compression (gzip, and brotli when installed)
+
+init_compression() registers an after_request hook that compresses responses
+the client accepts an encoding for, when they are text-like (COMPRESS_MIMETYPES)
+and at least COMPRESS_MIN_SIZE bytes. Streamed responses such as the n8n
+NDJSON export are compressed incrementally as they are sent. Responses that
+are already encoded, binary downloads and partial content are left alone.
+"""
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+DEFAULT_MIMETYPES = (
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'image/svg+xml',
+    'text/',
+)
+
+
+def choose_encoding(accept_encodings):
+    """Pick the best encoding the client accepts (br over gzip)"""
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+
+def make_compressor(encoding, level, brotli_quality):
+    """
+    Return (compress, flush) functions for an incremental compressor
+
+    gzip uses zlib with a gzip container (wbits 31) so chunks can be fed one at
+    a time; brotli uses its streaming Compressor.
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=brotli_quality)
+        return compressor.process, compressor.finish
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress, compressor.flush
+
+
+def compress(data, encoding, level=6, brotli_quality=4):
+    """Compress a complete body"""
+    compress_chunk, flush = make_compressor(encoding, level, brotli_quality)
+    return compress_chunk(data) + flush()
+
+
+def compress_stream(chunks, compress_chunk, flush):
+    """Compress an iterable of body chunks as they are produced"""
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            output = compress_chunk(chunk)
+            if output:
+                yield output
+        yield flush()
+    finally:
+        # Let the wrapped generator release its app context / cursors
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+def _is_compressible(response, mimetypes):
+    mimetype = response.mimetype or ''
+    return any(mimetype.startswith(allowed) if allowed.endswith('/') else mimetype == allowed
+               for allowed in mimetypes)
+
+
+def init_compression(app):
+    """Compress eligible responses of an app according to its COMPRESS_* config"""
+    from flask import request
+
+    if not app.config.get('COMPRESS_ENABLED', True):
+        return
+
+    min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+    level = app.config.get('COMPRESS_LEVEL', 6)
+    brotli_quality = app.config.get('COMPRESS_BROTLI_QUALITY', 4)
+    mimetypes = tuple(app.config.get('COMPRESS_MIMETYPES', DEFAULT_MIMETYPES))
+
+    @app.after_request
+    def compress_response(response):
+        if (request.method == 'HEAD'
+                or response.status_code < 200 or response.status_code in (204, 206, 304)
+                or 'Content-Encoding' in response.headers
+                or response.direct_passthrough
+                or not _is_compressible(response, mimetypes)):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = choose_encoding(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            compress_chunk, flush = make_compressor(encoding, level, brotli_quality)
+            response.response = compress_stream(response.response, compress_chunk, flush)
+            response.headers.pop('Content-Length', None)
+        else:
+            body = response.get_data()
+            if len(body) < min_size:
+                return response
+            response.set_data(compress(body, encoding, level, brotli_quality))
+
+        response.headers['Content-Encoding'] = encoding
+
+        # The compressed bytes are a different representation of the same data
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+        return response
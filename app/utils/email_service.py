@@ -3,9 +3,126 @@ Email notification service
 """
 import os
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from jinja2 import Template
+from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemBytecodeCache, FileSystemLoader
+
+
+class SMTPTransport:
+    """
+    Keeps an authenticated SMTP connection open and reuses it for many messages
+
+    One connection is held per thread (and per process, so prefork children
+    never share a socket inherited from the parent). Idle connections are
+    checked with NOOP before reuse and re-opened after a server-side disconnect.
+    """
+
+    def __init__(self, host, port, user, password, timeout=10, max_idle_seconds=60, max_messages_per_connection=500):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+        self.max_messages_per_connection = max_messages_per_connection
+        self._local = threading.local()
+
+    def _connect(self):
+        """Open and authenticate a new connection"""
+        # Use SMTP_SSL for port 465, regular SMTP with STARTTLS for port 587
+        if self.port == 465:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            server.starttls()
+        server.login(self.user, self.password)
+        return server
+
+    def _get_connection(self):
+        """Return a live connection for this thread, reconnecting when needed"""
+        local = self._local
+        server = getattr(local, 'server', None)
+
+        if server is not None and getattr(local, 'pid', None) != os.getpid():
+            # Inherited from the parent process, leave the socket to it
+            server = None
+        elif server is not None and local.sent >= self.max_messages_per_connection:
+            self.close()
+            server = None
+        elif server is not None and time.monotonic() - local.last_used > self.max_idle_seconds:
+            try:
+                server.noop()
+            except smtplib.SMTPException:
+                self.close()
+                server = None
+
+        if server is None:
+            server = self._connect()
+            local.server = server
+            local.pid = os.getpid()
+            local.sent = 0
+            local.last_used = time.monotonic()
+
+        return server
+
+    def send(self, msg):
+        """Send one message, reconnecting once if the server dropped the connection"""
+        for attempt in range(2):
+            server = self._get_connection()
+            try:
+                server.send_message(msg)
+                self._local.sent += 1
+                self._local.last_used = time.monotonic()
+                return
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        """Close this thread's connection"""
+        server = getattr(self._local, 'server', None)
+        self._local.server = None
+        if server is not None and getattr(self._local, 'pid', None) == os.getpid():
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+
+class EmailTemplates:
+    """
+    Compiles email templates once per process and keeps them in memory
+
+    Built-in templates are registered by name; when EMAIL_TEMPLATE_DIR is set,
+    files named <template_name>.html there take precedence. Compiled bytecode
+    is shared between processes through EMAIL_TEMPLATE_CACHE_DIR (the system
+    temp dir by default), and templates are only re-checked for changes when
+    FLASK_ENV is explicitly set to development.
+    """
+
+    def __init__(self, templates, template_dir=None, cache_dir=None, auto_reload=False):
+        loaders = []
+        if template_dir:
+            loaders.append(FileSystemLoader(template_dir))
+        loaders.append(DictLoader({f'{name}.html': source for name, source in templates.items()}))
+
+        self.env = Environment(
+            loader=ChoiceLoader(loaders),
+            bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else FileSystemBytecodeCache(),
+            auto_reload=auto_reload,
+            cache_size=-1
+        )
+
+    def get(self, template_name):
+        """Return the compiled template"""
+        return self.env.get_template(f'{template_name}.html')
+
+    def render(self, template_name, data):
+        """Render a template by name"""
+        return self.get(template_name).render(**data)
 
 
 class EmailService:
@@ -17,6 +134,26 @@ class EmailService:
         self.smtp_user = os.getenv('SMTP_USER')
         self.smtp_pass = os.getenv('SMTP_PASS')
         self.from_email = os.getenv('SMTP_FROM', 'noreply@devapply.com')
+        self.transport = SMTPTransport(self.smtp_host, self.smtp_port, self.smtp_user, self.smtp_pass)
+        self._templates = None
+
+    def _build_message(self, to, subject, html_content, text_content=None):
+        """Build a MIME message with an optional plain text part"""
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = self.from_email
+        msg['To'] = to
+
+        # Add text version if provided
+        if text_content:
+            text_part = MIMEText(text_content, 'plain')
+            msg.attach(text_part)
+
+        # Add HTML version
+        html_part = MIMEText(html_content, 'html')
+        msg.attach(html_part)
+
+        return msg
 
     def send_email(self, to, subject, html_content, text_content=None):
         """
@@ -32,36 +169,13 @@ class EmailService:
             bool: Success status
         """
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.from_email
-            msg['To'] = to
-
-            # Add text version if provided
-            if text_content:
-                text_part = MIMEText(text_content, 'plain')
-                msg.attach(text_part)
-
-            # Add HTML version
-            html_part = MIMEText(html_content, 'html')
-            msg.attach(html_part)
-
-            # Connect to SMTP server
+            msg = self._build_message(to, subject, html_content, text_content)
+
             if not self.smtp_user or not self.smtp_pass:
                 print(f"[Email] SMTP credentials not configured. Would send to {to}: {subject}")
                 return True  # Simulate success in dev
 
-            # Use SMTP_SSL for port 465, regular SMTP with STARTTLS for port 587
-            if self.smtp_port == 465:
-                with smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=10) as server:
-                    server.login(self.smtp_user, self.smtp_pass)
-                    server.send_message(msg)
-            else:
-                with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10) as server:
-                    server.starttls()
-                    server.login(self.smtp_user, self.smtp_pass)
-                    server.send_message(msg)
+            self.transport.send(msg)
 
             print(f"[Email] Sent to {to}: {subject}")
             return True
@@ -70,14 +184,45 @@ class EmailService:
             print(f"[Email] Error sending email: {str(e)}")
             return False
 
-    def send_daily_summary(self, user_email, data):
-        """Send daily summary email"""
-        subject = f"DevApply Daily Summary - {data['applications_submitted']} Applications"
+    def send_bulk(self, messages):
+        """
+        Send many emails over one reused SMTP connection
+
+        Args:
+            messages (iterable): dicts with to, subject, html_content and
+                optional text_content
 
-        html_content = self._render_template('daily_summary', data)
-        text_content = self._render_text_summary(data)
+        Returns:
+            dict: {'sent': int, 'failed': list of recipient emails}
+        """
+        sent = 0
+        failed = []
+
+        for message in messages:
+            if self.send_email(
+                message['to'],
+                message['subject'],
+                message['html_content'],
+                message.get('text_content')
+            ):
+                sent += 1
+            else:
+                failed.append(message['to'])
 
-        return self.send_email(user_email, subject, html_content, text_content)
+        return {'sent': sent, 'failed': failed}
+
+    def build_daily_summary(self, user_email, data):
+        """Build the daily summary message for send_email/send_bulk"""
+        return {
+            'to': user_email,
+            'subject': f"DevApply Daily Summary - {data['applications_submitted']} Applications",
+            'html_content': self._render_template('daily_summary', data),
+            'text_content': self._render_text_summary(data)
+        }
+
+    def send_daily_summary(self, user_email, data):
+        """Send daily summary email"""
+        return self.send_email(**self.build_daily_summary(user_email, data))
 
     def send_status_update(self, user_email, application_data):
         """Send application status update email"""
@@ -124,21 +269,25 @@ class EmailService:
 
     def _render_template(self, template_name, data):
         """Render email template"""
-        # Template mapping
-        templates = {
-            'daily_summary': DAILY_SUMMARY_TEMPLATE,
-            'status_update': STATUS_UPDATE_TEMPLATE,
-            'welcome': WELCOME_TEMPLATE,
-            'application_limit': APPLICATION_LIMIT_TEMPLATE,
-            'password_reset': PASSWORD_RESET_TEMPLATE,
-            'email_verification': EMAIL_VERIFICATION_TEMPLATE,
-            'account_deleted': ACCOUNT_DELETED_TEMPLATE
-        }
-
-        template_str = templates.get(template_name, '')
-        template = Template(template_str)
-
-        return template.render(**data)
+        if self._templates is None:
+            self._templates = EmailTemplates(
+                {
+                    'daily_summary': DAILY_SUMMARY_TEMPLATE,
+                    'status_update': STATUS_UPDATE_TEMPLATE,
+                    'welcome': WELCOME_TEMPLATE,
+                    'application_limit': APPLICATION_LIMIT_TEMPLATE,
+                    'password_reset': PASSWORD_RESET_TEMPLATE,
+                    'email_verification': EMAIL_VERIFICATION_TEMPLATE,
+                    'account_deleted': ACCOUNT_DELETED_TEMPLATE
+                },
+                template_dir=os.getenv('EMAIL_TEMPLATE_DIR'),
+                cache_dir=os.getenv('EMAIL_TEMPLATE_CACHE_DIR'),
+                # Opt-in: create_app() falls back to the development config when
+                # FLASK_ENV is unset, so app.debug cannot tell production apart
+                auto_reload=os.getenv('FLASK_ENV') == 'development'
+            )
+
+        return self._templates.render(template_name, data)
 
     def _render_text_summary(self, data):
         """Render plain text summary"""
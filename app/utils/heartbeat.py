@@ -0,0 +1,154 @@
+"""
+Worker and beat heartbeats in Redis
+
+Celery workers and the beat scheduler each run a small background thread that
+writes a heartbeat every HEARTBEAT_INTERVAL_SECONDS. /api/system/status reads
+them all back in a single Redis round trip instead of broadcasting
+celery.control.inspect() calls and waiting for replies.
+
+Keys:
+    heartbeat:workers   hash of worker hostname -> JSON heartbeat
+    heartbeat:beat      JSON heartbeat of the beat scheduler (expires with its TTL)
+"""
+import os
+import json
+import socket
+import threading
+from datetime import datetime
+
+from app.utils.cache import get_redis
+
+
+HEARTBEAT_INTERVAL_SECONDS = 15
+
+# A heartbeat older than this means the process is gone (or stuck)
+HEARTBEAT_TTL_SECONDS = 45
+
+WORKERS_KEY = 'heartbeat:workers'
+BEAT_KEY = 'heartbeat:beat'
+
+_stop = threading.Event()
+
+
+def _write_worker(hostname, info):
+    client = get_redis()
+    if client is None:
+        return
+    pipe = client.pipeline(transaction=False)
+    pipe.hset(WORKERS_KEY, hostname, json.dumps(info))
+    pipe.expire(WORKERS_KEY, HEARTBEAT_TTL_SECONDS)
+    pipe.execute()
+
+
+def _write_beat(info):
+    client = get_redis()
+    if client is None:
+        return
+    client.set(BEAT_KEY, json.dumps(info), ex=HEARTBEAT_TTL_SECONDS)
+
+
+def _run(write, info):
+    """Write a heartbeat now and then every HEARTBEAT_INTERVAL_SECONDS until stopped"""
+    while True:
+        info['at'] = datetime.utcnow().isoformat()
+        try:
+            write(info)
+        except Exception as e:
+            print(f"[HEARTBEAT] Failed to publish heartbeat: {str(e)}")
+        if _stop.wait(HEARTBEAT_INTERVAL_SECONDS):
+            return
+
+
+def _start(write, info):
+    _stop.clear()
+    thread = threading.Thread(target=_run, args=(write, info), name='heartbeat', daemon=True)
+    thread.start()
+
+
+def on_worker_ready(sender=None, **kwargs):
+    """worker_ready handler: start publishing this worker's heartbeat"""
+    hostname = getattr(sender, 'hostname', None) or socket.gethostname()
+    try:
+        queues = sorted(queue.name for queue in sender.task_consumer.queues)
+    except Exception:
+        queues = []
+
+    _start(lambda info: _write_worker(hostname, info), {
+        'hostname': hostname,
+        'pid': os.getpid(),
+        'queues': queues,
+        'started_at': datetime.utcnow().isoformat()
+    })
+
+
+def on_worker_shutdown(sender=None, **kwargs):
+    """worker_shutdown handler: stop the heartbeat and remove this worker"""
+    _stop.set()
+    hostname = getattr(sender, 'hostname', None)
+    client = get_redis()
+    if client is None or not hostname:
+        return
+    try:
+        client.hdel(WORKERS_KEY, hostname)
+    except Exception as e:
+        print(f"[HEARTBEAT] Failed to remove worker heartbeat: {str(e)}")
+
+
+def on_beat_init(sender=None, **kwargs):
+    """beat_init handler: start publishing the scheduler's heartbeat"""
+    _start(_write_beat, {
+        'hostname': socket.gethostname(),
+        'pid': os.getpid(),
+        'started_at': datetime.utcnow().isoformat()
+    })
+
+
+def register_heartbeat_signals():
+    """Publish heartbeats from any worker or beat process started from this app"""
+    from celery import signals
+
+    signals.worker_ready.connect(on_worker_ready, weak=False)
+    signals.worker_shutdown.connect(on_worker_shutdown, weak=False)
+    signals.beat_init.connect(on_beat_init, weak=False)
+
+
+def _age_seconds(heartbeat, now):
+    return (now - datetime.fromisoformat(heartbeat['at'])).total_seconds()
+
+
+def read_heartbeats(client):
+    """
+    Return the live workers and beat scheduler from their heartbeats
+
+    Args:
+        client: Redis client (errors are left to the caller)
+
+    Returns:
+        dict: {'workers': [heartbeat, ...], 'beat': heartbeat or None}, each
+        heartbeat with its 'age_seconds'; stale entries are left out
+    """
+    pipe = client.pipeline(transaction=False)
+    pipe.hgetall(WORKERS_KEY)
+    pipe.get(BEAT_KEY)
+    workers_raw, beat_raw = pipe.execute()
+
+    now = datetime.utcnow()
+    workers, stale = [], []
+    for hostname, raw in workers_raw.items():
+        heartbeat = json.loads(raw)
+        heartbeat['age_seconds'] = round(_age_seconds(heartbeat, now), 1)
+        if heartbeat['age_seconds'] <= HEARTBEAT_TTL_SECONDS:
+            workers.append(heartbeat)
+        else:
+            stale.append(hostname)
+
+    # Workers that died without a clean shutdown
+    if stale:
+        client.hdel(WORKERS_KEY, *stale)
+
+    beat = None
+    if beat_raw is not None:
+        beat = json.loads(beat_raw)
+        beat['age_seconds'] = round(_age_seconds(beat, now), 1)
+
+    return {'workers': sorted(workers, key=lambda w: w['hostname']), 'beat': beat}
@@ -0,0 +1,152 @@
+"""
+Conditional GET caching for rarely changing endpoints
+
+http_cached() gives a GET endpoint an ETag, answers a matching If-None-Match
+with 304 Not Modified and keeps recently served bodies in a small per-process
+LRU. Entries are keyed by a version token (usually the updated_at of the row
+the endpoint renders), so a write produces a new key without any coordination
+between processes; invalidate_http_cache() also drops this process's copies
+straight away. Endpoints without a version column rely on max_age instead.
+"""
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+from flask import request, current_app
+from flask_jwt_extended import get_jwt_identity
+
+
+HTTP_CACHE_MAX_ENTRIES = 512
+
+# Larger bodies still get an ETag but are not kept in memory
+HTTP_CACHE_MAX_BODY_BYTES = 256 * 1024
+
+# How long an unversioned (max_age=0) entry may be reused before rebuilding it
+DEFAULT_ENTRY_SECONDS = 300
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+
+
+def _lookup(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            return None
+        if entry['expires_at'] <= time.monotonic():
+            del _entries[key]
+            return None
+        _entries.move_to_end(key)
+        return entry
+
+
+def _store(key, entry):
+    with _lock:
+        _entries[key] = entry
+        _entries.move_to_end(key)
+        while len(_entries) > HTTP_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def invalidate_http_cache(namespace, scope=None):
+    """Drop cached bodies of a namespace (optionally only one user's) in this process"""
+    with _lock:
+        for key in [key for key in _entries if key[0] == namespace and (scope is None or key[1] == scope)]:
+            del _entries[key]
+
+
+def compute_etag(payload):
+    """Strong ETag over the response data, ignoring the per-response meta timestamp"""
+    data = payload.get('data', payload) if isinstance(payload, dict) else payload
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+def _not_modified(etag, cache_control, vary):
+    response = current_app.response_class(status=304)
+    _set_headers(response, etag, cache_control, vary)
+    return response
+
+
+def _set_headers(response, etag, cache_control, vary):
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    if vary:
+        response.vary.add('Authorization')
+
+
+def http_cached(namespace, version=None, per_user=False, public=False, max_age=0):
+    """
+    Serve a GET endpoint with ETag/If-None-Match and a per-process body cache
+
+    Args:
+        namespace (str): Name used for keys and invalidate_http_cache()
+        version: Function (called with the view's kwargs and the user id when
+            per_user) returning a token that changes whenever the response
+            would, e.g. a row's updated_at. None for data that only changes
+            with a deploy or rarely enough for max_age to cover it.
+        per_user (bool): Response depends on the authenticated user (place
+            below @jwt_required())
+        public (bool): Allow shared caches (Cache-Control: public, max-age);
+            otherwise responses are private and revalidated on every use
+        max_age (int): Seconds clients and entries may reuse a response
+
+    Usage:
+        @bp.route('', methods=['GET'])
+        @jwt_required()
+        @http_cached('preferences', version=preferences_version, per_user=True)
+        def get_preferences():
+            ...
+    """
+    if public:
+        cache_control = f'public, max-age={max_age}'
+    else:
+        cache_control = f'private, max-age={max_age}, must-revalidate' if max_age else 'private, no-cache'
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return fn(*args, **kwargs)
+
+            scope = get_jwt_identity() if per_user else None
+            if version is None:
+                token = None
+            elif per_user:
+                token = version(scope, **kwargs)
+            else:
+                token = version(**kwargs)
+            key = (namespace, scope, str(token), request.query_string)
+
+            entry = _lookup(key)
+            if entry is None:
+                result = fn(*args, **kwargs)
+                response = current_app.make_response(result)
+                if response.status_code != 200 or not response.is_json:
+                    return response
+
+                etag = compute_etag(response.get_json())
+                body = response.get_data()
+                if len(body) <= HTTP_CACHE_MAX_BODY_BYTES:
+                    _store(key, {
+                        'body': body,
+                        'etag': etag,
+                        'mimetype': response.mimetype,
+                        'expires_at': time.monotonic() + (max_age or DEFAULT_ENTRY_SECONDS)
+                    })
+            else:
+                response = None
+                etag = entry['etag']
+
+            if request.if_none_match.contains_weak(etag):
+                return _not_modified(etag, cache_control, not public)
+
+            if response is None:
+                response = current_app.response_class(entry['body'], mimetype=entry['mimetype'])
+            _set_headers(response, etag, cache_control, not public)
+            return response
+
+        return wrapper
+    return decorator
@@ -1,7 +1,4 @@
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
 
 
 def extract_keywords(text):
@@ -25,6 +22,10 @@ def calculate_keyword_match(user_keywords, job_text):
         return 0.0
 
     try:
+        # scikit-learn takes about a second to import; load it on first match, not at worker boot
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
         # Combine user keywords into a single string
         user_text = ' '.join(user_keywords)
 
@@ -88,10 +89,26 @@ def job_salary_meets_minimum(job_listing, min_salary):
     return job_min_salary >= min_salary
 
 
-def calculate_match_score(job_listing, user_config, user_skills):
+def calculate_overlap_match(user_keywords, job_text):
+    """Calculate keyword match score as the share of user keywords found in the job text"""
+    if not user_keywords or not job_text:
+        return 0.0
+
+    job_words = set(extract_keywords(job_text))
+    user_words = {keyword.lower() for keyword in user_keywords if keyword}
+    if not user_words:
+        return 0.0
+
+    return len(user_words & job_words) / len(user_words) * 100
+
+
+def calculate_match_score(job_listing, user_config, user_skills, ai_matching=True):
     """
     Calculate how well a job matches user preferences
     Returns a score from 0-100
+
+    With ai_matching=False (the ai_matching_enabled setting is off) keywords
+    are matched by plain overlap instead of TF-IDF similarity.
     """
     score = 0
     weights = {
@@ -106,7 +123,8 @@ def calculate_match_score(job_listing, user_config, user_skills):
     if user_config.primary_keywords or user_skills:
         all_keywords = (user_config.primary_keywords or []) + (user_skills or [])
         job_text = f"{job_listing.description or ''} {job_listing.requirements or ''}"
-        keyword_score = calculate_keyword_match(all_keywords, job_text)
+        match = calculate_keyword_match if ai_matching else calculate_overlap_match
+        keyword_score = match(all_keywords, job_text)
         score += (keyword_score / 100) * weights['keywords']
 
     # 2. Location matching (20%)
@@ -138,12 +156,12 @@ def calculate_match_score(job_listing, user_config, user_skills):
     return min(100.0, max(0.0, score))  # Ensure score is between 0-100
 
 
-def should_apply_to_job(job_listing, user_config, user_skills, threshold=70.0):
+def should_apply_to_job(job_listing, user_config, user_skills, threshold=70.0, ai_matching=True):
     """
     Determine if we should apply to this job
     Returns (should_apply: bool, match_score: float, reasons: list)
     """
-    match_score = calculate_match_score(job_listing, user_config, user_skills)
+    match_score = calculate_match_score(job_listing, user_config, user_skills, ai_matching=ai_matching)
 
     reasons = []
 
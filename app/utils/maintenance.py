@@ -0,0 +1,46 @@
+"""
+Maintenance mode
+
+init_maintenance_mode() registers a before_request hook that answers API
+requests with 503 MAINTENANCE_MODE while Settings.maintenance_mode is on.
+The flag comes from the per-process settings snapshot (Settings.current()),
+so the check costs no query per request. Admin and auth routes stay open so
+an admin can sign in and switch maintenance off again, and so do the health
+and status endpoints used by monitoring.
+"""
+
+EXEMPT_PREFIXES = (
+    '/health',
+    '/api/system/status',
+    '/api/admin',
+    '/api/auth',
+)
+
+
+def init_maintenance_mode(app):
+    """Reject API requests while maintenance mode is switched on in the settings"""
+    from flask import request
+    from app.models.settings import Settings
+    from app.utils.auth_utils import error_response
+
+    @app.before_request
+    def check_maintenance_mode():
+        if request.method == 'OPTIONS' or not request.path.startswith('/api/'):
+            return None
+        if request.path.startswith(EXEMPT_PREFIXES):
+            return None
+
+        try:
+            settings = Settings.current()
+        except Exception as e:
+            # Serve the request rather than fail everything when settings cannot be read
+            print(f"[MAINTENANCE] Could not read settings: {str(e)}")
+            return None
+
+        if settings.maintenance_mode:
+            return error_response(
+                'MAINTENANCE_MODE',
+                settings.maintenance_message or 'The service is down for maintenance, please try again later',
+                status_code=503
+            )
+        return None
@@ -0,0 +1,153 @@
+"""
+Offset and keyset (cursor) pagination for list endpoints
+"""
+import base64
+import json
+from datetime import datetime
+from flask import request
+from sqlalchemy import and_, false, or_, text
+from app import db
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a ?cursor= value cannot be decoded"""
+
+
+def encode_cursor(values):
+    """Encode the sort key values of the last row into an opaque cursor"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, keys):
+    """Decode a cursor back into values for the given sort keys"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError('wrong number of values')
+
+        return [
+            datetime.fromisoformat(value) if isinstance(column.type, db.DateTime) and value is not None else value
+            for (column, _), value in zip(keys, values)
+        ]
+    except (ValueError, TypeError):
+        raise InvalidCursorError('Invalid or expired cursor')
+
+
+def order_by_keys(keys):
+    """
+    ORDER BY clauses for the sort keys
+
+    NULLs sort as the largest value (last ascending, first descending), which
+    is PostgreSQL's default and so keeps the existing indexes usable; it is
+    spelled out so SQLite orders them the same way.
+    """
+    return [column.desc().nulls_first() if descending else column.asc().nulls_last()
+            for column, descending in keys]
+
+
+def _equal(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _after(column, descending, value):
+    """Rows of one key that come after value in order_by_keys() order, or None when none can"""
+    if value is None:
+        # NULLs are last ascending, so only descending keys have rows after them
+        return column.isnot(None) if descending else None
+    if descending:
+        return column < value
+    if column.nullable:
+        return or_(column > value, column.is_(None))
+    return column > value
+
+
+def keyset_filter(keys, values):
+    """
+    Build the WHERE clause selecting rows after the cursor position
+
+    Expands to (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... with the comparison
+    flipped for descending keys, so mixed sort directions are supported.
+    Nullable keys compare with IS NULL / IS NOT NULL as ordered by
+    order_by_keys(), so a cursor on a row with a NULL key still moves forward.
+    """
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        after = _after(column, descending, values[i])
+        if after is None:
+            continue
+        equal_prefix = [_equal(keys[j][0], values[j]) for j in range(i)]
+        clauses.append(and_(*equal_prefix, after))
+    return or_(false(), *clauses)
+
+
+def estimate_count(query):
+    """
+    Estimate the row count of a query from the planner instead of counting
+
+    Falls back to an exact count on databases other than PostgreSQL.
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return query.count()
+
+    statement = query.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True})
+    plan = db.session.execute(text(f'EXPLAIN (FORMAT JSON) {statement}')).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def paginate(query, keys, limit):
+    """
+    Paginate a query by page number or, when ?cursor= is given, by keyset
+
+    Page mode keeps the page/limit/total/pages contract. Cursor mode (send an
+    empty ?cursor= for the first page) seeks past the previous page's last row
+    instead of using OFFSET, skips the COUNT unless ?include_total=exact or
+    ?include_total=approx is requested, and returns next_cursor.
+
+    Args:
+        query: SQLAlchemy query object without ORDER BY
+        keys: List of (column, descending) ending in a unique column such as id
+        limit (int): Page size
+
+    Returns:
+        tuple: (items, pagination dict)
+    """
+    query = query.order_by(*order_by_keys(keys))
+
+    cursor = request.args.get('cursor')
+    if cursor is None:
+        page = max(1, request.args.get('page', 1, type=int))
+        total = query.count()
+        items = query.offset((page - 1) * limit).limit(limit).all()
+
+        return items, {
+            'page': page,
+            'limit': limit,
+            'total': total,
+            'pages': (total + limit - 1) // limit
+        }
+
+    include_total = request.args.get('include_total')
+    pagination = {'limit': limit}
+    if include_total == 'exact':
+        pagination['total'] = query.order_by(None).count()
+    elif include_total == 'approx':
+        pagination['total'] = estimate_count(query.order_by(None))
+        pagination['total_is_estimate'] = True
+
+    if cursor:
+        query = query.filter(keyset_filter(keys, decode_cursor(cursor, keys)))
+
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+    has_more = len(rows) > limit
+
+    pagination['has_more'] = has_more
+    pagination['next_cursor'] = encode_cursor(
+        [getattr(items[-1], column.key) for column, _ in keys]
+    ) if has_more else None
+
+    return items, pagination
@@ -1,7 +1,10 @@
 import os
 from datetime import datetime, timedelta
+from sqlalchemy import func
 from app import db
 from app.models.application import Application
+from app.models.stats import ApplicationDailyStat
+from app.models.settings import Settings
 
 
 class ApplicationRateLimiter:
@@ -48,6 +51,16 @@ class ApplicationRateLimiter:
             Application.applied_at >= cutoff
         ).count()
 
+    @classmethod
+    def get_recent_applications_all_platforms(cls, user_id, hours=24):
+        """Get applications on any platform from the last N hours"""
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+
+        return Application.query.filter(
+            Application.user_id == user_id,
+            Application.applied_at >= cutoff
+        ).count()
+
     @classmethod
     def get_last_application_time(cls, user_id, platform):
         """Get the timestamp of the last application"""
@@ -76,6 +89,11 @@ class ApplicationRateLimiter:
         if apps_last_day >= limits['max_per_day']:
             return False, f"Daily limit reached ({limits['max_per_day']} applications/day)", 86400
 
+        # Check the admin-configured daily limit across all platforms
+        max_per_user_per_day = Settings.current().max_applications_per_user_per_day
+        if max_per_user_per_day and cls.get_recent_applications_all_platforms(user_id, hours=24) >= max_per_user_per_day:
+            return False, f"Daily limit reached ({max_per_user_per_day} applications/day across all platforms)", 86400
+
         # Check minimum delay between applications
         last_app_time = cls.get_last_application_time(user_id, platform)
         if last_app_time:
@@ -126,5 +144,7 @@ class ApplicationRateLimiter:
         return {
             'last_hour': apps_last_hour,
             'last_day': apps_last_day,
-            'total': Application.query.filter_by(user_id=user_id).count()
+            'total': db.session.query(
+                func.coalesce(func.sum(ApplicationDailyStat.count), 0)
+            ).filter(ApplicationDailyStat.user_id == user_id).scalar()
         }
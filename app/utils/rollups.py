@@ -0,0 +1,264 @@
+"""
+Incrementally maintained application and job queue statistics
+
+Every flush that inserts, deletes or changes the status of an Application or
+JobQueue row adjusts application_daily_stats and queue_status_counts in the
+same transaction, so stats endpoints read a handful of pre-aggregated rows
+instead of counting the raw tables. Bulk UPDATE/DELETE statements bypass the
+ORM and report their own changes with record_queue_transition(). The tables
+can be rebuilt from scratch with rebuild_rollups() (scripts/backfill_stats.py).
+"""
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import event, inspect, func, delete, insert, true
+from app import db
+from app.models.user import User
+from app.models.application import Application
+from app.models.job_queue import JobQueue
+from app.models.stats import ApplicationDailyStat, QueueStatusCount
+
+
+# Column defaults are not applied yet when before_flush runs
+DEFAULT_APPLICATION_STATUS = 'sent'
+DEFAULT_QUEUE_STATUS = 'pending'
+
+PENDING_KEY = 'rollup_deltas'
+
+
+def _application_key(application, applied_at, status=None, platform=None):
+    """
+    Counter of an application applied at applied_at, or None when applied_at is
+    NULL: such rows are not counted, the same as in rebuild_rollups()
+    """
+    if applied_at is None:
+        return None
+    return (
+        ApplicationDailyStat,
+        (
+            application.user_id,
+            applied_at.date(),
+            platform or application.platform,
+            status or application.status or DEFAULT_APPLICATION_STATUS
+        )
+    )
+
+
+def _queue_key(queue_item, status=None, platform=None):
+    return (
+        QueueStatusCount,
+        (
+            queue_item.user_id,
+            platform or queue_item.platform,
+            status or queue_item.status or DEFAULT_QUEUE_STATUS
+        )
+    )
+
+
+def _previous(obj, attribute):
+    """Return the value an attribute had before this flush"""
+    history = inspect(obj).attrs[attribute].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(obj, attribute)
+
+
+def collect_deltas(session, flush_context, instances):
+    """before_flush: work out which counters this flush changes"""
+    deltas = Counter()
+    deleted_users = {obj.id for obj in session.deleted if isinstance(obj, User)}
+
+    for obj in session.new:
+        if isinstance(obj, Application):
+            # A None applied_at is filled in by the column default on INSERT
+            deltas[_application_key(obj, obj.applied_at or datetime.utcnow())] += 1
+        elif isinstance(obj, JobQueue):
+            deltas[_queue_key(obj)] += 1
+
+    for obj in session.deleted:
+        # Counters of deleted users go away with them (ON DELETE CASCADE)
+        if getattr(obj, 'user_id', None) in deleted_users:
+            continue
+        if isinstance(obj, Application):
+            deltas[_application_key(
+                obj,
+                _previous(obj, 'applied_at'),
+                status=_previous(obj, 'status'),
+                platform=_previous(obj, 'platform')
+            )] -= 1
+        elif isinstance(obj, JobQueue):
+            deltas[_queue_key(obj, status=_previous(obj, 'status'), platform=_previous(obj, 'platform'))] -= 1
+
+    for obj in session.dirty:
+        if isinstance(obj, Application):
+            attributes = ('status', 'platform', 'applied_at')
+        elif isinstance(obj, JobQueue):
+            attributes = ('status', 'platform')
+        else:
+            continue
+
+        state = inspect(obj)
+        if not any(state.attrs[attribute].history.has_changes() for attribute in attributes):
+            continue
+
+        if isinstance(obj, Application):
+            deltas[_application_key(
+                obj,
+                _previous(obj, 'applied_at'),
+                status=_previous(obj, 'status'),
+                platform=_previous(obj, 'platform')
+            )] -= 1
+            deltas[_application_key(obj, obj.applied_at)] += 1
+        else:
+            deltas[_queue_key(obj, status=_previous(obj, 'status'), platform=_previous(obj, 'platform'))] -= 1
+            deltas[_queue_key(obj)] += 1
+
+    # Applications without applied_at are not counted
+    deltas.pop(None, None)
+
+    pending = session.info.setdefault(PENDING_KEY, Counter())
+    pending.update(deltas)
+
+
+def apply_deltas(session, flush_context):
+    """after_flush: write the collected changes in the flush's transaction"""
+    deltas = session.info.pop(PENDING_KEY, None)
+    if deltas:
+        increment_counters(session.connection(), deltas)
+
+
+def discard_deltas(session, *args):
+    """Drop changes collected for a flush that did not complete"""
+    session.info.pop(PENDING_KEY, None)
+
+
+def increment_counters(connection, deltas):
+    """
+    Add deltas to the counter rows, creating missing rows
+
+    Args:
+        connection: Connection in the transaction that made the changes
+        deltas: Mapping of (model, primary key tuple) -> change in count
+    """
+    dialect = connection.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as upsert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as upsert
+    else:
+        upsert = None
+
+    now = datetime.utcnow()
+    for (model, key), delta in deltas.items():
+        if not delta:
+            continue
+
+        key_columns = [column.name for column in model.__table__.primary_key.columns]
+        values = dict(zip(key_columns, key))
+
+        if upsert is not None:
+            statement = upsert(model.__table__).values(count=delta, updated_at=now, **values)
+            connection.execute(statement.on_conflict_do_update(
+                index_elements=key_columns,
+                set_={'count': model.__table__.c.count + delta, 'updated_at': now}
+            ))
+            continue
+
+        table = model.__table__
+        where = [table.c[name] == value for name, value in values.items()]
+        result = connection.execute(
+            table.update().where(*where).values(count=table.c.count + delta, updated_at=now)
+        )
+        if not result.rowcount:
+            connection.execute(table.insert().values(count=delta, updated_at=now, **values))
+
+
+def record_queue_transition(user_id, platform, old_status, new_status, count=1):
+    """Report status changes made by bulk UPDATE statements (caller commits)"""
+    if not count or old_status == new_status:
+        return
+
+    deltas = Counter()
+    if old_status is not None:
+        deltas[(QueueStatusCount, (user_id, platform, old_status))] -= count
+    if new_status is not None:
+        deltas[(QueueStatusCount, (user_id, platform, new_status))] += count
+    increment_counters(db.session.connection(), deltas)
+
+
+# Attributes that decide which counter a row belongs to
+TRACKED_ATTRIBUTES = (
+    Application.status, Application.platform, Application.applied_at,
+    JobQueue.status, JobQueue.platform,
+)
+
+
+def _load_previous_value(target, value, oldvalue, initiator):
+    """Set listener registered only so the old value is loaded before it is replaced"""
+    return value
+
+
+def register_rollup_listeners():
+    """Hook counter maintenance into every database session"""
+    session = db.session
+    if event.contains(session, 'before_flush', collect_deltas):
+        return
+
+    # Objects are expired after commit, without this an assignment would not
+    # record what it replaced and the old counter could not be decremented
+    for attribute in TRACKED_ATTRIBUTES:
+        event.listen(attribute, 'set', _load_previous_value, active_history=True, retval=True)
+
+    event.listen(session, 'before_flush', collect_deltas)
+    event.listen(session, 'after_flush', apply_deltas)
+    event.listen(session, 'after_rollback', discard_deltas)
+
+
+def rebuild_rollups(user_ids=None):
+    """
+    Recompute the counter tables from applications and job_queue
+
+    Args:
+        user_ids: Only rebuild these users (default: everyone)
+
+    Returns:
+        dict: Rows written per table
+    """
+    written = {}
+    sources = (
+        (ApplicationDailyStat, Application, Application.applied_at.isnot(None), [
+            Application.user_id,
+            func.date(Application.applied_at),
+            Application.platform,
+            func.coalesce(Application.status, DEFAULT_APPLICATION_STATUS)
+        ]),
+        (QueueStatusCount, JobQueue, true(), [
+            JobQueue.user_id,
+            JobQueue.platform,
+            func.coalesce(JobQueue.status, DEFAULT_QUEUE_STATUS)
+        ]),
+    )
+
+    for rollup, source, condition, group_columns in sources:
+        clear = delete(rollup)
+        query = db.session.query(*group_columns, func.count(source.id)).filter(condition)
+        if user_ids is not None:
+            clear = clear.where(rollup.user_id.in_(user_ids))
+            query = query.filter(source.user_id.in_(user_ids))
+
+        db.session.execute(clear)
+
+        key_columns = [column.name for column in rollup.__table__.primary_key.columns]
+        rows = []
+        for row in query.group_by(*group_columns):
+            values = dict(zip(key_columns, row[:-1]))
+            if rollup is ApplicationDailyStat and isinstance(values['day'], str):
+                # SQLite's date() returns text
+                values['day'] = datetime.strptime(values['day'], '%Y-%m-%d').date()
+            rows.append({**values, 'count': row[-1], 'updated_at': datetime.utcnow()})
+
+        if rows:
+            db.session.execute(insert(rollup), rows)
+        db.session.commit()
+        written[rollup.__tablename__] = len(rows)
+
+    return written
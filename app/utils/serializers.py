@@ -0,0 +1,85 @@
+"""
+Field-list serializers for list endpoints
+
+Each serializer declares the fields a model exposes once; list endpoints dump
+only the fields named in ?fields= (all default fields when it is absent).
+Datetimes are returned as-is and encoded by the app's JSON provider, so no
+per-field isoformat() calls are needed.
+"""
+from operator import attrgetter
+from flask import request
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when ?fields= names a field the serializer does not have"""
+
+
+class Serializer:
+    """
+    Turn model instances into dicts from a declared list of fields
+
+    Args:
+        fields: Attribute names, or (name, getter) pairs for computed fields
+        extra: Fields only emitted when requested by name
+    """
+
+    def __init__(self, fields, extra=()):
+        self.getters = {}
+        for field in list(fields) + list(extra):
+            name, getter = field if isinstance(field, tuple) else (field, attrgetter(field))
+            self.getters[name] = getter
+        self.default_fields = tuple(field[0] if isinstance(field, tuple) else field for field in fields)
+
+    def fields_from_request(self):
+        """
+        Return the field names requested with ?fields=a,b,c, or None for the defaults
+
+        Raises:
+            InvalidFieldsError: If an unknown field is requested
+        """
+        raw = request.args.get('fields')
+        if not raw:
+            return None
+
+        fields = tuple(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+        unknown = [name for name in fields if name not in self.getters]
+        if unknown:
+            raise InvalidFieldsError(
+                f'Unknown field(s): {", ".join(unknown)}. Available: {", ".join(self.getters)}'
+            )
+        return fields
+
+    def dump_many(self, objects, fields=None):
+        """Serialize a list of objects, resolving the getters once"""
+        getters = [(name, self.getters[name]) for name in (fields or self.default_fields)]
+        return [{name: getter(obj) for name, getter in getters} for obj in objects]
+
+    def dump(self, obj, fields=None):
+        """Serialize one object"""
+        return self.dump_many([obj], fields)[0]
+
+
+job_listing_serializer = Serializer([
+    'id', 'platform', 'external_id', 'company_name', 'job_title', 'location', 'salary_range',
+    'job_type', 'description', 'requirements', 'job_url', 'posted_date', 'scraped_at', 'is_active',
+])
+
+application_serializer = Serializer([
+    'id', 'user_id', 'company_name', 'job_title', 'job_type', 'location', 'salary_range', 'status',
+    'platform', 'job_url', 'applied_at', 'last_status_update', 'resume_used_id', 'cover_letter', 'notes',
+])
+
+job_queue_serializer = Serializer([
+    'id', 'user_id', 'job_search_config_id', 'platform', 'company_name', 'job_title', 'job_url',
+    'status', 'priority', 'match_score', 'scheduled_for', 'attempted_at', 'completed_at',
+    'error_message', 'retry_count', 'max_retries', 'created_at',
+], extra=[
+    # Requires a query that loads listings (JobQueue.with_listing()); the relationship is lazy='raise'
+    ('job_listing', lambda item: job_listing_serializer.dump(item.job_listing) if item.job_listing else None),
+])
+
+automation_log_serializer = Serializer([
+    'id', 'user_id', 'job_queue_id', 'action_type', 'status', 'message',
+    ('details', lambda log: log.details or {}),
+    'created_at',
+])
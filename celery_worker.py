@@ -19,15 +19,12 @@ app = create_app()
 # Create Celery instance with Flask context
 celery = make_celery(app)
 
-# Import all tasks to register them
-from app.tasks import job_scraper, job_applicator, status_checker, notifications, cleanup, immediate_applicator
-
-# Log registered tasks
+# Task modules are imported by the worker from make_celery(include=...); heavy
+# dependencies they use (scikit-learn, Selenium, BeautifulSoup) load on first use.
+# `celery -A celery_worker.celery inspect registered` lists the registered tasks.
 print("=" * 80)
 print("CELERY WORKER STARTING")
 print("=" * 80)
-print(f"Registered tasks: {list(celery.tasks.keys())}")
-print("=" * 80)
 
 if __name__ == '__main__':
     celery.start()
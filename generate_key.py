@@ -16,7 +16,8 @@ if __name__ == '__main__':
     print("="*60)
     print("\nCopy this key to your .env file:")
     print("CREDENTIALS_ENCRYPTION_KEY=" + key.decode())
-    print("\n⚠️  WARNING: DO NOT change this key after users have")
+    print("\n⚠️  WARNING: DO NOT drop the old key after users have")
     print("   stored platform credentials, or their credentials")
-    print("   will become unreadable!")
+    print("   will become unreadable! To rotate, move the old key")
+    print("   to CREDENTIALS_ENCRYPTION_OLD_KEYS (comma-separated).")
     print("="*60 + "\n")
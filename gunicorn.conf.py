@@ -0,0 +1,21 @@
+"""
+Gunicorn settings, loaded automatically from the working directory
+
+Flags passed on the command line (scripts/start-web.sh, Dockerfile, Procfile)
+take precedence. WEB_PRELOAD=true imports the app once in the master before
+forking the workers: workers boot faster and share the imported code's memory,
+but a code change needs a full restart rather than a HUP.
+"""
+import os
+
+preload_app = os.getenv('WEB_PRELOAD', 'false').lower() == 'true'
+
+
+def post_fork(server, worker):
+    """Give each preloaded worker its own database connections"""
+    if not server.cfg.preload_app:
+        return
+
+    from run import app
+    from app import dispose_engines
+    dispose_engines(app)
@@ -0,0 +1,31 @@
+"""Add indexes used by the cleanup task
+
+Revision ID: 20251123_cleanup_indexes
+Revises: 20251122_add_cookies
+Create Date: 2025-11-23 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20251123_cleanup_indexes'
+down_revision = '20251122_add_cookies'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Old listings are selected by scraped_at in chunks
+    op.create_index('ix_job_listings_scraped_at', 'job_listings', ['scraped_at'], unique=False)
+    # Lets ON DELETE SET NULL find referencing queue items without scanning job_queue
+    op.create_index('ix_job_queue_job_listing_id', 'job_queue', ['job_listing_id'], unique=False)
+    # Same for automation_logs.job_queue_id (ON DELETE SET NULL) when queue items are deleted
+    op.create_index('ix_automation_logs_job_queue_id', 'automation_logs', ['job_queue_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_automation_logs_job_queue_id', table_name='automation_logs')
+    op.drop_index('ix_job_queue_job_listing_id', table_name='job_queue')
+    op.drop_index('ix_job_listings_scraped_at', table_name='job_listings')
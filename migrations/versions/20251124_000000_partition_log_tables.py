@@ -0,0 +1,127 @@
+"""Partition automation_logs and activity_logs by month
+
+Revision ID: 20251124_partition_logs
+Revises: 20251123_cleanup_indexes
+Create Date: 2025-11-24 00:00:00.000000
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20251124_partition_logs'
+down_revision = '20251123_cleanup_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Partitions created past the current month, app.tasks.cleanup keeps this window rolling
+MONTHS_AHEAD = 3
+
+PARTITIONED_TABLES = {
+    'automation_logs': {
+        'indexes': {
+            'ix_automation_logs_user_id': 'user_id',
+            'ix_automation_logs_action_type': 'action_type',
+            'ix_automation_logs_job_queue_id': 'job_queue_id',
+            'ix_automation_logs_created_at': 'created_at',
+        },
+        'foreign_keys': [
+            ('automation_logs_user_id_fkey', 'user_id', 'users', 'CASCADE'),
+            ('automation_logs_job_queue_id_fkey', 'job_queue_id', 'job_queue', 'SET NULL'),
+        ],
+    },
+    'activity_logs': {
+        'indexes': {
+            'ix_activity_logs_admin_id': 'admin_id',
+            'ix_activity_logs_action': 'action',
+            'ix_activity_logs_created_at': 'created_at',
+        },
+        'foreign_keys': [
+            ('activity_logs_admin_id_fkey', 'admin_id', 'users', None),
+        ],
+    },
+}
+
+
+def _add_months(month_start, months):
+    month = month_start.month - 1 + months
+    return month_start.replace(year=month_start.year + month // 12, month=month % 12 + 1)
+
+
+def _create_indexes_and_keys(table, spec):
+    for name, column in spec['indexes'].items():
+        op.execute(f'CREATE INDEX {name} ON {table} ({column})')
+    for name, column, referenced, ondelete in spec['foreign_keys']:
+        on_delete = f' ON DELETE {ondelete}' if ondelete else ''
+        op.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {name} '
+            f'FOREIGN KEY ({column}) REFERENCES {referenced} (id){on_delete}'
+        )
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # Declarative partitioning is PostgreSQL only, other databases keep plain tables
+        return
+
+    this_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    for table, spec in PARTITIONED_TABLES.items():
+        legacy = f'{table}_legacy'
+
+        op.execute(f'ALTER TABLE {table} RENAME TO {legacy}')
+        op.execute(f'UPDATE {legacy} SET created_at = now() WHERE created_at IS NULL')
+
+        # Same columns and defaults, the partition key has to be part of the primary key
+        op.execute(
+            f'CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL')
+
+        oldest = bind.execute(sa.text(f'SELECT min(created_at) FROM {legacy}')).scalar()
+        month = (oldest or this_month).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        last = _add_months(this_month, MONTHS_AHEAD)
+        while month <= last:
+            upper = _add_months(month, 1)
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+            )
+            month = upper
+
+        # Catches rows outside the prepared months until maintenance creates them
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+        op.execute(f'INSERT INTO {table} SELECT * FROM {legacy}')
+        op.execute(f'DROP TABLE {legacy}')
+
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)')
+        _create_indexes_and_keys(table, spec)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for table, spec in PARTITIONED_TABLES.items():
+        partitioned = f'{table}_partitioned'
+
+        op.execute(f'ALTER TABLE {table} RENAME TO {partitioned}')
+        op.execute(f'ALTER TABLE {partitioned} DROP CONSTRAINT {table}_pkey')
+        for name in spec['indexes']:
+            op.execute(f'DROP INDEX {name}')
+        for name, _, _, _ in spec['foreign_keys']:
+            op.execute(f'ALTER TABLE {partitioned} DROP CONSTRAINT {name}')
+
+        op.execute(f'CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS)')
+        op.execute(f'INSERT INTO {table} SELECT * FROM {partitioned}')
+        op.execute(f'DROP TABLE {partitioned}')
+
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)')
+        _create_indexes_and_keys(table, spec)
@@ -0,0 +1,68 @@
+"""Add composite and partial indexes for hot queries
+
+Revision ID: 20251125_composite_indexes
+Revises: 20251124_partition_logs
+Create Date: 2025-11-25 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20251125_composite_indexes'
+down_revision = '20251124_partition_logs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Built concurrently so applications and job_queue stay writable on PostgreSQL
+    with op.get_context().autocommit_block():
+        # ApplicationRateLimiter: applications per user and platform since a cutoff
+        op.create_index(
+            'ix_applications_user_platform_applied', 'applications',
+            ['user_id', 'platform', 'applied_at'],
+            unique=False, postgresql_concurrently=True
+        )
+        # Application list sorted by applied_at, and the daily summary window
+        op.create_index(
+            'ix_applications_user_applied', 'applications',
+            ['user_id', 'applied_at'],
+            unique=False, postgresql_concurrently=True
+        )
+        # Duplicate check before queueing a job
+        op.create_index(
+            'ix_applications_user_job_url', 'applications',
+            ['user_id', 'job_url'],
+            unique=False, postgresql_concurrently=True
+        )
+        # process_job_queue: due pending items by priority, only pending rows are indexed
+        op.create_index(
+            'ix_job_queue_pending_priority', 'job_queue',
+            [sa.text('priority DESC'), 'created_at', 'scheduled_for'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text("status = 'pending'")
+        )
+        # Per-user queue listing and status counts
+        op.create_index(
+            'ix_job_queue_user_status', 'job_queue',
+            ['user_id', 'status'],
+            unique=False, postgresql_concurrently=True
+        )
+
+    # Partitioned on PostgreSQL, which cannot build parent indexes concurrently
+    op.create_index(
+        'ix_automation_logs_user_created', 'automation_logs',
+        ['user_id', 'created_at'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_automation_logs_user_created', table_name='automation_logs')
+    op.drop_index('ix_job_queue_user_status', table_name='job_queue')
+    op.drop_index('ix_job_queue_pending_priority', table_name='job_queue')
+    op.drop_index('ix_applications_user_job_url', table_name='applications')
+    op.drop_index('ix_applications_user_applied', table_name='applications')
+    op.drop_index('ix_applications_user_platform_applied', table_name='applications')
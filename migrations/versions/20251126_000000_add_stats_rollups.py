@@ -0,0 +1,61 @@
+"""Add application and job queue stats rollup tables
+
+Revision ID: 20251126_stats_rollups
+Revises: 20251125_composite_indexes
+Create Date: 2025-11-26 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20251126_stats_rollups'
+down_revision = '20251125_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'application_daily_stats',
+        sa.Column('user_id', sa.String(length=36), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('platform', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'day', 'platform', 'status')
+    )
+
+    op.create_table(
+        'queue_status_counts',
+        sa.Column('user_id', sa.String(length=36), nullable=False),
+        sa.Column('platform', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'platform', 'status')
+    )
+
+    # Backfill from existing rows, scripts/backfill_stats.py repeats this later if needed
+    op.execute("""
+        INSERT INTO application_daily_stats (user_id, day, platform, status, count, updated_at)
+        SELECT user_id, CAST(applied_at AS DATE), platform, COALESCE(status, 'sent'), COUNT(*), CURRENT_TIMESTAMP
+        FROM applications
+        WHERE applied_at IS NOT NULL
+        GROUP BY user_id, CAST(applied_at AS DATE), platform, COALESCE(status, 'sent')
+    """)
+    op.execute("""
+        INSERT INTO queue_status_counts (user_id, platform, status, count, updated_at)
+        SELECT user_id, platform, COALESCE(status, 'pending'), COUNT(*), CURRENT_TIMESTAMP
+        FROM job_queue
+        GROUP BY user_id, platform, COALESCE(status, 'pending')
+    """)
+
+
+def downgrade():
+    op.drop_table('queue_status_counts')
+    op.drop_table('application_daily_stats')
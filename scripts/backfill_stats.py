@@ -0,0 +1,36 @@
+"""
+Stats Rollup Backfill
+
+Rebuilds application_daily_stats and queue_status_counts from the applications
+and job_queue tables. The counters are normally kept current on every write;
+run this after loading data outside the app or if the counters have drifted.
+
+Usage:
+    python scripts/backfill_stats.py [--user USER_ID ...]
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.utils.rollups import rebuild_rollups
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild the application and job queue stats rollups')
+    parser.add_argument('--user', action='append', dest='user_ids', help='only rebuild this user (repeatable)')
+    args = parser.parse_args()
+
+    app = create_app(os.getenv('FLASK_ENV', 'production'))
+
+    with app.app_context():
+        written = rebuild_rollups(args.user_ids)
+
+    for table, rows in written.items():
+        print(f'✅ {table}: {rows} rows')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Response Compression Benchmark
+
+Measures bytes saved and CPU time per response for gzip and brotli at a few
+levels on payloads shaped like the API's largest responses: application and
+log pages, the n8n user export with embedded resumes, and a base64 video.
+Base64 file contents are generated from random bytes, like the already
+compressed PDFs and videos users upload, so their savings are realistic.
+
+No database or running app is needed.
+
+Usage:
+    python scripts/benchmark_compression.py [--repeat 5]
+"""
+import os
+import sys
+import json
+import time
+import base64
+import random
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.compression import brotli, compress, make_compressor, compress_stream
+
+
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Stark Industries', 'Wayne Enterprises']
+TITLES = ['Backend Engineer', 'Senior Python Developer', 'Data Engineer', 'Full Stack Developer']
+STATUSES = ['sent', 'viewed', 'interview', 'rejected']
+
+
+def envelope(data):
+    """Wrap data the way create_response does"""
+    return json.dumps({'success': True, 'data': data, 'meta': {'timestamp': datetime.utcnow().isoformat()}},
+                      sort_keys=True).encode()
+
+
+def applications_page(rows=100):
+    """A GET /api/applications page"""
+    now = datetime.utcnow()
+    return envelope({'applications': [
+        {
+            'id': f'{i:08d}-0000-4000-8000-000000000000',
+            'user_id': '11111111-2222-4333-8444-555555555555',
+            'company_name': random.choice(COMPANIES),
+            'job_title': random.choice(TITLES),
+            'job_type': 'Full-time',
+            'location': 'Remote',
+            'salary_range': '$120k - $150k',
+            'status': random.choice(STATUSES),
+            'platform': random.choice(['linkedin', 'indeed']),
+            'job_url': f'https://www.linkedin.com/jobs/view/{3800000000 + i}',
+            'applied_at': (now - timedelta(minutes=i * 7)).isoformat(),
+            'last_status_update': None,
+            'resume_used_id': None,
+            'cover_letter': None,
+            'notes': None,
+        }
+        for i in range(rows)
+    ], 'pagination': {'page': 1, 'limit': rows, 'total': 1000, 'pages': 10}})
+
+
+def logs_page(rows=100):
+    """A GET /api/automation/logs page"""
+    now = datetime.utcnow()
+    return envelope({'logs': [
+        {
+            'id': f'{i:08d}-0000-4000-8000-000000000000',
+            'user_id': '11111111-2222-4333-8444-555555555555',
+            'job_queue_id': None,
+            'action_type': random.choice(['job_apply', 'platform_start', 'cookies_loaded']),
+            'status': random.choice(['success', 'info', 'failed']),
+            'message': f'✅ Applied to {random.choice(TITLES)} at {random.choice(COMPANIES)}',
+            'details': {'job_url': f'https://www.indeed.com/viewjob?jk={i:016x}', 'attempt': 1},
+            'created_at': (now - timedelta(seconds=i * 45)).isoformat(),
+        }
+        for i in range(rows)
+    ]})
+
+
+def random_base64(size):
+    """Base64 of incompressible bytes, like an uploaded PDF or video"""
+    return base64.b64encode(os.urandom(size)).decode()
+
+
+def n8n_export_records(users=20, resume_kb=150):
+    """NDJSON lines of /api/n8n/all-users/export with embedded resumes"""
+    return [
+        json.dumps({
+            'user_id': f'{i:08d}-0000-4000-8000-000000000000',
+            'email': f'user{i}@example.com',
+            'full_name': f'User {i}',
+            'skills': ['Python', 'Flask', 'PostgreSQL', 'Docker'],
+            'professional_bio': 'Backend engineer focused on APIs and data pipelines. ' * 4,
+            'resume': {'filename': 'resume.pdf', 'file_type': 'pdf', 'file_base64': random_base64(resume_kb * 1024)},
+        }).encode() + b'\n'
+        for i in range(users)
+    ]
+
+
+def payloads():
+    """Representative response bodies by name (lists are streamed chunks)"""
+    export = n8n_export_records()
+    return {
+        'applications page (100)': applications_page(),
+        'automation logs page (100)': logs_page(),
+        'n8n all-users (20 resumes)': envelope({'users': [json.loads(line) for line in export]}),
+        'video base64 (2 MB)': envelope({'video': {'id': 'v1', 'video_base64': random_base64(2 * 1024 * 1024)}}),
+        'n8n export stream (NDJSON)': export,
+    }
+
+
+def codecs():
+    """(encoding, gzip level, brotli quality) combinations to measure"""
+    options = [('gzip', 1, None), ('gzip', 6, None), ('gzip', 9, None)]
+    if brotli is not None:
+        options += [('br', None, 1), ('br', None, 4), ('br', None, 6)]
+    return options
+
+
+def run(payload, encoding, level, quality):
+    """Compress a payload once and return the compressed size"""
+    if isinstance(payload, list):
+        compress_chunk, flush = make_compressor(encoding, level or 6, quality or 4)
+        return sum(len(chunk) for chunk in compress_stream(iter(payload), compress_chunk, flush))
+    return len(compress(payload, encoding, level or 6, quality or 4))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bytes saved and CPU cost of response compression')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per payload and codec')
+    args = parser.parse_args()
+
+    random.seed(0)
+    if brotli is None:
+        print('brotli is not installed, only gzip is measured')
+
+    for name, payload in payloads().items():
+        size = sum(len(chunk) for chunk in payload) if isinstance(payload, list) else len(payload)
+        print(f'\n{name}: {size / 1024:,.1f} KB')
+
+        for encoding, level, quality in codecs():
+            started = time.process_time()
+            for _ in range(args.repeat):
+                compressed = run(payload, encoding, level, quality)
+            cpu = (time.process_time() - started) / args.repeat
+
+            label = f'{encoding} {level if level is not None else quality}'
+            print(f'  {label:<8} {compressed / 1024:>10,.1f} KB  saved {100 * (1 - compressed / size):>5.1f}%  '
+                  f'{cpu * 1000:>8.2f} ms CPU  {size / 1024 / 1024 / cpu if cpu else 0:>7.1f} MB/s')
+
+
+if __name__ == '__main__':
+    main()
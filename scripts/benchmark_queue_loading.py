@@ -0,0 +1,165 @@
+"""
+Job Queue Loading Benchmark
+
+Compares reading job_queue rows with the job listing joined in (the old
+lazy='joined' relationship) against the current default (lazy='raise'), which
+leaves the listing unloaded, and against selectin loading for callers that need it.
+
+The queue, listings and users are seeded inside a single transaction that is
+rolled back at the end, so the script can run against any database.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_queue_loading.py [--items 100000]
+"""
+import os
+import sys
+import time
+import uuid
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import joinedload, selectinload
+from app import create_app, db
+from app.models.user import User
+from app.models.job_queue import JobQueue
+from app.models.job_listing import JobListing
+
+
+PLATFORMS = ['linkedin', 'indeed']
+QUEUE_STATUSES = ['pending', 'processing', 'applied', 'failed', 'skipped']
+BATCH_SIZE = 5000
+
+
+def seed(items, listings, description_kb):
+    """Insert users, listings with long descriptions and queue items pointing at them"""
+    now = datetime.utcnow()
+    user_ids = [str(uuid.uuid4()) for _ in range(max(1, items // 1000))]
+    listing_ids = [str(uuid.uuid4()) for _ in range(listings)]
+    description = 'Lorem ipsum dolor sit amet. ' * (description_kb * 1024 // 28)
+
+    db.session.execute(insert(User), [
+        {'id': user_id, 'email': f'bench-{user_id}@example.com', 'password_hash': 'x', 'full_name': 'Benchmark'}
+        for user_id in user_ids
+    ])
+
+    for start in range(0, listings, BATCH_SIZE):
+        db.session.execute(insert(JobListing), [
+            {
+                'id': listing_ids[i],
+                'platform': PLATFORMS[i % len(PLATFORMS)],
+                'external_id': f'bench-{i}',
+                'company_name': 'Company',
+                'job_title': 'Engineer',
+                'description': description,
+                'requirements': description,
+                'job_url': f'https://example.com/jobs/{i}',
+            }
+            for i in range(start, min(start + BATCH_SIZE, listings))
+        ])
+
+    for start in range(0, items, BATCH_SIZE):
+        db.session.execute(insert(JobQueue), [
+            {
+                'id': str(uuid.uuid4()),
+                'user_id': user_ids[i % len(user_ids)],
+                'platform': PLATFORMS[i % len(PLATFORMS)],
+                'job_listing_id': listing_ids[i % listings],
+                'company_name': 'Company',
+                'job_title': 'Engineer',
+                'job_url': f'https://example.com/jobs/{i % listings}',
+                'status': QUEUE_STATUSES[i % len(QUEUE_STATUSES)],
+                'priority': i % 10,
+                'scheduled_for': now - timedelta(minutes=i),
+                'created_at': now - timedelta(minutes=i),
+            }
+            for i in range(start, min(start + BATCH_SIZE, items))
+        ])
+
+    if db.engine.dialect.name == 'postgresql':
+        for table in ('users', 'job_listings', 'job_queue'):
+            db.session.execute(text(f'ANALYZE {table}'))
+
+    return user_ids
+
+
+def measure(run, repeat):
+    """Run a query function repeatedly and return (rows per second, seconds per run)"""
+    rows = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        rows += run()
+        db.session.expunge_all()
+    elapsed = time.perf_counter() - started
+    return rows / elapsed if elapsed else 0, elapsed / repeat
+
+
+def full_scan(query):
+    """Read every queue item of a query, the way exports and cleanups page through it"""
+    return lambda: sum(1 for _ in query.order_by(JobQueue.created_at).yield_per(1000))
+
+
+def limited(query):
+    """Read one page of a query"""
+    return lambda: len(query.all())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure job queue read throughput per listing loader strategy')
+    parser.add_argument('--items', type=int, default=100000, help='queue items to seed (rolled back)')
+    parser.add_argument('--listings', type=int, default=10000, help='distinct job listings the items point at')
+    parser.add_argument('--description-kb', type=int, default=4, help='size of each listing description/requirements')
+    parser.add_argument('--repeat', type=int, default=20, help='runs of each page query')
+    args = parser.parse_args()
+
+    app = create_app(os.getenv('FLASK_ENV', 'production'))
+
+    with app.app_context():
+        try:
+            print(f'Seeding {args.items} queue items and {args.listings} listings...')
+            user_ids = seed(args.items, args.listings, args.description_kb)
+            db.session.flush()
+
+            now = datetime.utcnow()
+            due = JobQueue.query.filter(
+                JobQueue.status == 'pending', JobQueue.scheduled_for <= now
+            ).order_by(JobQueue.priority.desc(), JobQueue.created_at.asc()).limit(50)
+            page = JobQueue.query.filter_by(user_id=user_ids[0], status='pending').order_by(
+                JobQueue.priority.desc(), JobQueue.created_at.asc(), JobQueue.id.asc()
+            ).limit(20)
+
+            cases = [
+                ('process_job_queue scan (50 rows)', args.repeat, [
+                    ('joined (before)', limited(due.options(joinedload(JobQueue.job_listing)))),
+                    ('not loaded (after)', limited(due)),
+                    ('id/user/platform only (after)', limited(due.with_entities(
+                        JobQueue.id, JobQueue.user_id, JobQueue.platform
+                    ))),
+                ]),
+                ('get_job_queue page (20 rows)', args.repeat, [
+                    ('joined (before)', limited(page.options(joinedload(JobQueue.job_listing)))),
+                    ('not loaded (after)', limited(page)),
+                    ('selectin (?include_listing=true)', limited(page.options(selectinload(JobQueue.job_listing)))),
+                ]),
+                (f'full scan ({args.items} rows)', 1, [
+                    ('joined (before)', full_scan(JobQueue.query.options(joinedload(JobQueue.job_listing)))),
+                    ('not loaded (after)', full_scan(JobQueue.query)),
+                ]),
+            ]
+
+            for title, repeat, strategies in cases:
+                print(f'\n{title}')
+                baseline = None
+                for name, run in strategies:
+                    rows_per_second, seconds = measure(run, repeat)
+                    baseline = baseline or rows_per_second
+                    print(f'  {name:<34} {rows_per_second:>12,.0f} rows/s  '
+                          f'{seconds * 1000:>9.1f} ms/run  {rows_per_second / baseline:>5.1f}x')
+        finally:
+            db.session.rollback()
+
+
+if __name__ == '__main__':
+    main()
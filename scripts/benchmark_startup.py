@@ -0,0 +1,111 @@
+"""
+Startup Time Benchmark
+
+Measures how long a web process (create_app()) and a Celery worker process
+(import celery_worker plus the task modules it loads before consuming, via
+loader.import_default_modules()) take to import, using `python -X importtime` in fresh
+interpreters, and fails when either exceeds its budget or imports a module
+that should only load on first use (scikit-learn, Selenium, BeautifulSoup...).
+Run it in CI or before a deploy to catch an accidental top-level import.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5] [--top 15]
+        [--web-budget-ms 1500] [--worker-budget-ms 2000]
+
+Exits with status 1 on a regression.
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'web': 'from app import create_app; create_app()',
+    'worker': 'import celery_worker; celery_worker.celery.loader.import_default_modules()',
+}
+
+# Must not be imported at boot; they load inside the tasks that use them
+LAZY_MODULES = ['sklearn', 'numpy', 'scipy', 'selenium', 'undetected_chromedriver', 'bs4', 'lxml']
+
+
+def measure(code):
+    """
+    Import code in a fresh interpreter
+
+    Returns:
+        tuple: (total import ms, {module: cumulative ms}) for that run
+    """
+    env = dict(os.environ)
+    env.setdefault('DATABASE_URL', 'sqlite://')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'{code!r} failed:\n{result.stderr[-2000:]}')
+
+    modules = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        name = name[1:]  # nesting is shown as two spaces per level after one separator space
+        # Top-level imports add up to the whole import time
+        if not name.startswith(' '):
+            total_us += int(cumulative_us)
+        modules[name.strip()] = int(cumulative_us) / 1000
+    return total_us / 1000, modules
+
+
+def report(name, code, runs, top, budget_ms):
+    """Print one target's timings and return the problems found"""
+    totals = []
+    modules = {}
+    for _ in range(runs):
+        total, modules = measure(code)
+        totals.append(total)
+    median = statistics.median(totals)
+
+    print(f'\n{name}: {median:,.0f} ms median import time over {runs} run(s) '
+          f'(min {min(totals):,.0f}, max {max(totals):,.0f}, budget {budget_ms:,} ms)')
+    print('  slowest modules (cumulative ms, last run):')
+    for module, ms in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f'    {ms:>8,.1f}  {module}')
+
+    problems = []
+    if median > budget_ms:
+        problems.append(f'{name} imports in {median:,.0f} ms, over its {budget_ms:,} ms budget')
+    eager = [module for module in LAZY_MODULES if module in modules]
+    if eager:
+        problems.append(f'{name} imports {", ".join(eager)} at startup')
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time budget for web and worker processes')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters per target')
+    parser.add_argument('--top', type=int, default=15, help='slowest modules to list')
+    parser.add_argument('--web-budget-ms', type=int, default=1500)
+    parser.add_argument('--worker-budget-ms', type=int, default=2000)
+    args = parser.parse_args()
+
+    budgets = {'web': args.web_budget_ms, 'worker': args.worker_budget_ms}
+    problems = []
+    for name, code in TARGETS.items():
+        problems += report(name, code, args.runs, args.top, budgets[name])
+
+    if problems:
+        print('\nFAILED:')
+        for problem in problems:
+            print(f'  - {problem}')
+        sys.exit(1)
+
+    print('\nOK: within budget, no heavy modules imported at startup')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Credentials Encryption Key Rotation
+
+Re-encrypts every stored platform credential (username, password and cookies)
+with CREDENTIALS_ENCRYPTION_KEY. Run it after moving the previous key to
+CREDENTIALS_ENCRYPTION_OLD_KEYS; once it reports no failures, the old key can
+be removed from CREDENTIALS_ENCRYPTION_OLD_KEYS.
+
+Credentials are processed in batches of --batch-size, each committed on its
+own, so the script can be stopped and re-run safely (rotating a value that is
+already under the primary key just re-encrypts it).
+
+Usage:
+    python scripts/rotate_credentials_key.py [--batch-size 500]
+
+Exits with status 1 if any credential could not be decrypted.
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptography.fernet import InvalidToken
+from app import create_app, db
+from app.models.platform_credential import PlatformCredential
+
+
+def rotate_all(batch_size):
+    """
+    Rotate every credential to the primary key, one committed batch at a time
+
+    Returns:
+        tuple: (rotated count, ids of credentials that could not be decrypted)
+    """
+    rotated = 0
+    failed = []
+    last_id = None
+
+    while True:
+        query = PlatformCredential.query.order_by(PlatformCredential.id)
+        if last_id is not None:
+            query = query.filter(PlatformCredential.id > last_id)
+        credentials = query.limit(batch_size).all()
+        if not credentials:
+            return rotated, failed
+
+        for credential in credentials:
+            try:
+                credential.rotate_encryption()
+                rotated += 1
+            except InvalidToken:
+                failed.append(credential.id)
+
+        last_id = credentials[-1].id
+        db.session.commit()
+        # Drop the committed batch from the identity map before the next one
+        db.session.expunge_all()
+        print(f'  {rotated} rotated, {len(failed)} failed so far')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-encrypt stored credentials with CREDENTIALS_ENCRYPTION_KEY')
+    parser.add_argument('--batch-size', type=int, default=500, help='credentials per committed batch')
+    args = parser.parse_args()
+
+    if not os.getenv('CREDENTIALS_ENCRYPTION_KEY'):
+        print('❌ CREDENTIALS_ENCRYPTION_KEY must be set to the new key')
+        sys.exit(2)
+
+    app = create_app(os.getenv('FLASK_ENV', 'production'))
+
+    with app.app_context():
+        rotated, failed = rotate_all(args.batch_size)
+
+    print(f'✅ {rotated} credentials re-encrypted with the primary key')
+    if failed:
+        print(f'❌ {len(failed)} credentials could not be decrypted with any configured key '
+              f'(keep the old keys until they are fixed): {", ".join(failed)}')
+        sys.exit(1)
+
+    print('The keys in CREDENTIALS_ENCRYPTION_OLD_KEYS can now be removed')
+
+
+if __name__ == '__main__':
+    main()
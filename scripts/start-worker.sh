@@ -30,19 +30,56 @@ else:
     exit(1)
 END
 
+# Worker profile: which queues to consume and how (see app/celery_config.py)
+#   all          - every queue in one worker (default, single-instance deployments)
+#   browser      - Selenium bot tasks, prefork, one Chrome per process
+#   io           - scrape + notify queues, network-bound work. Prefork rather than
+#                  threads: Celery only enforces the per-queue time limits in
+#                  app/celery_config.py on prefork, so a hung scrape gets killed
+#   maintenance  - queue processing dispatch, cleanup and status checks
+case "${CELERY_WORKER_PROFILE:-all}" in
+    browser)
+        QUEUES=browser
+        POOL=prefork
+        CONCURRENCY=${CELERY_CONCURRENCY:-1}
+        ;;
+    io)
+        QUEUES=scrape,notify
+        POOL=prefork
+        CONCURRENCY=${CELERY_CONCURRENCY:-4}
+        ;;
+    maintenance)
+        QUEUES=maintenance
+        POOL=prefork
+        CONCURRENCY=${CELERY_CONCURRENCY:-1}
+        ;;
+    *)
+        QUEUES=browser,scrape,notify,maintenance
+        POOL=prefork
+        CONCURRENCY=${CELERY_CONCURRENCY:-2}
+        ;;
+esac
+QUEUES=${CELERY_QUEUES:-$QUEUES}
+POOL=${CELERY_POOL:-$POOL}
+
 # Start Celery worker
 echo "================================================================================"
 echo "STARTING CELERY WORKER - Background Process Starting"
 echo "================================================================================"
 echo "Worker Configuration:"
-echo "  - Concurrency: ${CELERY_CONCURRENCY:-2}"
+echo "  - Profile: ${CELERY_WORKER_PROFILE:-all}"
+echo "  - Queues: ${QUEUES}"
+echo "  - Pool: ${POOL}"
+echo "  - Concurrency: ${CONCURRENCY}"
 echo "  - Max tasks per child: 1000"
-echo "  - Time limit: 3600s"
-echo "  - Soft time limit: 3000s"
+echo "  - Default time limit: 3600s (per-queue limits in app/celery_config.py)"
+echo "  - Default soft time limit: 3000s"
 echo "================================================================================"
 exec celery -A celery_worker.celery worker \
     --loglevel=info \
-    --concurrency=${CELERY_CONCURRENCY:-2} \
+    --queues=${QUEUES} \
+    --pool=${POOL} \
+    --concurrency=${CONCURRENCY} \
     --max-tasks-per-child=1000 \
     --time-limit=3600 \
     --soft-time-limit=3000
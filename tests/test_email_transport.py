@@ -0,0 +1,164 @@
+"""
+SMTPTransport against a local aiosmtpd server
+
+Run with: python -m pytest tests
+"""
+import ssl
+import time
+import socket
+import datetime
+import threading
+
+import pytest
+
+pytest.importorskip('aiosmtpd')
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP, AuthResult
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.utils.email_service import EmailService, SMTPTransport
+
+
+def make_tls_context(tmp_path):
+    """Self-signed certificate for the server's STARTTLS"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.utcnow()
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+
+    cert_file, key_file = tmp_path / 'cert.pem', tmp_path / 'key.pem'
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL, serialization.NoEncryption()
+    ))
+
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(str(cert_file), str(key_file))
+    return context
+
+
+class RecordingHandler:
+    """Keeps every accepted message"""
+
+    def __init__(self):
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return '250 OK'
+
+
+class CountingController(Controller):
+    """Controller that records each SMTP session so tests can count and drop them"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sessions = []
+        self.lock = threading.Lock()
+
+    def factory(self):
+        protocol = SMTP(self.handler, **self.SMTP_kwargs)
+        with self.lock:
+            self.sessions.append(protocol)
+        return protocol
+
+    def drop_sessions(self):
+        """Close every open connection from the server side"""
+        with self.lock:
+            sessions = list(self.sessions)
+        for protocol in sessions:
+            if protocol.transport is not None:
+                self.loop.call_soon_threadsafe(protocol.transport.close)
+        time.sleep(0.2)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server(tmp_path):
+    handler = RecordingHandler()
+    controller = CountingController(
+        handler,
+        hostname='127.0.0.1',
+        port=free_port(),
+        tls_context=make_tls_context(tmp_path),
+        authenticator=lambda server, session, envelope, mechanism, auth_data: AuthResult(success=True),
+    )
+    controller.start()
+    # start() opens a probe connection to check the server is up
+    controller.sessions.clear()
+    try:
+        yield controller, handler
+    finally:
+        controller.stop()
+
+
+@pytest.fixture
+def email_service(smtp_server, monkeypatch):
+    controller, _ = smtp_server
+    monkeypatch.setenv('SMTP_HOST', '127.0.0.1')
+    monkeypatch.setenv('SMTP_PORT', str(controller.port))
+    monkeypatch.setenv('SMTP_USER', 'user')
+    monkeypatch.setenv('SMTP_PASS', 'pass')
+    service = EmailService()
+    yield service
+    service.transport.close()
+
+
+def bulk(count, start=0):
+    return [
+        {'to': f'user{i}@example.com', 'subject': f'Summary {i}', 'html_content': f'<p>{i}</p>'}
+        for i in range(start, start + count)
+    ]
+
+
+def test_send_bulk_reuses_one_connection(smtp_server, email_service):
+    controller, handler = smtp_server
+
+    result = email_service.send_bulk(bulk(10))
+
+    assert result == {'sent': 10, 'failed': []}
+    assert len(handler.messages) == 10
+    assert len(controller.sessions) == 1
+
+
+def test_reconnects_after_server_drops_session(smtp_server, email_service):
+    controller, handler = smtp_server
+
+    assert email_service.send_bulk(bulk(3))['sent'] == 3
+    controller.drop_sessions()
+    result = email_service.send_bulk(bulk(3, start=3))
+
+    assert result == {'sent': 3, 'failed': []}
+    assert len(handler.messages) == 6
+    assert len(controller.sessions) == 2
+
+
+def test_reconnects_after_max_messages_per_connection(smtp_server, email_service):
+    controller, handler = smtp_server
+    transport = email_service.transport
+    email_service.transport = SMTPTransport(
+        transport.host, transport.port, transport.user, transport.password, max_messages_per_connection=4
+    )
+
+    result = email_service.send_bulk(bulk(10))
+
+    assert result == {'sent': 10, 'failed': []}
+    assert len(handler.messages) == 10
+    assert len(controller.sessions) == 3
@@ -0,0 +1,212 @@
+"""
+Query plans of the hot queries against PostgreSQL
+
+Each hot query must be planned on the index that was built for it: a
+sequential scan, or an older single-column index plus a sort, fails the test.
+The tables are seeded first (QUERY_PLAN_SEED_ROWS rows per table, 20000 by
+default) so the planner's choice is meaningful: on a near-empty table any plan
+is cheap. The seed rows live in a transaction that is rolled back, so the tests
+are safe to point at a shared database.
+
+Skipped unless DATABASE_URL points at a PostgreSQL database migrated to head:
+
+    DATABASE_URL=postgresql://... python -m pytest tests/test_query_plans.py
+"""
+import os
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+if not os.getenv('DATABASE_URL', '').startswith(('postgres://', 'postgresql')):
+    pytest.skip('DATABASE_URL does not point at PostgreSQL', allow_module_level=True)
+
+from sqlalchemy import insert, text
+from app import create_app, db
+from app.models.user import User
+from app.models.application import Application
+from app.models.job_queue import JobQueue
+from app.models.automation_log import AutomationLog
+from app.utils.pagination import order_by_keys
+
+
+PLATFORMS = ['linkedin', 'indeed']
+QUEUE_STATUSES = ['pending', 'processing', 'applied', 'failed', 'skipped']
+
+SEED_ROWS = int(os.getenv('QUERY_PLAN_SEED_ROWS', 20000))
+
+JOB_URL = 'https://example.com/jobs/1'
+
+# description -> (index the query must use, query builder taking user_id and now)
+HOT_QUERIES = {
+    # ApplicationRateLimiter.get_recent_applications
+    'rate limiter: recent applications': ('ix_applications_user_platform_applied', lambda user_id, now: (
+        Application.query.filter(
+            Application.user_id == user_id,
+            Application.platform == 'linkedin',
+            Application.applied_at >= now - timedelta(hours=1)
+        ).with_entities(db.func.count(Application.id))
+    )),
+
+    # ApplicationRateLimiter.get_last_application_time
+    'rate limiter: last application': ('ix_applications_user_platform_applied', lambda user_id, now: (
+        Application.query.filter(
+            Application.user_id == user_id,
+            Application.platform == 'linkedin'
+        ).order_by(Application.applied_at.desc()).limit(1)
+    )),
+
+    # Duplicate check in scrape_jobs_for_user
+    'duplicate application check': ('ix_applications_user_job_url', lambda user_id, now: (
+        db.session.query(db.exists().where(db.and_(
+            Application.user_id == user_id,
+            Application.job_url == JOB_URL
+        )))
+    )),
+
+    # get_applications
+    'applications list': ('ix_applications_user_applied', lambda user_id, now: (
+        Application.query.filter(
+            Application.user_id == user_id
+        ).order_by(*order_by_keys([(Application.applied_at, True), (Application.id, True)])).limit(20)
+    )),
+
+    # process_job_queue
+    'queue: due pending jobs': ('ix_job_queue_pending_priority', lambda user_id, now: (
+        JobQueue.query.filter(
+            JobQueue.status == 'pending',
+            JobQueue.scheduled_for <= now
+        ).order_by(JobQueue.priority.desc(), JobQueue.created_at.asc()).limit(50)
+    )),
+
+    # get_job_queue and get_automation_status
+    'queue: user items by status': ('ix_job_queue_user_status', lambda user_id, now: (
+        JobQueue.query.filter(
+            JobQueue.user_id == user_id,
+            JobQueue.status == 'pending'
+        ).order_by(*order_by_keys([
+            (JobQueue.priority, True), (JobQueue.created_at, False), (JobQueue.id, False)
+        ])).limit(20)
+    )),
+
+    # get_automation_logs
+    'automation logs list': ('ix_automation_logs_user_created', lambda user_id, now: (
+        AutomationLog.query.filter(
+            AutomationLog.user_id == user_id
+        ).order_by(*order_by_keys([(AutomationLog.created_at, True), (AutomationLog.id, True)])).limit(20)
+    )),
+}
+
+
+def seed(rows):
+    """Insert synthetic users, applications, queue items and logs"""
+    now = datetime.utcnow()
+    user_ids = [str(uuid.uuid4()) for _ in range(max(1, rows // 100))]
+
+    db.session.execute(insert(User), [
+        {'id': user_id, 'email': f'plan-check-{user_id}@example.com', 'password_hash': 'x', 'full_name': 'Plan Check'}
+        for user_id in user_ids
+    ])
+    db.session.execute(insert(Application), [
+        {
+            'id': str(uuid.uuid4()),
+            'user_id': user_ids[i % len(user_ids)],
+            'company_name': 'Company',
+            'job_title': 'Engineer',
+            'platform': PLATFORMS[i % len(PLATFORMS)],
+            'job_url': f'https://example.com/jobs/{i}',
+            # Every user has applications inside the rate limiter's one-hour window
+            'applied_at': now - timedelta(seconds=(i * 7) % 3600, days=i // 10000),
+        }
+        for i in range(rows)
+    ])
+    db.session.execute(insert(JobQueue), [
+        {
+            'id': str(uuid.uuid4()),
+            'user_id': user_ids[i % len(user_ids)],
+            'platform': PLATFORMS[i % len(PLATFORMS)],
+            'company_name': 'Company',
+            'job_title': 'Engineer',
+            'job_url': f'https://example.com/jobs/q{i}',
+            'status': QUEUE_STATUSES[i % len(QUEUE_STATUSES)],
+            'priority': i % 10,
+            'scheduled_for': now - timedelta(minutes=i),
+            'created_at': now - timedelta(minutes=i),
+        }
+        for i in range(rows)
+    ])
+    db.session.execute(insert(AutomationLog), [
+        {
+            'id': str(uuid.uuid4()),
+            'user_id': user_ids[i % len(user_ids)],
+            'action_type': 'job_apply',
+            'status': 'success',
+            'message': 'Seeded',
+            'created_at': now - timedelta(minutes=i),
+        }
+        for i in range(rows)
+    ])
+
+    for table in ('users', 'applications', 'job_queue', 'automation_logs'):
+        db.session.execute(text(f'ANALYZE {table}'))
+
+    return user_ids[0]
+
+
+def find_scans(plan):
+    """Return (node type, relation, index name) of every scan node in a plan tree"""
+    scans = []
+    if plan.get('Node Type', '').endswith('Scan'):
+        scans.append((plan['Node Type'], plan.get('Relation Name'), plan.get('Index Name')))
+    for child in plan.get('Plans', []):
+        scans.extend(find_scans(child))
+    return scans
+
+
+def index_family(name):
+    """An index plus the per-partition indexes attached to it (for partitioned tables)"""
+    rows = db.session.execute(text('''
+        WITH RECURSIVE family(oid) AS (
+            SELECT oid FROM pg_class WHERE relname = :name AND relkind IN ('i', 'I')
+            UNION
+            SELECT inherits.inhrelid FROM pg_inherits inherits JOIN family ON inherits.inhparent = family.oid
+        )
+        SELECT pg_class.relname FROM family JOIN pg_class ON pg_class.oid = family.oid
+    '''), {'name': name}).scalars().all()
+    return set(rows)
+
+
+def explain(query):
+    """EXPLAIN a query and return the top plan node"""
+    statement = query.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True})
+    plan = db.session.execute(text(f'EXPLAIN (FORMAT JSON) {statement}')).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]['Plan']
+
+
+@pytest.fixture(scope='module')
+def seeded_user():
+    """Seed the tables once for the module and roll everything back afterwards"""
+    app = create_app(os.getenv('FLASK_ENV', 'production'))
+    with app.app_context():
+        try:
+            yield seed(SEED_ROWS)
+        finally:
+            db.session.rollback()
+
+
+@pytest.mark.parametrize('name', list(HOT_QUERIES))
+def test_hot_query_uses_its_index(seeded_user, name):
+    index, build = HOT_QUERIES[name]
+
+    family = index_family(index)
+    assert family, f'index {index} does not exist (run flask db upgrade)'
+
+    plan = explain(build(seeded_user, datetime.utcnow()))
+    scans = find_scans(plan)
+    used = sorted({scan[2] or f'{scan[0]} on {scan[1]}' for scan in scans})
+    assert any(scan[2] in family for scan in scans), (
+        f'{name}: expected {index}, plan uses {", ".join(used)}\n{json.dumps(plan, indent=2)}'
+    )